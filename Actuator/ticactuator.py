@@ -1,15 +1,821 @@
 """Provides wrapper for existing pytic package, but with useful helper
 functions to allow operations in coherent units"""
 
-from time import sleep
+from time import sleep, time
 import math
-from pytic import PyTic
+import itertools
+import queue
+import threading
+from concurrent.futures import Future
+import os
+from types import SimpleNamespace
+from typing import Callable, NamedTuple
+
+
+class SimulatedTicVariables:
+    """Stands in for pytic's variables object. Every public attribute read brings the
+    simulation up to date first, like pytic re-reading the Tic over USB."""
+
+    def __init__(self, tic: "SimulatedTic"):
+        """Create variables for a simulated Tic
+
+        Args:
+            tic (SimulatedTic): the simulated Tic to read from
+        """
+        self._tic = tic
+        self._tic_variables = SimpleNamespace()
+        self._update_tic_variables()
+
+    def _update_tic_variables(self):
+        """Brings the simulation up to date and copies out every variable at once"""
+        self._tic_variables = SimpleNamespace(**self._tic.read_variables())
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        self._update_tic_variables()
+        try:
+            return getattr(self._tic_variables, name)
+        except AttributeError:
+            raise AttributeError(f"Simulated Tic has no variable {name!r}") from None
+
+
+class SimulatedTic:
+    """Drop-in stand-in for pytic's PyTic, for running without hardware. Simulates the
+    motion the Tic would make: speeds up with max_accel and slows with max_decel toward
+    a target velocity or position, never faster than max_speed, only once energized and
+    out of safe start. If nothing resets the command timeout for a second, it flags a
+    command timeout error and decelerates to a stop, like the real thing.
+
+    Simulated time can run faster than real time, so a whole test protocol can run in
+    a fraction of its real length. Set the TIC_SIMULATOR environment variable to the
+    speedup to make TicActuator use one.
+    """
+
+    COMMAND_TIMEOUT = 1
+    """Real seconds without a command before the simulated Tic stops the motor"""
+    TIME_STEP = 1e-3
+    """Seconds per integration step"""
+    VIN_VOLTAGE = 12000
+    """Simulated supply voltage in mV"""
+    ERROR_DEENERGIZED = 1 << 0
+    """error_status bit set while intentionally de-energized"""
+    ERROR_COMMAND_TIMEOUT = 1 << 6
+    """error_status bit set after the command timeout runs out"""
+    ERROR_SAFE_START = 1 << 7
+    """error_status bit set while in safe start"""
+    COMMANDS = (
+        "list_connected_device_serial_numbers",
+        "connect_to_serial_number",
+        "set_target_velocity",
+        "set_target_position",
+        "halt_and_hold",
+        "halt_and_set_position",
+        "reset_command_timeout",
+        "set_max_speed",
+        "set_max_accel",
+        "set_max_decel",
+        "set_step_mode",
+        "set_current_limit",
+        "energize",
+        "deenergize",
+        "exit_safe_start",
+        "enter_safe_start",
+    )
+    """pytic commands the simulated Tic implements"""
+
+    def __init__(self, time_scale: float = 1, clock: Callable[[], float] = None):
+        """Create a simulated Tic, de-energized at position zero
+
+        Args:
+            time_scale (float, optional): how many simulated seconds pass per real second.
+            Defaults to 1.
+            clock (Callable[[], float], optional): gives the simulated time in seconds
+            instead, ex: for stepping the simulation by hand. Defaults to None.
+        """
+        wall_start = time()
+        self.clock = (
+            clock if clock is not None else (lambda: (time() - wall_start) * time_scale)
+        )
+        """Gives the simulated time in seconds"""
+        self.command_timeout = SimulatedTic.COMMAND_TIMEOUT * time_scale
+        """Simulated seconds without a command before stopping the motor. Scaled with
+        time, since the host still sends its heartbeats on the real clock"""
+        self.lock = threading.Lock()
+        """Guards the simulated state"""
+        self.sim_time = self.clock()
+        """Simulated time the state is for, in seconds"""
+        self.position = 0.0
+        """Position in microsteps"""
+        self.velocity = 0.0
+        """Velocity in microsteps/s"""
+        self.planning_mode = 0
+        """0 for no target, 1 for target position, 2 for target velocity"""
+        self.target_position = 0
+        """Target position in microsteps"""
+        self.target_velocity = 0
+        """Target velocity in microsteps/10,000s"""
+        self.max_speed = 2000000
+        """Max speed in microsteps/10,000s"""
+        self.max_accel = 40000
+        """Max acceleration in microsteps/100s/s"""
+        self.max_decel = 40000
+        """Max deceleration in microsteps/100s/s"""
+        self.step_mode = 0
+        """Microstepping mode"""
+        self.current_limit = 0
+        """Current limit in mA. Has no effect on the simulation"""
+        self.energized = False
+        """Whether the motor is energized"""
+        self.safe_start = True
+        """Whether the Tic is waiting for exit_safe_start() before moving"""
+        self.timed_out = False
+        """Whether the command timeout ran out since the last command"""
+        self.last_command_time = self.sim_time
+        """Simulated time of the last command that resets the command timeout"""
+        self.variables = SimulatedTicVariables(self)
+        """Current variables, read like pytic's"""
+
+    def list_connected_device_serial_numbers(self) -> list[str]:
+        """Lists the one simulated Tic
+
+        Returns:
+            list[str]: its serial number
+        """
+        return ["SIMULATED"]
+
+    def connect_to_serial_number(self, serial_number: str):
+        """Connects to the simulated Tic, which is always there"""
+        pass
+
+    def read_variables(self) -> dict:
+        """Brings the simulation up to date and gets every variable
+
+        Returns:
+            dict: variables by pytic name
+        """
+        with self.lock:
+            self.advance()
+            error_status = 0
+            if not self.energized:
+                error_status |= SimulatedTic.ERROR_DEENERGIZED
+            if self.timed_out:
+                error_status |= SimulatedTic.ERROR_COMMAND_TIMEOUT
+            if self.safe_start:
+                error_status |= SimulatedTic.ERROR_SAFE_START
+            return {
+                "current_position": int(round(self.position)),
+                "current_velocity": int(self.velocity * 10000),
+                "target_position": self.target_position,
+                "target_velocity": self.target_velocity,
+                "planning_mode": self.planning_mode,
+                "max_speed": self.max_speed,
+                "max_accel": self.max_accel,
+                "max_decel": self.max_decel,
+                "step_mode": self.step_mode,
+                "current_limit": self.current_limit,
+                "vin_voltage": SimulatedTic.VIN_VOLTAGE,
+                "error_status": error_status,
+                "energized": self.energized,
+            }
+
+    def can_move(self) -> bool:
+        """Whether the motor is allowed to move toward its target"""
+        return self.energized and not self.safe_start and not self.timed_out
+
+    def desired_velocity(self) -> float:
+        """Gets the velocity the motor is heading for right now, in microsteps/s"""
+        max_speed = self.max_speed / 10000
+        if not self.can_move() or self.planning_mode == 0:
+            return 0.0
+        if self.planning_mode == 2:
+            return max(-max_speed, min(max_speed, self.target_velocity / 10000))
+        # Fastest speed that can still stop at the target
+        distance = self.target_position - self.position
+        stopping_speed = math.sqrt(2 * self.max_decel / 100 * abs(distance))
+        return math.copysign(min(max_speed, stopping_speed), distance)
+
+    def advance(self):
+        """Simulates motion up to the current simulated time. Caller must hold the lock.
+        Only ramps are stepped through; stretches of steady motion, including standing
+        still, are jumped over in one go, so idle time and cruising cost nothing."""
+        now = self.clock()
+        while self.sim_time < now:
+            timeout_time = self.last_command_time + self.command_timeout
+            times_out = self.energized and not self.timed_out
+            if times_out and self.sim_time >= timeout_time:
+                self.timed_out = True
+                times_out = False
+            steady = min(self.steady_time(), now - self.sim_time)
+            if times_out:
+                steady = min(steady, timeout_time - self.sim_time)
+            if steady > SimulatedTic.TIME_STEP:
+                self.position += self.velocity * steady
+                self.sim_time += steady
+                continue
+            dt = min(SimulatedTic.TIME_STEP, now - self.sim_time)
+            self.step(dt)
+            self.sim_time += dt
+
+    def steady_time(self) -> float:
+        """Gets how long the motor will keep its current velocity, if nothing changes
+
+        Returns:
+            float: seconds of steady motion ahead, 0 if it's ramping, or inf if it'll
+            keep going until something changes
+        """
+        if not self.energized:
+            return math.inf if self.velocity == 0 else 0.0
+        if self.velocity != self.desired_velocity():
+            return 0.0
+        if not self.can_move() or self.planning_mode != 1:
+            return math.inf
+        if self.velocity == 0:  # holding at the target
+            return math.inf if self.position == self.target_position else 0.0
+        if self.max_decel <= 0:
+            return 0.0
+        # Cruising at max speed, until it's time to slow down for the target
+        braking_distance = self.velocity**2 / (2 * self.max_decel / 100)
+        distance = abs(self.target_position - self.position)
+        return max(distance - braking_distance, 0.0) / abs(self.velocity)
+
+    def step(self, dt: float):
+        """Moves the motor through one time step
+
+        Args:
+            dt (float): seconds to step
+        """
+        if not self.energized:
+            self.velocity = 0.0
+            return
+        desired = self.desired_velocity()
+        if self.planning_mode == 1 and self.can_move():
+            distance = self.target_position - self.position
+            if abs(distance) <= 0.5 and abs(self.velocity) <= self.max_decel / 100 * dt:
+                self.position = float(self.target_position)
+                self.velocity = 0.0
+                return
+        speeding_up = abs(desired) > abs(self.velocity) and (
+            desired * self.velocity >= 0
+        )
+        rate = (self.max_accel if speeding_up else self.max_decel) / 100
+        change = max(-rate * dt, min(rate * dt, desired - self.velocity))
+        new_velocity = self.velocity + change
+        self.position += (self.velocity + new_velocity) / 2 * dt
+        self.velocity = new_velocity
+
+    def command(self, resets_timeout: bool = True):
+        """Brings the simulation up to date before a command. Caller must hold the lock.
+
+        Args:
+            resets_timeout (bool, optional): whether the command resets the command
+            timeout. Defaults to True.
+        """
+        self.advance()
+        if resets_timeout:
+            self.last_command_time = self.sim_time
+            self.timed_out = False
+
+    def set_target_velocity(self, velocity: int):
+        """Sets a target velocity in microsteps/10,000s and resets the command timeout"""
+        with self.lock:
+            self.command()
+            self.planning_mode = 2
+            self.target_velocity = int(velocity)
+
+    def set_target_position(self, position: int):
+        """Sets a target position in microsteps and resets the command timeout"""
+        with self.lock:
+            self.command()
+            self.planning_mode = 1
+            self.target_position = int(position)
+
+    def halt_and_hold(self):
+        """Stops the motor abruptly and holds it where it is"""
+        with self.lock:
+            self.command(resets_timeout=False)
+            self.velocity = 0.0
+            self.planning_mode = 0
+
+    def halt_and_set_position(self, position: int):
+        """Stops the motor abruptly and sets its current position in microsteps"""
+        with self.lock:
+            self.command(resets_timeout=False)
+            self.velocity = 0.0
+            self.planning_mode = 0
+            self.position = float(position)
+            self.target_position = int(position)
+
+    def reset_command_timeout(self):
+        """Resets the command timeout and clears a command timeout error"""
+        with self.lock:
+            self.command()
+
+    def set_max_speed(self, max_speed: int):
+        """Sets the max speed in microsteps/10,000s"""
+        with self.lock:
+            self.command(resets_timeout=False)
+            self.max_speed = int(max_speed)
+
+    def set_max_accel(self, max_accel: int):
+        """Sets the max acceleration in microsteps/100s/s"""
+        with self.lock:
+            self.command(resets_timeout=False)
+            self.max_accel = int(max_accel)
+
+    def set_max_decel(self, max_decel: int):
+        """Sets the max deceleration in microsteps/100s/s"""
+        with self.lock:
+            self.command(resets_timeout=False)
+            self.max_decel = int(max_decel)
+
+    def set_step_mode(self, step_mode: int):
+        """Sets the microstepping mode"""
+        with self.lock:
+            self.command(resets_timeout=False)
+            self.step_mode = int(step_mode)
+
+    def set_current_limit(self, current_limit: int):
+        """Sets the current limit in mA, which the simulation ignores"""
+        with self.lock:
+            self.current_limit = int(current_limit)
+
+    def energize(self):
+        """Energizes the motor"""
+        with self.lock:
+            self.command()
+            self.energized = True
+
+    def deenergize(self):
+        """De-energizes the motor, which stops it"""
+        with self.lock:
+            self.command(resets_timeout=False)
+            self.energized = False
+            self.velocity = 0.0
+            self.planning_mode = 0
+
+    def exit_safe_start(self):
+        """Lets the motor move toward its target"""
+        with self.lock:
+            self.command()
+            self.safe_start = False
+
+    def enter_safe_start(self):
+        """Stops the motor moving until exit_safe_start() is called"""
+        with self.lock:
+            self.command(resets_timeout=False)
+            self.safe_start = True
+            self.planning_mode = 0
+
+
+SIMULATION_TIME_SCALE = float(os.environ.get("TIC_SIMULATOR", 0))
+"""If the TIC_SIMULATOR environment variable is set, TicActuator runs on a SimulatedTic
+instead of real hardware, with simulated time running this many times faster than real
+time, ex: TIC_SIMULATOR=1 for real time"""
+
+if SIMULATION_TIME_SCALE > 0:
+
+    class PyTic:
+        """Simulated stand-in for pytic's PyTic at the time scale set by TIC_SIMULATOR.
+        Like pytic, it sets its commands and variables as instance attributes, here
+        taken from a SimulatedTic so its state can't clash with subclass attributes."""
+
+        def __init__(self):
+            self.tic_simulator = SimulatedTic(time_scale=SIMULATION_TIME_SCALE)
+            """The simulated Tic behind the commands"""
+            self.variables = self.tic_simulator.variables
+            for name in SimulatedTic.COMMANDS:
+                setattr(self, name, getattr(self.tic_simulator, name))
+
+else:
+    from pytic import PyTic
+
+
+class MoveHandle:
+    """A move to a target position that's underway. Watched by a background thread,
+    which keeps the command timeout from running out, sleeps until just before the
+    predicted arrival, and then confirms arrival with a few quick polls."""
+
+    ARRIVED = "arrived"
+    """Outcome of a move that reached its target"""
+    SUPERSEDED = "superseded"
+    """Outcome of a move whose target was replaced before it got there"""
+    FAILED = "failed"
+    """Outcome of a move stopped by a Tic error, or that couldn't be watched"""
+
+    def __init__(self, target: int, predicted_duration: float):
+        """Start tracking a move
+
+        Args:
+            target (int): target position in microsteps
+            predicted_duration (float): predicted seconds until arrival
+        """
+        self.target = target
+        """Target position in microsteps"""
+        self.start_time = time()
+        """When the move was commanded, in unix seconds"""
+        self.predicted_duration = predicted_duration
+        """Predicted seconds from start_time until arrival"""
+        self.arrival_time: float = None
+        """When arrival was confirmed, in unix seconds"""
+        self.outcome: str = None
+        """ARRIVED, SUPERSEDED, or FAILED once the move is over, None until then"""
+        self.error: Exception = None
+        """Why the move failed, raised again by wait()"""
+        self.finished = threading.Event()
+        """Set once the move is over, whatever the outcome"""
+        self.thread: threading.Thread = None
+        """Thread watching the move"""
+
+    def finish(self, outcome: str, error: Exception = None):
+        """Records how the move ended and wakes anyone waiting for it
+
+        Args:
+            outcome (str): ARRIVED, SUPERSEDED, or FAILED
+            error (Exception, optional): why it failed. Defaults to None.
+        """
+        if outcome == MoveHandle.ARRIVED:
+            self.arrival_time = time()
+        self.outcome = outcome
+        self.error = error
+        self.finished.set()
+
+    def done(self) -> bool:
+        """Whether the move is over, whatever the outcome, without waiting
+
+        Returns:
+            bool: True if the move is over
+        """
+        return self.finished.is_set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """Waits for the move to be over
+
+        Args:
+            timeout (float, optional): longest time to wait in seconds. Defaults to
+            None, which waits until it's over.
+
+        Raises:
+            Exception: why the move failed, if it did
+
+        Returns:
+            bool: True if it arrived, False if it was superseded or the wait timed out
+        """
+        if not self.finished.wait(timeout):
+            return False
+        if self.outcome == MoveHandle.FAILED:
+            raise self.error
+        return self.outcome == MoveHandle.ARRIVED
+
+    def prediction_error(self) -> float:
+        """Gets how much later the move finished than predicted
+
+        Returns:
+            float: seconds late, negative if early, or None if it hasn't arrived
+        """
+        if self.arrival_time is None:
+            return None
+        return self.arrival_time - self.start_time - self.predicted_duration
+
+
+class TicReadTimeout(TimeoutError):
+    """Raised when reading from the Tic keeps failing after every retry"""
+
+
+class TicMoveError(RuntimeError):
+    """Raised when the Tic stops a move with an error before it gets to its target"""
+
+
+class TicSnapshot(NamedTuple):
+    """The actuator's state, all read in one USB transaction, in the Tic's own units"""
+
+    host_time: float
+    """When the state was read, in unix seconds"""
+    current_position: int
+    """Position in microsteps"""
+    target_position: int
+    """Target position in microsteps"""
+    current_velocity: int
+    """Velocity in microsteps/10,000s"""
+    target_velocity: int
+    """Target velocity in microsteps/10,000s"""
+    max_speed: int
+    """Max speed in microsteps/10,000s"""
+    max_decel: int
+    """Max deceleration in microsteps/100s/s"""
+    max_accel: int
+    """Max acceleration in microsteps/100s/s"""
+    step_mode: int
+    """Microstepping mode"""
+    vin_voltage: int
+    """Supply voltage in mV"""
+    error_status: int
+    """Bit field of errors currently stopping the motor"""
+    planning_mode: int
+    """0 for no target, 1 for target position, 2 for target velocity"""
+
+
+class MotionModel:
+    """Dead-reckons the actuator's position between polls. Each poll's position,
+    velocity, target and limits are planned forward as the Tic would move: ramps at the
+    max accel or decel and cruises at the max speed. Commands sent since the poll
+    replan from the predicted state, and each poll reports how far off the prediction
+    was before replacing it."""
+
+    COMMANDS = (
+        "set_target_position",
+        "set_target_velocity",
+        "halt_and_hold",
+        "halt_and_set_position",
+        "deenergize",
+        "enter_safe_start",
+        "energize",
+        "exit_safe_start",
+        "set_max_speed",
+        "set_max_accel",
+        "set_max_decel",
+    )
+    """pytic commands that change how the actuator moves, and so replan the model"""
+
+    def __init__(self, time_scale: float = 1):
+        """Create a motion model that hasn't been synced to a poll yet
+
+        Args:
+            time_scale (float, optional): actuator seconds per real second, ex: for a
+            sped up simulated Tic. Defaults to 1.
+        """
+        self.time_scale = time_scale
+        """Actuator seconds per real second"""
+        self.lock = threading.Lock()
+        """Guards the model, which is synced, commanded, and read from many threads"""
+        self.synced = False
+        """Whether there's been a poll to predict from"""
+        self.sync_time: float = 0
+        """When the state below was known, in unix seconds"""
+        self.position: float = 0
+        """Position at sync_time in microsteps"""
+        self.velocity: float = 0
+        """Velocity at sync_time in microsteps/s"""
+        self.planning_mode: int = 0
+        """0 for no target, 1 for target position, 2 for target velocity"""
+        self.target_position: int = 0
+        """Target position in microsteps"""
+        self.target_velocity: int = 0
+        """Target velocity in microsteps/10,000s"""
+        self.max_speed: int = 0
+        """Max speed in microsteps/10,000s"""
+        self.max_accel: int = 0
+        """Max acceleration in microsteps/100s/s"""
+        self.max_decel: int = 0
+        """Max deceleration in microsteps/100s/s, 0 for the same as max_accel"""
+        self.stopped = True
+        """Whether an error is keeping the motor from following its target"""
+        self.segments: list[tuple[float, float, float, float]] = []
+        """Planned motion as (start in actuator seconds after sync_time, position,
+        velocity, acceleration), each lasting until the next starts"""
+        self.error_count = 0
+        """Number of polls the prediction was checked against"""
+        self.last_error: float = 0
+        """Polled minus predicted position at the latest poll, in microsteps"""
+        self.worst_error: float = 0
+        """Largest polled minus predicted position in magnitude, in microsteps"""
+        self.error_sum_abs: float = 0
+        """Sum of magnitudes of prediction errors, in microsteps"""
+        self.error_sum_sq: float = 0
+        """Sum of squared prediction errors, in microsteps^2"""
+
+    def sync(self, state: TicSnapshot):
+        """Replaces the prediction with a poll, first noting how far off it was. A poll
+        older than the latest command or poll is ignored, since it would undo the plan
+        made since.
+
+        Args:
+            state (TicSnapshot): the poll
+        """
+        with self.lock:
+            if self.synced and state.host_time < self.sync_time:
+                return
+            if self.synced:
+                error = state.current_position - self.predict_locked(state.host_time)[0]
+                self.error_count += 1
+                self.last_error = error
+                if abs(error) > abs(self.worst_error):
+                    self.worst_error = error
+                self.error_sum_abs += abs(error)
+                self.error_sum_sq += error**2
+            self.synced = True
+            self.sync_time = state.host_time
+            self.position = float(state.current_position)
+            self.velocity = state.current_velocity / 10000
+            self.planning_mode = state.planning_mode
+            self.target_position = state.target_position
+            self.target_velocity = state.target_velocity
+            self.max_speed = state.max_speed
+            self.max_accel = state.max_accel
+            self.max_decel = state.max_decel
+            self.stopped = state.error_status != 0
+            self.plan()
+
+    def command(self, at_time: float, name: str, args: tuple):
+        """Replans from the predicted state after a command is sent
+
+        Args:
+            at_time (float): when the command was sent, in unix seconds
+            name (str): name of the pytic command
+            args (tuple): its arguments
+        """
+        if name not in MotionModel.COMMANDS:
+            return  # ex: heartbeats, which mustn't re-anchor the plan
+        with self.lock:
+            if not self.synced:
+                return
+            self.position, self.velocity = self.predict_locked(at_time)
+            self.sync_time = at_time
+            if name == "set_target_position":
+                self.planning_mode = 1
+                self.target_position = args[0]
+            elif name == "set_target_velocity":
+                self.planning_mode = 2
+                self.target_velocity = args[0]
+            elif name in ("halt_and_hold", "halt_and_set_position", "deenergize"):
+                self.planning_mode = 0
+                self.velocity = 0
+                if name == "halt_and_set_position":
+                    self.position = float(args[0])
+                    self.target_position = args[0]
+            elif name == "enter_safe_start":
+                self.planning_mode = 0
+            elif name in ("energize", "exit_safe_start"):
+                self.stopped = False  # the next poll shows if anything else stops it
+            else:  # set_max_speed, set_max_accel or set_max_decel
+                setattr(self, name[4:], args[0])
+            self.plan()
+
+    def plan(self):
+        """Plans motion from the state at sync_time. Caller must hold the lock."""
+        accel = self.max_accel / 100
+        decel = (self.max_decel or self.max_accel) / 100
+        max_speed = self.max_speed / 10000
+        t, p, v = 0.0, self.position, self.velocity
+        segments = []
+
+        def ramp(to_velocity: float, rate: float):
+            nonlocal t, p, v
+            duration = abs(to_velocity - v) / rate
+            a = math.copysign(rate, to_velocity - v)
+            segments.append((t, p, v, a))
+            t += duration
+            p += v * duration + a * duration**2 / 2
+            v = to_velocity
+
+        def cruise(duration: float):
+            nonlocal t, p
+            segments.append((t, p, v, 0.0))
+            t += duration
+            p += v * duration
+
+        if accel <= 0 or decel <= 0:
+            pass  # can't plan without limits, so coast
+        elif self.stopped or self.planning_mode != 1:
+            target = 0.0
+            if not self.stopped and self.planning_mode == 2:
+                target = max(-max_speed, min(max_speed, self.target_velocity / 10000))
+            if v * target < 0:
+                ramp(0.0, decel)
+            ramp(target, accel if abs(target) > abs(v) else decel)
+        else:
+            for _ in range(3):  # at most: stop, come back, then move to the target
+                distance = self.target_position - p
+                if distance == 0 and v == 0:
+                    break
+                direction = math.copysign(1, distance if distance != 0 else -v)
+                speed = direction * v
+                distance = abs(distance)
+                if speed < 0 or speed**2 / (2 * decel) > distance + 0.5:
+                    ramp(0.0, decel)  # moving away or overshooting, so stop first
+                    continue
+                peak = min(
+                    max_speed,
+                    math.sqrt(
+                        (2 * accel * decel * distance + decel * speed**2)
+                        / (accel + decel)
+                    ),
+                )
+                ramp(direction * peak, accel if peak > speed else decel)
+                remaining = abs(self.target_position - p) - peak**2 / (2 * decel)
+                if remaining > 0 and peak > 0:
+                    cruise(remaining / peak)
+                ramp(0.0, decel)
+                p = float(self.target_position)
+                break
+        segments.append((t, p, v, 0.0))
+        self.segments = segments
+
+    def predict_locked(self, at_time: float) -> tuple[float, float]:
+        """Predicts position and velocity. Caller must hold the lock.
+
+        Args:
+            at_time (float): time of interest in unix seconds
+
+        Returns:
+            tuple[float, float]: position in microsteps and velocity in microsteps/s
+        """
+        t = (at_time - self.sync_time) * self.time_scale
+        start, p, v, a = self.segments[0]
+        for segment in self.segments[1:]:
+            if segment[0] > t:
+                break
+            start, p, v, a = segment
+        dt = t - start
+        return p + v * dt + a * dt**2 / 2, v + a * dt
+
+    def predict(self, at_time: float) -> tuple[float, float]:
+        """Predicts the actuator's position and velocity
+
+        Args:
+            at_time (float): time of interest in unix seconds
+
+        Returns:
+            tuple[float, float]: position in microsteps and velocity in microsteps/s
+        """
+        with self.lock:
+            return self.predict_locked(at_time)
+
+    def error_metrics(self) -> dict:
+        """Summarizes how well positions were predicted, checked at every poll
+
+        Returns:
+            dict: number of polls checked, and the latest, worst, mean absolute and RMS
+            differences between polled and predicted positions in microsteps
+        """
+        with self.lock:
+            count = self.error_count
+            return {
+                "polls": count,
+                "last_error": self.last_error,
+                "worst_error": self.worst_error,
+                "mean_abs_error": self.error_sum_abs / count if count else 0.0,
+                "rms_error": math.sqrt(self.error_sum_sq / count) if count else 0.0,
+            }
 
 
 class TicActuator(PyTic):
     """Wrapper for existing pytic package, but with useful helper
     functions to allow operations in coherent units"""
 
+    RETRY_ATTEMPTS = 20
+    """Default number of tries at a USB read before giving up"""
+    RETRY_BACKOFF = 0.001
+    """Default wait in seconds after the first failed read, doubled after each failure"""
+    RETRY_BACKOFF_MAX = 0.1
+    """Default longest wait in seconds between reads"""
+
+    PRIORITY_STOP = 0
+    """I/O queue priority of commands that stop the motor, sent before anything else"""
+    PRIORITY_COMMAND = 1
+    """I/O queue priority of motion commands, settings, and heartbeats"""
+    PRIORITY_READ = 2
+    """I/O queue priority of telemetry reads"""
+    COMMAND_PRIORITIES = {
+        "halt_and_hold": PRIORITY_STOP,
+        "halt_and_set_position": PRIORITY_STOP,
+        "deenergize": PRIORITY_STOP,
+        "enter_safe_start": PRIORITY_STOP,
+        "set_target_velocity": PRIORITY_COMMAND,
+        "set_target_position": PRIORITY_COMMAND,
+        "reset_command_timeout": PRIORITY_COMMAND,
+        "set_max_speed": PRIORITY_COMMAND,
+        "set_max_accel": PRIORITY_COMMAND,
+        "set_max_decel": PRIORITY_COMMAND,
+        "set_step_mode": PRIORITY_COMMAND,
+        "set_current_limit": PRIORITY_COMMAND,
+        "energize": PRIORITY_COMMAND,
+        "exit_safe_start": PRIORITY_COMMAND,
+        "connect_to_serial_number": PRIORITY_COMMAND,
+    }
+    """pytic commands routed through the I/O thread, and their queue priorities"""
+    TARGET_COMMANDS = ("set_target_velocity", "set_target_position")
+    """Commands that set where the motor goes. A newer one replaces an older one still
+    in the queue, and either one keeps the command timeout from running out."""
+    SETTING_COMMANDS = (
+        "set_max_speed",
+        "set_max_accel",
+        "set_max_decel",
+        "set_step_mode",
+        "set_current_limit",
+    )
+    """Commands that change a setting, dropped if the setting already has that value"""
+    ARRIVAL_MARGIN = 0.02
+    """Seconds before a move's predicted arrival to start polling for it"""
+    ARRIVAL_POLL_INTERVAL = 0.005
+    """Seconds between polls while confirming a move's arrival"""
+    HEARTBEAT_INTERVAL = 0.5
+    """Seconds between heartbeats while waiting for a move, half the command timeout"""
+    HEARTBEAT_MERGE_TIME = 0.25
+    """Default seconds after a target command during which a heartbeat is redundant"""
+    TARGET_RESEND_TIME = 0.5
+    """Default seconds after which a repeated target command is sent anyway"""
+
     def __init__(
         self, step_size: float = 0.01, step_mode: int = 0, current_limit: int = 576
     ):
@@ -22,6 +828,65 @@ class TicActuator(PyTic):
         """
         super().__init__()
 
+        self.actuator_time_scale: float = (
+            SIMULATION_TIME_SCALE if SIMULATION_TIME_SCALE > 0 else 1
+        )
+        """Actuator seconds per real second, more than 1 for a sped up simulated Tic"""
+        self.motion_model = MotionModel(self.actuator_time_scale)
+        """Predicts the position between polls, synced by every snapshot() and replanned
+        by every motion command sent"""
+        self.io_queue = queue.PriorityQueue()
+        """USB work waiting for the I/O thread, as (priority, sequence number, key,
+        function, args, future, time queued)"""
+        self.io_sequence = itertools.count()
+        """Orders work of the same priority first come first served"""
+        self.io_lock = threading.Lock()
+        """Guards the I/O bookkeeping below"""
+        self.io_latest: dict[str, int] = {}
+        """Sequence number of the newest queued work for each coalescing key"""
+        self.sent_commands: dict[str, tuple] = {}
+        """Arguments of the last target and setting commands sent, to drop repeats"""
+        self.last_target_time: float = 0
+        """When a target command was last sent, in unix seconds"""
+        self.heartbeat_merge_time: float = TicActuator.HEARTBEAT_MERGE_TIME
+        """Seconds after a target command during which a heartbeat is skipped"""
+        self.target_resend_time: float = TicActuator.TARGET_RESEND_TIME
+        """Seconds after which a repeated target command is sent anyway, in case the Tic
+        dropped its target on its own, ex: after an error"""
+        self.io_stats = {
+            "transactions": 0,
+            "dropped_repeats": 0,
+            "merged_heartbeats": 0,
+            "superseded": 0,
+        }
+        """Counts of USB transactions made and skipped"""
+        self.io_worst_latency = {
+            TicActuator.PRIORITY_STOP: 0.0,
+            TicActuator.PRIORITY_COMMAND: 0.0,
+            TicActuator.PRIORITY_READ: 0.0,
+        }
+        """Longest wait from queueing to sending, in seconds, at each priority"""
+        self.io_start_time = time()
+        """When the I/O thread started, in unix seconds"""
+        for name, priority in TicActuator.COMMAND_PRIORITIES.items():
+            if hasattr(self, name):
+                # pytic makes its commands instance attributes, so wrap those
+                setattr(self, name, self.routed_command(name, getattr(self, name)))
+        self.io_thread = threading.Thread(
+            name="tic-io", target=self.io_thread_method, daemon=True
+        )
+        """Only thread that talks to the Tic over USB"""
+        self.io_thread.start()
+
+        self.retry_attempts: int = TicActuator.RETRY_ATTEMPTS
+        """Number of tries at a USB read before raising TicReadTimeout"""
+        self.retry_backoff: float = TicActuator.RETRY_BACKOFF
+        """Wait in seconds after the first failed read, doubled after each failure"""
+        self.retry_backoff_max: float = TicActuator.RETRY_BACKOFF_MAX
+        """Longest wait in seconds between reads"""
+        self.variable_errors: dict[str, int] = {}
+        """Number of failed reads of each variable, for monitoring USB health"""
+
         # Connect to first available Tic Device serial number over USB
         serial_nums = self.list_connected_device_serial_numbers()
         self.connect_to_serial_number(serial_nums[0])
@@ -31,12 +896,152 @@ class TicActuator(PyTic):
 
         self.step_size = step_size  ## mm/step
         self.microstep_ratio = 1
+        self.snapshot_ttl: float = 0.01
+        """Seconds a snapshot() is reused for, so readers in the same control cycle
+        share one USB transaction"""
+        self.last_snapshot: TicSnapshot = None
+        """Most recent snapshot() taken"""
+        self.snapshot_lock = threading.Lock()
+        """Makes concurrent snapshot() callers wait for one transaction instead of each
+        starting their own"""
 
         self.my_set_step_mode(
             step_mode
         )  # have to use own method because the superclass sets its own attributes on super().__init__()
         self.set_current_limit(current_limit)
 
+    def io_thread_method(self):
+        """Sends queued USB work to the Tic in priority order, skipping target commands
+        that a newer one has replaced"""
+        while True:
+            priority, seq, key, function, args, future, queued_time = (
+                self.io_queue.get()
+            )
+            if function is None:
+                break
+            with self.io_lock:
+                superseded = key is not None and self.io_latest.get(key) != seq
+                if superseded:
+                    self.io_stats["superseded"] += 1
+                else:
+                    self.io_stats["transactions"] += 1
+                    self.io_worst_latency[priority] = max(
+                        self.io_worst_latency[priority], time() - queued_time
+                    )
+            if superseded:
+                future.set_result(None)
+                continue
+            try:
+                future.set_result(function(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def io_call(self, priority: int, function: Callable, *args, key: str = None):
+        """Runs USB work on the I/O thread and waits for it to finish
+
+        Args:
+            priority (int): one of the PRIORITY constants, lower goes first
+            function (Callable): the work
+            key (str, optional): newer work with the same key replaces this if it hasn't
+            been sent yet. Defaults to None.
+
+        Returns:
+            _type_: what the work returned, or None if it was replaced
+        """
+        if threading.current_thread() is self.io_thread:
+            return function(*args)
+        future = Future()
+        with self.io_lock:
+            seq = next(self.io_sequence)
+            if key is not None:
+                self.io_latest[key] = seq
+        self.io_queue.put((priority, seq, key, function, args, future, time()))
+        return future.result()
+
+    def routed_command(self, name: str, command: Callable) -> Callable:
+        """Wraps a pytic command so it goes through the I/O thread, and is skipped if
+        it wouldn't change anything: a repeat of the last target or setting sent, or a
+        heartbeat right after a target command
+
+        Args:
+            name (str): name of the command
+            command (Callable): the command
+
+        Returns:
+            Callable: the wrapped command
+        """
+        priority = TicActuator.COMMAND_PRIORITIES[name]
+        is_target = name in TicActuator.TARGET_COMMANDS
+        is_setting = name in TicActuator.SETTING_COMMANDS
+
+        def send(*args):
+            with self.io_lock:
+                since_target = time() - self.last_target_time
+                if name == "reset_command_timeout":
+                    if since_target < self.heartbeat_merge_time:
+                        self.io_stats["merged_heartbeats"] += 1
+                        return None
+                elif (is_setting or is_target) and self.sent_commands.get(name) == args:
+                    if is_setting or since_target < self.target_resend_time:
+                        self.io_stats["dropped_repeats"] += 1
+                        return None
+            return self.io_call(
+                priority, send_and_record, *args, key="target" if is_target else None
+            )
+
+        def send_and_record(*args):
+            # Runs on the I/O thread, so bookkeeping happens in the order commands were
+            # actually sent, and never for a command a newer one replaced
+            result = command(*args)
+            self.motion_model.command(time(), name, args)
+            with self.io_lock:
+                if is_target:
+                    self.last_target_time = time()
+                    for other in TicActuator.TARGET_COMMANDS:
+                        self.sent_commands.pop(other, None)
+                elif priority == TicActuator.PRIORITY_STOP or name in (
+                    "energize",
+                    "exit_safe_start",
+                ):
+                    # The Tic drops its target, so the next one must be sent
+                    for other in TicActuator.TARGET_COMMANDS:
+                        self.sent_commands.pop(other, None)
+                if is_setting or is_target:
+                    self.sent_commands[name] = args
+            return result
+
+        return send
+
+    def io_metrics(self) -> dict:
+        """Gets statistics about USB traffic to the Tic
+
+        Returns:
+            dict: transactions sent and per second, repeats dropped, heartbeats merged,
+            queued targets superseded, and worst queueing latency at each priority
+        """
+        with self.io_lock:
+            return {
+                **self.io_stats,
+                "transactions_per_second": self.io_stats["transactions"]
+                / max(time() - self.io_start_time, 1e-9),
+                "worst_latency": dict(self.io_worst_latency),
+            }
+
+    def stop_io(self):
+        """Stops the I/O thread once it has sent everything already queued"""
+        self.io_queue.put(
+            (
+                TicActuator.PRIORITY_READ + 1,
+                next(self.io_sequence),
+                None,
+                None,
+                (),
+                None,
+                0,
+            )
+        )
+        self.io_thread.join()
+
     def steps_to_mm(self, val: float) -> float:
         """Converts microsteps to mm
 
@@ -67,15 +1072,44 @@ class TicActuator(PyTic):
         Returns:
                 float: current actuator position in microsteps
         """
-        pos = None
-        while pos is None:
-            try:
-                pos = self.get_variable_by_name("current_position")
-            except:
-                pos = None
-            else:
-                break
-        return pos
+        return self.get_variable_by_name("current_position")
+
+    def predict_pos(self, at_time: float = None) -> float:
+        """Predicts the actuator position from the latest poll and the commands sent
+        since, without any USB traffic unless nothing has been polled yet
+
+        Args:
+            at_time (float, optional): time of interest in unix seconds. Defaults to now.
+
+        Returns:
+            float: predicted actuator position in microsteps
+        """
+        if not self.motion_model.synced:
+            self.snapshot()
+        return self.motion_model.predict(time() if at_time is None else at_time)[0]
+
+    def predict_pos_mm(self, at_time: float = None) -> float:
+        """Predicts the actuator position in mm, see predict_pos()
+
+        Args:
+            at_time (float, optional): time of interest in unix seconds. Defaults to now.
+
+        Returns:
+            float: predicted actuator position in mm
+        """
+        return self.steps_to_mm(self.predict_pos(at_time))
+
+    def prediction_metrics(self) -> dict:
+        """Summarizes how far predicted positions were from polled ones
+
+        Returns:
+            dict: number of polls checked, and the latest, worst, mean absolute and RMS
+            prediction errors in mm
+        """
+        metrics = self.motion_model.error_metrics()
+        for name in ("last_error", "worst_error", "mean_abs_error", "rms_error"):
+            metrics[name + "_mm"] = self.steps_to_mm(metrics.pop(name))
+        return metrics
 
     def get_pos_mm(self) -> float:
         """Gets current actuator position in mm
@@ -86,16 +1120,162 @@ class TicActuator(PyTic):
         pos = self.steps_to_mm(self.get_pos())
         return pos
 
+    @staticmethod
+    def trapezoid_time(
+        distance: float, speed: float, max_speed: float, accel: float, decel: float
+    ) -> float:
+        """Computes how long a trapezoidal move takes: speeding up at accel toward
+        max_speed, then slowing at decel to stop at the target
+
+        Args:
+            distance (float): distance to the target, positive
+            speed (float): current speed, positive toward the target
+            max_speed (float): speed limit, in the same units
+            accel (float): acceleration limit
+            decel (float): deceleration limit
+
+        Returns:
+            float: seconds until arrival
+        """
+        if speed < 0:  # moving away, so stop first
+            return -speed / decel + TicActuator.trapezoid_time(
+                distance + speed**2 / (2 * decel), 0, max_speed, accel, decel
+            )
+        if speed**2 / (2 * decel) > distance:  # too fast to stop in time, so come back
+            overshoot = speed**2 / (2 * decel) - distance
+            return speed / decel + TicActuator.trapezoid_time(
+                overshoot, 0, max_speed, accel, decel
+            )
+        # Highest speed reachable if it speeds up then immediately slows down
+        peak = math.sqrt(
+            (2 * accel * decel * distance + decel * speed**2) / (accel + decel)
+        )
+        if peak <= max_speed:
+            return (peak - speed) / accel + peak / decel
+        accel_distance = (max_speed**2 - speed**2) / (2 * accel)
+        decel_distance = max_speed**2 / (2 * decel)
+        cruise_distance = distance - accel_distance - decel_distance
+        return (
+            (max_speed - speed) / accel
+            + cruise_distance / max_speed
+            + max_speed / decel
+        )
+
+    def predict_move_time(self, state: TicSnapshot, pos: int) -> float:
+        """Predicts how long moving to a position will take, from the Tic's current
+        speed limits and velocity
+
+        Args:
+            state (TicSnapshot): the actuator's state when the move starts
+            pos (int): target position in microsteps
+
+        Returns:
+            float: predicted seconds until arrival, in real time
+        """
+        distance = pos - state.current_position
+        if distance == 0 and state.current_velocity == 0:
+            return 0.0
+        direction = 1 if distance >= 0 else -1
+        accel = state.max_accel / 100  # microsteps/s^2
+        decel = (state.max_decel or state.max_accel) / 100  # 0 means same as accel
+        max_speed = state.max_speed / 10000  # microsteps/s
+        if accel <= 0 or decel <= 0 or max_speed <= 0:
+            return 0.0
+        duration = TicActuator.trapezoid_time(
+            abs(distance),
+            direction * state.current_velocity / 10000,
+            max_speed,
+            accel,
+            decel,
+        )
+        return duration / self.actuator_time_scale
+
+    def start_move(self, pos: int) -> MoveHandle:
+        """Starts moving to a position without waiting for it to get there. A
+        background thread keeps the command timeout reset until it arrives.
+
+        Args:
+            pos (int): target position in steps from zero
+
+        Returns:
+            MoveHandle: handle to check on or wait for the move
+        """
+        state = self.snapshot(max_age=0)
+        self.set_target_position(pos)
+        handle = MoveHandle(pos, self.predict_move_time(state, pos))
+        handle.thread = threading.Thread(
+            name="tic-move", target=self.watch_move, args=[handle], daemon=True
+        )
+        handle.thread.start()
+        return handle
+
+    def watch_move(self, handle: MoveHandle):
+        """Keeps the command timeout reset until a move's predicted arrival, then polls
+        until it has actually arrived
+
+        Args:
+            handle (MoveHandle): the move to watch
+        """
+        try:
+            handle.finish(self.follow_move(handle))
+        except Exception as e:
+            handle.finish(MoveHandle.FAILED, e)
+
+    def follow_move(self, handle: MoveHandle) -> str:
+        """Does the watching for watch_move()
+
+        Args:
+            handle (MoveHandle): the move to watch
+
+        Raises:
+            TicMoveError: if the Tic stops the move with an error
+            TicReadTimeout: if the Tic can't be read
+
+        Returns:
+            str: MoveHandle.ARRIVED, or MoveHandle.SUPERSEDED if something else took
+            over the actuator
+        """
+        wake_time = (
+            handle.start_time + handle.predicted_duration - TicActuator.ARRIVAL_MARGIN
+        )
+        last_heartbeat = time()
+        while True:
+            now = time()
+            if now < wake_time:
+                sleep(min(TicActuator.HEARTBEAT_INTERVAL, wake_time - now))
+            else:
+                sleep(TicActuator.ARRIVAL_POLL_INTERVAL)
+            if time() - last_heartbeat > TicActuator.HEARTBEAT_INTERVAL / 2:
+                self.heartbeat()
+                last_heartbeat = time()
+            if time() < wake_time:
+                state = self.snapshot()  # only checking for errors, so share a poll
+            else:
+                state = self.snapshot(max_age=0)
+            if state.error_status != 0:
+                raise TicMoveError(
+                    f"Tic stopped moving to {handle.target} with error status "
+                    f"{state.error_status:#b}"
+                )
+            if state.target_position != handle.target:
+                return MoveHandle.SUPERSEDED
+            if (
+                state.current_position == state.target_position
+                and state.current_velocity == 0
+            ):
+                return MoveHandle.ARRIVED
+
     def move_to_pos(self, pos: int):
         """Moves actuator to desired position, finishes when the actuator reaches the target
 
         Args:
                 pos (int): target position in steps from zero
+
+        Raises:
+                TicMoveError: if the Tic stops the move with an error
+                TicReadTimeout: if the Tic can't be read
         """
-        self.set_target_position(pos)
-        while self.get_pos() != self.get_variable_by_name("target_position"):
-            sleep(0.05)
-            self.reset_command_timeout()
+        self.start_move(pos).wait()
 
     def move_to_mm(self, pos_mm: float) -> int:
         """Moves actuator to desired position in mm
@@ -110,6 +1290,17 @@ class TicActuator(PyTic):
         self.move_to_pos(pos)
         return pos
 
+    def start_move_mm(self, pos_mm: float) -> MoveHandle:
+        """Starts moving to a position in mm without waiting for it to get there
+
+        Args:
+                pos_mm (float): desired position in mm
+
+        Returns:
+                MoveHandle: handle to check on or wait for the move
+        """
+        return self.start_move(math.floor(self.mm_to_steps(pos_mm)))
+
     def mms_to_vel(self, vel_mms: float) -> int:
         """Converts velocity in mm/s to actuator units of steps/10,000s
 
@@ -141,15 +1332,7 @@ class TicActuator(PyTic):
                 float: current actuator velocity in microsteps/10,000s
         """
 
-        vel = None
-        while vel is None:
-            try:
-                vel = self.get_variable_by_name("current_velocity")
-            except:
-                vel = None
-            else:
-                break
-        return vel
+        return self.get_variable_by_name("current_velocity")
 
     def get_vel_mms(self) -> float:
         """Gets current actuator velocity in mm/s
@@ -263,24 +1446,109 @@ class TicActuator(PyTic):
         self.deenergize()
         print(self.get_variable_by_name("error_status"))
 
+    def read_variable_block(self) -> dict:
+        """Reads every variable from the Tic in a single USB transaction. pytic re-reads
+        the whole block on every attribute access of self.variables, so this refreshes
+        it once and then reads fields straight from the fetched structure.
+
+        Returns:
+            dict: every variable in a snapshot, by name
+        """
+        names = TicSnapshot._fields[1:]
+        variables = self.variables
+        try:
+            object.__getattribute__(variables, "_update_tic_variables")()
+            block = object.__getattribute__(variables, "_tic_variables")
+            return {name: getattr(block, name) for name in names}
+        except AttributeError:
+            # This pytic version doesn't expose its structure, so read field by field
+            return {name: self.get_variable_by_name(name) for name in names}
+
+    def snapshot(self, max_age: float = None) -> TicSnapshot:
+        """Gets the actuator's full state from one USB transaction. A snapshot taken
+        within the last max_age seconds is reused instead of asking the Tic again.
+
+        Args:
+            max_age (float, optional): oldest snapshot to reuse, in seconds. Defaults to
+            snapshot_ttl.
+
+        Returns:
+            TicSnapshot: the actuator's state
+        """
+        if max_age is None:
+            max_age = self.snapshot_ttl
+        with self.snapshot_lock:
+            if (
+                self.last_snapshot is not None
+                and time() - self.last_snapshot.host_time <= max_age
+            ):
+                return self.last_snapshot
+            self.last_snapshot = self.retry("snapshot", self.read_and_sync)
+            return self.last_snapshot
+
+    def read_and_sync(self) -> TicSnapshot:
+        """Reads a snapshot and syncs the motion model to it. Run on the I/O thread, so no
+        command can go out between the two and be overwritten by the older state.
+
+        Returns:
+            TicSnapshot: the actuator's state, or None if the read failed
+        """
+        read_start = time()
+        block = self.read_variable_block()
+        if block is None:
+            return None
+        # Stamp with the middle of the transaction
+        snapshot = TicSnapshot((read_start + time()) / 2, **block)
+        self.motion_model.sync(snapshot)
+        return snapshot
+
+    def retry(self, name: str, read: Callable):
+        """Calls a USB read until it succeeds, waiting exponentially longer between tries
+        so a flaky connection doesn't spin a core and starve the other threads. Each
+        failure is counted in variable_errors.
+
+        Args:
+            name (str): what's being read, for counting errors
+            read (Callable): the read, which fails by raising or returning None
+
+        Raises:
+            TicReadTimeout: if all retry_attempts tries fail
+
+        Returns:
+            _type_: what the read returned
+        """
+        backoff = self.retry_backoff
+        error = None
+        for attempt in range(self.retry_attempts):
+            if attempt > 0:
+                sleep(backoff)
+                backoff = min(backoff * 2, self.retry_backoff_max)
+            try:
+                value = self.io_call(TicActuator.PRIORITY_READ, read)
+            except Exception as e:
+                error = e
+            else:
+                if value is not None:
+                    return value
+                error = None
+            self.variable_errors[name] = self.variable_errors.get(name, 0) + 1
+        raise TicReadTimeout(
+            f"Couldn't read {name} from the Tic after {self.retry_attempts} tries"
+        ) from error
+
     def get_variable_by_name(self, name: str):
-        """Gets actuator variables and keeps trying until success
+        """Gets actuator variables, retrying with backoff on failure
 
         Args:
             name (str): name of variable to retrieve
 
+        Raises:
+            TicReadTimeout: if the variable can't be read after retry_attempts tries
+
         Returns:
             _type_: the value of the variable that was requested, type may vary
         """
-        var = None
-        while var is None:
-            try:
-                var = getattr(self.variables, name)
-            except:
-                var = None
-            else:
-                break
-        return var
+        return self.retry(name, lambda: getattr(self.variables, name))
 
     def startup(self):
         """Energizes actuator and exits safe start"""
@@ -2,15 +2,20 @@ import openscale
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import numpy as np
-import threading
+import argparse
+
+parser = argparse.ArgumentParser(
+    description="Live histograms of load cell reading quality"
+)
+parser.add_argument(
+    "--export",
+    default=None,
+    help="JSON file to save the summary to when the window is closed",
+)
+args = parser.parse_args()
 
 scale = openscale.OpenScale()
-
-readings = []
-differences = []
-
-filtered_readings = []
-filtered_diffs = []
+diagnostics = openscale.AcquisitionDiagnostics(scale)
 
 # style.use("fivethirtyeight")
 fig = plt.figure()
@@ -22,79 +27,68 @@ ax4 = fig.add_subplot(2, 2, 4)
 color1 = "C0"
 color2 = "C1"
 color3 = "C2"
-color4 = "C3"
 
+units = scale.units if scale.is_calibrated() else "raw"
+
+ax1.set_xlabel(f"Reading [{units}]")
+ax1.set_ylabel("Number of Readings")
+ax1.set_yscale("log")
+
+ax2.set_xlabel(f"Difference from last reading [{units}]")
+ax2.set_ylabel("Number of Readings")
+ax2.set_xscale("log")
+ax2.set_yscale("log")
+
+ax3.set_xlabel("Time between readings arriving [s]")
+ax3.set_ylabel("Number of Readings")
+ax3.set_xscale("log")
+ax3.set_yscale("log")
 
-diffBins = np.logspace(np.log10(0.0001), np.log10(600), 100)
-# diffBins = 100
+ax4.axis("off")
+rates_text = ax4.text(0, 1, "", va="top", family="monospace")
+fig.tight_layout()
+
+# Each histogram is drawn once and only has its counts swapped out after, so redrawing
+# takes the same time however long it's been running
+plots = {}
+
+
+def update_histogram(ax, stats: openscale.StreamingStats, color: str):
+    if stats.bin_edges is None and stats.count < stats.warmup:
+        return  # let it pick its range from enough readings first
+    counts, edges = stats.histogram()
+    if stats not in plots:
+        plots[stats] = ax.stairs(counts, edges, fill=True, color=color)
+        ax.set_xlim(edges[0], edges[-1])
+    else:
+        plots[stats].set_data(counts)
+    ax.set_ylim(0.5, max(counts.max(), 1) * 2)
 
 
 def animate(i):
-    global ax1, ax2, ax3, ax4
-    ax1.clear()
-    ax2.clear()
-    ax3.clear()
-    ax4.clear()
-
-    # Store data & timestamps locally to prevent race conditions due to multithreading
-    readingsTemp = readings[:]
-    differencesTemp = differences[:]
-    if len(differencesTemp) < 1:
-        return
-
-    ax1.set_xlabel("Force [g]")
-    ax1.set_ylabel("Number of Readings")
-    ax1.hist(readings, 100, color=color1)
-    ax1.set_yscale("log")
-
-    ax2.set_xlabel("Difference from last reading [g]")
-    ax2.set_ylabel("Number of Readings")
-    ax2.hist(differences, diffBins, color=color2)
-    ax2.set_xscale("log")
-    ax2.set_yscale("log")
-
-    ax3.set_xlabel("Force [g]")
-    ax3.set_ylabel("Number of Readings")
-    ax3.hist(filtered_readings, 100, color=color3)
-    ax3.set_yscale("log")
-
-    ax4.set_xlabel("Difference from last reading [g]")
-    ax4.set_ylabel("Number of Readings")
-    ax4.hist(filtered_diffs, diffBins, color=color4)
-    ax4.set_xscale("log")
-    ax4.set_yscale("log")
-    fig.suptitle("N = {:}".format(len(readings)))
-
-
-outlier_threshold = 10
-
-
-def get_data():
-    global readings, differences  # , scale
-    while True:
-        weight = scale.reading_to_units(scale.wait_for_reading())
-        if weight is None:  # if startup garbage not gone yet
-            continue
-
-        print("{:6.2f}{:}".format(weight, scale.units))
-
-        # Grab new data & take difference
-        readings.append(weight)
-        if len(readings) >= 2:
-            differences.append(abs(weight - readings[-2]))
-            if len(readings) >= 3:
-                if (
-                    abs(weight - readings[-2]) <= outlier_threshold
-                    or abs(weight - readings[-3]) <= outlier_threshold
-                ):
-                    filtered_readings.append(weight)
-                    if len(filtered_readings) >= 2:
-                        filtered_diffs.append(weight - filtered_readings[-2])
-
-
-gd = threading.Thread(name="get_data", target=get_data)
-
-gd.start()
-
-ani = animation.FuncAnimation(fig, animate, interval=50)
+    diagnostics.update()
+    update_histogram(ax1, diagnostics.readings, color1)
+    update_histogram(ax2, diagnostics.jumps, color2)
+    update_histogram(ax3, diagnostics.intervals, color3)
+
+    rates = diagnostics.rates()
+    link = scale.stall_metrics()
+    rates_text.set_text(
+        f"Reports:       {rates['reports']}\n"
+        f"Outliers:      {rates['outliers']} ({rates['outlier_rate']:.3%})\n"
+        f"Garbled lines: {rates['garbled_lines']} ({rates['garbled_rate']:.3%})\n"
+        f"Stalls:        {link['stall_count']}\n"
+        f"Reconnects:    {link['reconnect_count']}\n"
+        f"Mean:          {diagnostics.readings.mean:.3f}{units}\n"
+        f"Std:           {diagnostics.readings.std:.3f}{units}"
+    )
+    fig.suptitle("N = {:}".format(diagnostics.readings.count))
+
+
+ani = animation.FuncAnimation(fig, animate, interval=50, cache_frame_data=False)
 plt.show()
+
+scale.stop_acquisition()
+if args.export is not None:
+    diagnostics.export(args.export)
+    print(f"Saved summary to {args.export}")
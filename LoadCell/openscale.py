@@ -1,14 +1,1923 @@
 """Provides OpenScale class, wrapper for interfacing with OpenScale board"""
 
-from time import time
+from collections import deque
+from time import time, sleep
 import json
 import re
 import math
+import struct
+import threading
+from typing import Callable
 import serial
 import serial.tools.list_ports
 import numpy as np
 import matplotlib.pyplot as plt
-import os.path
+import os
+
+SAMPLE_DTYPE = np.dtype(
+    [
+        ("time", np.float64),
+        ("raw", np.int64),
+        ("force", np.float64),
+        ("host_time", np.float64),
+        ("filtered_force", np.float64),
+        ("force_rate", np.float64),
+    ]
+)
+"""Layout of one load cell sample: when the reading was taken in host unix seconds (from
+the board's own timestamp mapped onto the host clock if it reports one, otherwise the
+same as host_time), raw reading from the OpenScale, calibrated force in the load cell's
+units (NaN if not calibrated), host time the sample arrived, force after the force
+filter (the same as force if there is none), and rate of change of the filtered force in
+units per second. See OpenScale.force_filter for how much the last two lag behind."""
+
+REPORT_FIELD_PATTERNS = {
+    "timestamp": rb"(\d+),",
+    "units": rb"(-?\d+(?:\.\d*)?),(?:lbs|kg),",
+    "raw": rb"(-?\d+),",
+    "local_temp": rb"(-?\d+(?:\.\d*)?),",
+    "remote_temp": rb"(-?\d+(?:\.\d*)?),",
+}
+"""Pattern for each field the firmware can print in a report line, in the order it
+prints them. Which ones are enabled is set in the board's menu, and must be listed in
+report_fields in the config file to match"""
+MENU_SETTING_PATTERNS = {
+    "tare": rb"1\) Tare scale to zero \[(-?\d+)\]",
+    "calibration_factor": rb"2\) Calibrate scale \[(-?\d+)\]",
+    "timestamp": rb"3\) Timestamp \[O(n|ff)\]",
+    "report_period": rb"4\) Set report rate \[(\d+)\]",
+    "baud": rb"5\) Set baud rate \[(\d+) bps\]",
+    "units": rb"6\) Change units of measure \[(\w*)\]",
+    "decimals": rb"7\) Decimals \[(\d+)\]",
+    "average": rb"8\) Average amount \[(\d+)\]",
+    "local_temp": rb"9\) Local temp \[O(n|ff)\]",
+    "remote_temp": rb"r\) Remote temp \[O(n|ff)\]",
+    "raw_reading": rb"q\) Raw reading \[O(n|ff)\]",
+    "unit_reading": rb"u\) Unit reading \[O(n|ff)\]",
+    "serial_trigger": rb"t\) Serial trigger \[O(n|ff)\]",
+    "trigger_character": rb"c\) Trigger character: \[(\d+) /",
+    "binary_output": rb"b\) Binary output \[O(n|ff)\]",
+}
+"""Pattern for each setting shown in the firmware's configuration menu. report_period
+is the time between reports in ms"""
+MENU_END = b"x) Exit\r\n>"
+"""End of the firmware's configuration menu, where it waits for a command"""
+
+
+def parse_menu(text: bytes) -> dict:
+    """Reads the current settings out of the firmware's configuration menu
+
+    Args:
+        text (bytes): serial output containing at least one full menu. The last one is used.
+
+    Returns:
+        dict: each setting in MENU_SETTING_PATTERNS that was found, as an int, bool, or str
+    """
+    text = text[text.rfind(b"System Configuration") :]
+    settings = {}
+    for name, pattern in MENU_SETTING_PATTERNS.items():
+        match = re.search(pattern, text)
+        if match is None:
+            continue
+        value = match.group(1)
+        if value.isdigit() or value.startswith(b"-"):
+            settings[name] = int(value)
+        elif value in (b"n", b"ff"):
+            settings[name] = value == b"n"
+        else:
+            settings[name] = value.decode()
+    return settings
+
+
+REPORT_DTYPE = np.dtype(
+    [
+        ("raw", np.int64),
+        ("device_time", np.float64),
+        ("local_temp", np.float64),
+        ("remote_temp", np.float64),
+    ]
+)
+"""Layout of one parsed report: raw reading, board time in seconds since boot, and
+local and remote temperatures in C. Fields the board isn't reporting are NaN"""
+
+
+def empty_reports(n: int) -> np.ndarray:
+    """Makes an array of reports with every field the board didn't report filled in
+
+    Args:
+        n (int): number of reports
+
+    Returns:
+        np.ndarray: reports with raw zeroed and all other fields NaN
+    """
+    reports = np.zeros(n, dtype=REPORT_DTYPE)
+    for field in ("device_time", "local_temp", "remote_temp"):
+        reports[field] = math.nan
+    return reports
+
+
+class SampleRingBuffer:
+    """Preallocated circular buffer of load cell samples. One acquisition thread writes
+    into it, and any number of other threads can read from it without touching the
+    serial port. Every sample gets a sequence number, so readers can pick up exactly
+    where they left off and never miss a sample as long as they keep up with the buffer.
+    """
+
+    def __init__(self, capacity: int = 2**16):
+        """Create an empty sample buffer
+
+        Args:
+            capacity (int, optional): Number of samples to keep before the oldest ones
+            get overwritten. Defaults to 2**16, about 13 minutes at 80Hz.
+        """
+        self.capacity = capacity
+        """Number of samples kept in the buffer"""
+        self.samples = np.zeros(capacity, dtype=SAMPLE_DTYPE)
+        """Preallocated storage for samples, indexed by sequence number modulo capacity"""
+        self.seq = 0
+        """Sequence number of the next sample to be written, equal to the total number
+        of samples ever written"""
+        self.new_sample = threading.Condition()
+        """Guards the buffer, and is notified whenever new samples are written"""
+
+    def append(
+        self,
+        sample_time: float,
+        raw: int,
+        force: float,
+        host_time: float = None,
+        filtered_force: float = None,
+        force_rate: float = math.nan,
+    ):
+        """Add one sample to the buffer, overwriting the oldest one if full
+
+        Args:
+            sample_time (float): host time the reading was taken, in unix seconds
+            raw (int): raw reading from the OpenScale
+            force (float): calibrated force
+            host_time (float, optional): host time the sample arrived. Defaults to sample_time.
+            filtered_force (float, optional): filtered force. Defaults to force.
+            force_rate (float, optional): rate of change of filtered force. Defaults to NaN.
+        """
+        if host_time is None:
+            host_time = sample_time
+        if filtered_force is None:
+            filtered_force = force
+        with self.new_sample:
+            self.samples[self.seq % self.capacity] = (
+                sample_time,
+                raw,
+                force,
+                host_time,
+                filtered_force,
+                force_rate,
+            )
+            self.seq += 1
+            self.new_sample.notify_all()
+
+    def extend(
+        self,
+        sample_times: np.ndarray,
+        raws: np.ndarray,
+        forces: np.ndarray,
+        host_times: np.ndarray = None,
+        filtered_forces: np.ndarray = None,
+        force_rates: np.ndarray = None,
+    ):
+        """Add several samples to the buffer at once, overwriting the oldest ones if full
+
+        Args:
+            sample_times (np.ndarray): host times the readings were taken, in unix seconds
+            raws (np.ndarray): raw readings from the OpenScale
+            forces (np.ndarray): calibrated forces
+            host_times (np.ndarray, optional): host times the samples arrived. Defaults to sample_times.
+            filtered_forces (np.ndarray, optional): filtered forces. Defaults to forces.
+            force_rates (np.ndarray, optional): rates of change of filtered force.
+            Defaults to NaN.
+        """
+        n = len(raws)
+        if n == 0:
+            return
+        if host_times is None:
+            host_times = sample_times
+        if filtered_forces is None:
+            filtered_forces = forces
+        if force_rates is None:
+            force_rates = np.full(n, math.nan)
+        skip = max(n - self.capacity, 0)  # only the newest samples would survive anyway
+        with self.new_sample:
+            indices = (self.seq + np.arange(skip, n)) % self.capacity
+            self.samples["time"][indices] = sample_times[skip:]
+            self.samples["raw"][indices] = raws[skip:]
+            self.samples["force"][indices] = forces[skip:]
+            self.samples["host_time"][indices] = host_times[skip:]
+            self.samples["filtered_force"][indices] = filtered_forces[skip:]
+            self.samples["force_rate"][indices] = force_rates[skip:]
+            self.seq += n
+            self.new_sample.notify_all()
+
+    def _get_range(self, start: int, stop: int) -> np.ndarray:
+        """Copy out samples with sequence numbers in [start, stop). Caller must hold the lock."""
+        i_start = start % self.capacity
+        i_stop = i_start + (stop - start)
+        if i_stop <= self.capacity:
+            return self.samples[i_start:i_stop].copy()
+        return np.concatenate(
+            (self.samples[i_start:], self.samples[: i_stop - self.capacity])
+        )
+
+    def latest(self) -> np.void:
+        """Gets the most recent sample without waiting
+
+        Returns:
+            np.void: latest sample with fields time, raw, and force, or None if
+            nothing has been recorded yet
+        """
+        with self.new_sample:
+            if self.seq == 0:
+                return None
+            return self.samples[(self.seq - 1) % self.capacity].copy()
+
+    def since(self, seq: int) -> tuple[np.ndarray, int]:
+        """Gets every sample recorded since a given sequence number without waiting.
+        If the requested samples have already been overwritten, returns the oldest
+        samples still available.
+
+        Args:
+            seq (int): sequence number of the first sample wanted, usually the value
+            returned by the previous call
+
+        Returns:
+            tuple[np.ndarray, int]: samples recorded since seq, and the sequence
+            number to pass in next time
+        """
+        with self.new_sample:
+            start = max(seq, self.seq - self.capacity, 0)
+            return self._get_range(start, self.seq), self.seq
+
+    def wait_since(self, seq: int, timeout: float = None) -> tuple[np.ndarray, int]:
+        """Like since(), but waits for at least one new sample if there aren't any yet
+
+        Args:
+            seq (int): sequence number of the first sample wanted
+            timeout (float, optional): Longest time to wait in seconds. Defaults to
+            None, which waits forever.
+
+        Returns:
+            tuple[np.ndarray, int]: samples recorded since seq, and the sequence
+            number to pass in next time. Samples may be empty if the wait timed out.
+        """
+        with self.new_sample:
+            self.new_sample.wait_for(lambda: self.seq > seq, timeout)
+            start = max(seq, self.seq - self.capacity, 0)
+            return self._get_range(start, self.seq), self.seq
+
+    def window(self, seconds: float) -> np.ndarray:
+        """Gets all samples from the last given number of seconds without waiting
+
+        Args:
+            seconds (float): how far back from the latest sample to go, in seconds
+
+        Returns:
+            np.ndarray: samples in chronological order
+        """
+        with self.new_sample:
+            recent = self._get_range(max(self.seq - self.capacity, 0), self.seq)
+        if len(recent) == 0:
+            return recent
+        first = np.searchsorted(recent["time"], recent["time"][-1] - seconds)
+        return recent[first:]
+
+
+class OutlierFilter:
+    """Rejects spikes in the load cell signal by comparing each new measurement to a
+    fixed number of previous measurements kept in a circular buffer, so the cost per
+    sample doesn't depend on how long the load cell has been running. Every measurement
+    goes into the history, outliers included, so a real jump in force is accepted once
+    enough readings agree with it.
+
+    Two rules are available:
+        "quorum": a measurement is an outlier if fewer than quorum previous measurements
+        are within jump_threshold of it.
+        "hampel": a measurement is an outlier if it is further from the median of the
+        previous measurements than hampel_sigmas robust standard deviations (1.4826 * MAD),
+        or jump_threshold, whichever is larger.
+    """
+
+    RULES = ("quorum", "hampel")
+    """Available outlier rules"""
+
+    def __init__(
+        self,
+        history: int = 10,
+        jump_threshold: float = 10,
+        quorum: int = 5,
+        rule: str = "quorum",
+        hampel_sigmas: float = 3,
+    ):
+        """Create an outlier filter with an empty history
+
+        Args:
+            history (int, optional): How many previous measurements to compare against. Defaults to 10.
+            jump_threshold (float, optional): Largest acceptable jump between measurements, in
+            load cell units. Defaults to 10.
+            quorum (int, optional): For the quorum rule, how many previous measurements must be
+            within jump_threshold of a new one. Defaults to 5.
+            rule (str, optional): "quorum" or "hampel". Defaults to "quorum".
+            hampel_sigmas (float, optional): For the hampel rule, how many robust standard
+            deviations from the median is too far. Defaults to 3.
+        """
+        if rule not in OutlierFilter.RULES:
+            raise ValueError(
+                f"Unknown outlier rule {rule!r}, use one of {OutlierFilter.RULES}"
+            )
+        self.history = history
+        """How many previous measurements to compare against"""
+        self.jump_threshold = jump_threshold
+        """Largest acceptable jump between measurements"""
+        self.quorum = quorum
+        """How many previous measurements must agree with a new one, for the quorum rule"""
+        self.rule = rule
+        """Which rule to judge outliers by"""
+        self.hampel_sigmas = hampel_sigmas
+        """How many robust standard deviations from the median is too far, for the hampel rule"""
+        self.values: list[float] = [0.0] * history
+        """Circular buffer of previous measurements"""
+        self.index = 0
+        """Where the next measurement will be written in the circular buffer"""
+        self.count = 0
+        """How many valid measurements the circular buffer holds, up to history"""
+
+    def reset(self):
+        """Forget all previous measurements"""
+        self.index = 0
+        self.count = 0
+
+    def push(self, value: float):
+        """Add a measurement to the history without judging it
+
+        Args:
+            value (float): the measurement to store
+        """
+        self.values[self.index] = value
+        self.index = (self.index + 1) % self.history
+        self.count = min(self.count + 1, self.history)
+
+    def is_outlier(self, value: float) -> bool:
+        """Judges a measurement against the history without storing it. Until the history
+        has filled up, the measurement is only compared against the previous measurements
+        that actually exist, and the first measurement is always accepted.
+
+        Args:
+            value (float): the new measurement to check
+
+        Returns:
+            bool: True if it's an outlier, False if it's considered a real measurement
+        """
+        if self.count == 0:
+            return False
+        previous = (
+            self.values if self.count == self.history else self.values[: self.count]
+        )
+        if self.rule == "quorum":
+            number_close_enough = sum(
+                abs(value - old) <= self.jump_threshold for old in previous
+            )
+            return number_close_enough < min(self.quorum, self.count)
+
+        ordered = sorted(previous)
+        median = (
+            ordered[self.count // 2]
+            if self.count % 2
+            else (ordered[self.count // 2 - 1] + ordered[self.count // 2]) / 2
+        )
+        mad = sorted(abs(old - median) for old in previous)[self.count // 2]
+        limit = max(self.hampel_sigmas * 1.4826 * mad, self.jump_threshold)
+        return abs(value - median) > limit
+
+    def check(self, value: float) -> bool:
+        """Judges a measurement against the history, then stores it
+
+        Args:
+            value (float): the new measurement to check
+
+        Returns:
+            bool: True if it's an outlier, False if it's considered a real measurement
+        """
+        outlier = self.is_outlier(value)
+        self.push(value)
+        return outlier
+
+    def filter_array(self, values: np.ndarray) -> np.ndarray:
+        """Judges a whole recorded array of measurements at once, exactly as if they had been
+        passed through check() one at a time starting from an empty history. Doesn't change
+        this filter's own history.
+
+        Args:
+            values (np.ndarray): measurements in the order they were recorded
+
+        Returns:
+            np.ndarray: boolean mask, True where the measurement is an outlier
+        """
+        values = np.asarray(values, dtype=np.float64)
+        padded = np.concatenate((np.full(self.history, np.nan), values[:-1]))
+        previous = np.lib.stride_tricks.sliding_window_view(padded, self.history)
+        count = np.count_nonzero(~np.isnan(previous), axis=1)
+
+        outliers = np.zeros(len(values), dtype=bool)
+        judged = count > 0
+        if self.rule == "quorum":
+            with np.errstate(invalid="ignore"):
+                close_enough = np.abs(values[:, None] - previous) <= self.jump_threshold
+            number_close_enough = np.count_nonzero(close_enough, axis=1)
+            outliers[judged] = (number_close_enough < np.minimum(self.quorum, count))[
+                judged
+            ]
+            return outliers
+
+        median = np.nanmedian(previous[judged], axis=1)
+        deviation = np.abs(previous[judged] - median[:, None])
+        mad = np.nanquantile(deviation, 0.5, axis=1, method="higher")
+        limit = np.maximum(self.hampel_sigmas * 1.4826 * mad, self.jump_threshold)
+        outliers[judged] = np.abs(values[judged] - median) > limit
+        return outliers
+
+
+class P2Quantile:
+    """Streaming estimate of a single quantile in constant memory, using the P-squared
+    algorithm from Jain and Chlamtac (1985). Keeps five markers whose heights are adjusted
+    with piecewise-parabolic interpolation as samples come in."""
+
+    def __init__(self, p: float):
+        """Create an empty quantile estimate
+
+        Args:
+            p (float): quantile to estimate, between 0 and 1
+        """
+        self.p = p
+        """Quantile being estimated"""
+        self.heights: list[float] = []
+        """Marker heights. The middle marker is the quantile estimate"""
+        self.positions = [0, 1, 2, 3, 4]
+        """Actual marker positions"""
+        self.desired = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+        """Desired marker positions"""
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+        """How much each desired marker position moves per sample"""
+
+    def add(self, x: float):
+        """Update the estimate with a new sample
+
+        Args:
+            x (float): the new sample
+        """
+        q = self.heights
+        if len(q) < 5:
+            q.append(x)
+            q.sort()
+            return
+
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        n = self.positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        for i in range(1, 4):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                q_new = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not q[i - 1] < q_new < q[i + 1]:  # fall back to linear
+                    q_new = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = q_new
+                n[i] += d
+
+    @property
+    def value(self) -> float:
+        """Current quantile estimate, NaN if there are no samples yet"""
+        q = self.heights
+        if len(q) == 0:
+            return math.nan
+        if len(q) < 5:
+            return q[min(int(self.p * len(q)), len(q) - 1)]
+        return q[2]
+
+
+class StreamingStats:
+    """Online statistics for a stream of load cell readings in constant memory: Welford
+    mean and variance, min and max, P-squared quantile estimates, a trimmed mean that
+    ignores samples outside the trim quantiles, and a fixed-bin histogram whose range is
+    chosen from the first few samples or given up front."""
+
+    def __init__(
+        self,
+        trim: float = 0.01,
+        bins: int = 50,
+        warmup: int = 100,
+        bin_edges: np.ndarray = None,
+    ):
+        """Create an empty set of statistics
+
+        Args:
+            trim (float, optional): Fraction of samples to ignore at each end for the
+            trimmed mean. Defaults to 0.01.
+            bins (int, optional): Number of histogram bins. Defaults to 50.
+            warmup (int, optional): Number of samples used to choose the histogram range.
+            Defaults to 100.
+            bin_edges (np.ndarray, optional): Fixed histogram bin edges, ex: log-spaced,
+            which skips the warmup and overrides bins. Defaults to None.
+        """
+        if bin_edges is not None:
+            bins = len(bin_edges) - 1
+        self.trim = trim
+        """Fraction of samples ignored at each end for the trimmed mean"""
+        self.count = 0
+        """Number of samples seen"""
+        self.mean = 0.0
+        """Mean of all samples"""
+        self.m2 = 0.0
+        """Sum of squared differences from the mean, for Welford's algorithm"""
+        self.min = math.inf
+        """Smallest sample"""
+        self.max = -math.inf
+        """Largest sample"""
+        self.quantiles = {p: P2Quantile(p) for p in (trim, 0.5, 1 - trim)}
+        """Streaming estimates of the trim quantiles and the median"""
+        self.trimmed_count = 0
+        """Number of samples that fell within the trim quantiles when they arrived"""
+        self.trimmed_mean = 0.0
+        """Mean of the samples that fell within the trim quantiles when they arrived"""
+        self.bins = bins
+        """Number of histogram bins"""
+        self.warmup = warmup
+        """Number of samples used to choose the histogram range"""
+        self.warmup_samples: list[float] = []
+        """Samples held until the histogram range is chosen"""
+        self.bin_edges: np.ndarray = (
+            None if bin_edges is None else np.asarray(bin_edges, dtype=np.float64)
+        )
+        """Histogram bin edges, once chosen"""
+        self.bin_counts = np.zeros(bins, dtype=np.int64)
+        """Number of samples in each histogram bin. Samples out of range go in the end bins"""
+
+    def add(self, x: float):
+        """Update the statistics with a new sample
+
+        Args:
+            x (float): the new sample
+        """
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+
+        for estimate in self.quantiles.values():
+            estimate.add(x)
+        if self.count <= 5 or (
+            self.quantiles[self.trim].value <= x <= self.quantiles[1 - self.trim].value
+        ):
+            self.trimmed_count += 1
+            self.trimmed_mean += (x - self.trimmed_mean) / self.trimmed_count
+
+        if self.bin_edges is None:
+            self.warmup_samples.append(x)
+            if len(self.warmup_samples) >= self.warmup:
+                self._set_bins()
+        else:
+            self._add_to_bin(x)
+
+    def _set_bins(self):
+        """Choose the histogram range from the warmup samples, then bin them"""
+        spread = 5 * self.std if self.std > 0 else 1
+        self.bin_edges = np.linspace(
+            self.mean - spread, self.mean + spread, self.bins + 1
+        )
+        for x in self.warmup_samples:
+            self._add_to_bin(x)
+        self.warmup_samples = []
+
+    def _add_to_bin(self, x: float):
+        """Count a sample in its histogram bin"""
+        i = int(np.searchsorted(self.bin_edges, x, side="right")) - 1
+        self.bin_counts[min(max(i, 0), self.bins - 1)] += 1
+
+    @property
+    def variance(self) -> float:
+        """Sample variance of all samples"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation of all samples"""
+        return math.sqrt(self.variance)
+
+    def quantile(self, p: float) -> float:
+        """Gets a streaming quantile estimate
+
+        Args:
+            p (float): one of the tracked quantiles: the trim fraction, 0.5, or 1 - trim
+
+        Returns:
+            float: estimate of that quantile
+        """
+        return self.quantiles[p].value
+
+    def histogram(self) -> tuple[np.ndarray, np.ndarray]:
+        """Gets the fixed-bin histogram of samples
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: counts in each bin, and the bin edges
+        """
+        if self.bin_edges is None and self.count > 0:
+            self._set_bins()
+        return self.bin_counts, self.bin_edges
+
+    def count_within(self, low: float, high: float) -> int:
+        """Estimates from the histogram how many samples fell between two values
+
+        Args:
+            low (float): lower bound
+            high (float): upper bound
+
+        Returns:
+            int: number of samples in the histogram bins whose centers are in range
+        """
+        counts, edges = self.histogram()
+        centers = (edges[:-1] + edges[1:]) / 2
+        return int(counts[(centers >= low) & (centers <= high)].sum())
+
+    def summary(self) -> str:
+        """Gets a printable summary of the statistics
+
+        Returns:
+            str: multi-line summary
+        """
+        within = self.count_within(self.mean - self.std, self.mean + self.std)
+        return (
+            f"n: {self.count}, mean: {self.mean:.2f}, "
+            f"trimmed mean (middle {1 - 2 * self.trim:.0%}): {self.trimmed_mean:.2f}\n"
+            f"min: {self.min}, max: {self.max}, standard dev: {self.std:.2f}\n"
+            f"median: {self.quantile(0.5):.2f}, {self.trim:.0%} / {1 - self.trim:.0%} "
+            f"quantiles: {self.quantile(self.trim):.2f} / {self.quantile(1 - self.trim):.2f}\n"
+            f"Number within 1std: ~{within}, total outside 1std: ~{self.count - within}"
+        )
+
+    def as_dict(self) -> dict:
+        """Gets the statistics as a JSON-serializable dict
+
+        Returns:
+            dict: statistics by name
+        """
+        counts, edges = self.histogram()
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "std": self.std,
+            "min": self.min,
+            "max": self.max,
+            "trimmed_mean": self.trimmed_mean,
+            "quantiles": {str(p): est.value for p, est in self.quantiles.items()},
+            "bin_counts": counts.tolist(),
+            "bin_edges": edges.tolist() if edges is not None else [],
+        }
+
+
+class BiquadFilter:
+    """Cascade of second order IIR sections (biquads) for smoothing the force signal as
+    it streams in, one sample at a time, with state carried between calls. Each section
+    is in transposed direct form II. Also differentiates the filtered signal, since a
+    derivative of the unfiltered signal is mostly noise.
+
+    Filtering delays the signal. group_delay() says by how much, so consumers can
+    account for it instead of reacting to stale force without knowing.
+    """
+
+    def __init__(self, sections: np.ndarray, sample_rate: float):
+        """Create a filter with no history. The first sample is treated as if it had
+        been steady forever, so there's no startup transient.
+
+        Args:
+            sections (np.ndarray): one row of [b0, b1, b2, a0, a1, a2] per section,
+            like scipy's sos format
+            sample_rate (float): samples per second the filter was designed for
+        """
+        sections = np.atleast_2d(np.asarray(sections, dtype=np.float64))
+        self.sections = sections / sections[:, 3:4]
+        """One normalized row of [b0, b1, b2, 1, a1, a2] per section"""
+        self.sample_rate = sample_rate
+        """Samples per second the filter was designed for"""
+        self.state = np.zeros((len(self.sections), 2))
+        """Two delay values per section"""
+        self.started = False
+        """Whether any samples have been filtered since the last reset"""
+        self.last_value: float = None
+        """Last filtered value, for differentiating"""
+        self.last_time: float = None
+        """Time of the last filtered value, for differentiating"""
+
+    @staticmethod
+    def lowpass_section(
+        cutoff: float, sample_rate: float, q: float = 1 / math.sqrt(2)
+    ) -> np.ndarray:
+        """Designs a second order low pass section (Audio EQ Cookbook)
+
+        Args:
+            cutoff (float): cutoff frequency in Hz
+            sample_rate (float): samples per second
+            q (float, optional): quality factor. Defaults to 1/sqrt(2), Butterworth.
+
+        Returns:
+            np.ndarray: [b0, b1, b2, a0, a1, a2]
+        """
+        w0 = 2 * math.pi * cutoff / sample_rate
+        alpha = math.sin(w0) / (2 * q)
+        cos_w0 = math.cos(w0)
+        b1 = 1 - cos_w0
+        return np.array(
+            [b1 / 2, b1, b1 / 2, 1 + alpha, -2 * cos_w0, 1 - alpha], dtype=np.float64
+        )
+
+    @staticmethod
+    def notch_section(frequency: float, sample_rate: float, q: float = 5) -> np.ndarray:
+        """Designs a second order notch section (Audio EQ Cookbook)
+
+        Args:
+            frequency (float): frequency to remove in Hz
+            sample_rate (float): samples per second
+            q (float, optional): quality factor, higher is narrower. Defaults to 5.
+
+        Returns:
+            np.ndarray: [b0, b1, b2, a0, a1, a2]
+        """
+        w0 = 2 * math.pi * frequency / sample_rate
+        alpha = math.sin(w0) / (2 * q)
+        cos_w0 = math.cos(w0)
+        return np.array(
+            [1, -2 * cos_w0, 1, 1 + alpha, -2 * cos_w0, 1 - alpha], dtype=np.float64
+        )
+
+    @staticmethod
+    def design(
+        sample_rate: float,
+        lowpass: float = None,
+        lowpass_order: int = 2,
+        notches: list[float] = (),
+        notch_q: float = 5,
+    ) -> "BiquadFilter":
+        """Designs a Butterworth low pass filter and any number of notches
+
+        Args:
+            sample_rate (float): samples per second
+            lowpass (float, optional): low pass cutoff in Hz. Defaults to None, no low pass.
+            lowpass_order (int, optional): order of the low pass, rounded up to even.
+            Defaults to 2.
+            notches (list[float], optional): frequencies to remove in Hz. Defaults to none.
+            notch_q (float, optional): quality factor of the notches. Defaults to 5.
+
+        Returns:
+            BiquadFilter: the filter
+        """
+        sections = []
+        if lowpass is not None:
+            pairs = math.ceil(lowpass_order / 2)
+            for k in range(1, pairs + 1):
+                q = 1 / (2 * math.sin((2 * k - 1) * math.pi / (4 * pairs)))
+                sections.append(BiquadFilter.lowpass_section(lowpass, sample_rate, q))
+        for frequency in notches:
+            if frequency < sample_rate / 2:  # can't remove what can't be seen
+                sections.append(
+                    BiquadFilter.notch_section(frequency, sample_rate, notch_q)
+                )
+        if len(sections) == 0:
+            sections.append([1, 0, 0, 1, 0, 0])
+        return BiquadFilter(np.array(sections), sample_rate)
+
+    @staticmethod
+    def from_config(config: dict) -> "BiquadFilter":
+        """Designs the force filter described in the load cell config, under
+        "force_filter": {"lowpass": Hz, "lowpass_order": n, "notches": [Hz, ...],
+        "notch_q": q, "sample_rate": Hz}. The sample rate defaults to the board's report
+        rate if configure() saved one, or else 80Hz.
+
+        Args:
+            config (dict): load cell config
+
+        Returns:
+            BiquadFilter: the filter, or None if the config doesn't ask for one
+        """
+        settings = config.get("force_filter", None)
+        if not settings:
+            return None
+        sample_rate = settings.get("sample_rate", None)
+        if sample_rate is None:
+            sample_rate = 1000 / config.get("report_period", 12.5)
+        return BiquadFilter.design(
+            sample_rate,
+            settings.get("lowpass", None),
+            settings.get("lowpass_order", 2),
+            settings.get("notches", ()),
+            settings.get("notch_q", 5),
+        )
+
+    def reset(self):
+        """Forgets all history, so the next sample starts the filter fresh"""
+        self.state[:] = 0
+        self.started = False
+        self.last_value = None
+        self.last_time = None
+
+    def start(self, value: float):
+        """Sets the state as if the input had been steady at a value forever
+
+        Args:
+            value (float): the steady input
+        """
+        for section, state in zip(self.sections, self.state):
+            b0, b1, b2, _, a1, a2 = section
+            output = value * (b0 + b1 + b2) / (1 + a1 + a2)
+            state[1] = b2 * value - a2 * output
+            state[0] = b1 * value - a1 * output + state[1]
+            value = output
+        self.started = True
+
+    def process(self, values: np.ndarray) -> np.ndarray:
+        """Filters the next samples in the stream
+
+        Args:
+            values (np.ndarray): next input samples
+
+        Returns:
+            np.ndarray: filtered samples
+        """
+        output = np.array(values, dtype=np.float64)
+        if len(output) == 0:
+            return output
+        if not self.started:
+            self.start(output[0])
+        for section, state in zip(self.sections, self.state):
+            b0, b1, b2, _, a1, a2 = section
+            s0, s1 = state
+            for i, x in enumerate(output):
+                y = b0 * x + s0
+                s0 = b1 * x - a1 * y + s1
+                s1 = b2 * x - a2 * y
+                output[i] = y
+            state[:] = s0, s1
+        return output
+
+    def differentiate(self, filtered: np.ndarray, times: np.ndarray) -> np.ndarray:
+        """Differentiates the filtered stream by backwards difference
+
+        Args:
+            filtered (np.ndarray): next filtered samples, from process()
+            times (np.ndarray): time of each sample in seconds
+
+        Returns:
+            np.ndarray: rate of change at each sample in units per second, NaN for the
+            first sample since the last reset
+        """
+        if len(filtered) == 0:
+            return np.empty(0)
+        prev_values = np.empty_like(filtered)
+        prev_values[0] = math.nan if self.last_value is None else self.last_value
+        prev_values[1:] = filtered[:-1]
+        prev_times = np.empty_like(times)
+        prev_times[0] = math.nan if self.last_time is None else self.last_time
+        prev_times[1:] = times[:-1]
+        self.last_value = filtered[-1]
+        self.last_time = times[-1]
+        dt = times - prev_times
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(dt > 0, (filtered - prev_values) / dt, math.nan)
+
+    def batch(
+        self, values: np.ndarray, times: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Filters and differentiates a whole recorded signal, exactly as if it had been
+        streamed through a freshly reset copy of this filter. Doesn't touch this filter's
+        own state.
+
+        Args:
+            values (np.ndarray): input samples
+            times (np.ndarray): time of each sample in seconds
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: filtered samples, and their rate of change
+        """
+        fresh = BiquadFilter(self.sections, self.sample_rate)
+        filtered = fresh.process(values)
+        return filtered, fresh.differentiate(filtered, times)
+
+    def response(self, frequency: float) -> complex:
+        """Gets the filter's complex frequency response
+
+        Args:
+            frequency (float): frequency in Hz
+
+        Returns:
+            complex: gain and phase at that frequency
+        """
+        z = np.exp(-2j * math.pi * frequency / self.sample_rate * np.arange(3))
+        return complex(
+            np.prod(self.sections[:, :3] @ z) / np.prod(self.sections[:, 3:] @ z)
+        )
+
+    def group_delay(self, frequency: float = 0) -> float:
+        """Gets how long the filter delays a signal, for signals slower than the cutoff.
+        Forces that change slowly compared to the cutoff come out this much late.
+
+        Args:
+            frequency (float, optional): frequency in Hz. Defaults to 0, steady signals.
+
+        Returns:
+            float: delay in seconds
+        """
+        z = np.exp(-2j * math.pi * frequency / self.sample_rate * np.arange(3))
+        k = np.arange(3)
+        numerator = (self.sections[:, :3] * k) @ z / (self.sections[:, :3] @ z)
+        denominator = (self.sections[:, 3:] * k) @ z / (self.sections[:, 3:] @ z)
+        return float(np.sum(numerator.real - denominator.real)) / self.sample_rate
+
+    def rate_delay(self) -> float:
+        """Gets how late the rate from differentiate() is, for slowly changing force. The
+        backwards difference adds half a sample on top of the filter's own delay.
+
+        Returns:
+            float: delay in seconds
+        """
+        return self.group_delay() + 0.5 / self.sample_rate
+
+
+def sum_runs(
+    bins: np.ndarray, values: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Sums values over each run of consecutive equal bin indices, skipping NaNs
+
+    Args:
+        bins (np.ndarray): bin index of each value, in order
+        values (np.ndarray): values, one row per bin index
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: bin index of each run, sum of its
+        values, and number of values that weren't NaN
+    """
+    starts = np.flatnonzero(np.diff(bins, prepend=bins[0] - 1))
+    valid = ~np.isnan(values)
+    sums = np.add.reduceat(np.where(valid, values, 0.0), starts)
+    counts = np.add.reduceat(valid.astype(np.int64), starts)
+    return bins[starts], sums, counts
+
+
+class CalibrationCurve:
+    """Polynomial mapping raw readings to calibrated force, in terms of the reading minus
+    the tare so a new tare shifts the curve without refitting it. The conversion is
+    compiled into a closure when the curve is made, so converting a reading is just
+    arithmetic, and works the same on a single reading or a whole array of them."""
+
+    def __init__(self, coefficients: list[float], tare: float = 0):
+        """Create a calibration curve
+
+        Args:
+            coefficients (list[float]): polynomial coefficients, highest power first, of
+            force as a function of raw reading minus tare
+            tare (float, optional): raw reading with no load. Defaults to 0.
+        """
+        self.coefficients = [float(c) for c in coefficients]
+        """Polynomial coefficients, highest power first"""
+        self.tare = float(tare)
+        """Raw reading with no load"""
+        self.convert = self.compile()
+        """Compiled conversion from raw reading to force"""
+
+    def compile(self) -> Callable:
+        """Builds the conversion function, with the coefficients bound as locals
+
+        Returns:
+            Callable: converts a raw reading or array of them to force
+        """
+        tare = self.tare
+        if len(self.coefficients) == 2:  # the usual linear case
+            slope, intercept = self.coefficients
+            return lambda raw: (raw - tare) * slope + intercept
+
+        first, *rest = self.coefficients
+
+        def convert(raw):
+            x = raw - tare
+            result = first
+            for coefficient in rest:  # Horner's method
+                result = result * x + coefficient
+            return result
+
+        return convert
+
+    def __call__(self, raw):
+        """Converts raw readings to force
+
+        Args:
+            raw (float | np.ndarray): raw reading or array of them
+
+        Returns:
+            float | np.ndarray: force in calibrated units
+        """
+        return self.convert(raw)
+
+    def with_tare(self, tare: float) -> "CalibrationCurve":
+        """Makes a copy of this curve with a new tare
+
+        Args:
+            tare (float): new raw reading with no load
+
+        Returns:
+            CalibrationCurve: the same curve, shifted to the new tare
+        """
+        return CalibrationCurve(self.coefficients, tare)
+
+    @staticmethod
+    def fit(
+        raws: np.ndarray, forces: np.ndarray, degree: int = 1, tare: float = 0
+    ) -> tuple["CalibrationCurve", np.ndarray]:
+        """Fits a calibration curve to readings taken at known forces. The curve has no
+        constant term, so it's pinned to zero force at the tare.
+
+        Args:
+            raws (np.ndarray): raw readings
+            forces (np.ndarray): force at each reading
+            degree (int, optional): polynomial degree. Defaults to 1.
+            tare (float, optional): raw reading with no load. Defaults to 0.
+
+        Returns:
+            tuple[CalibrationCurve, np.ndarray]: the curve, and the residual force at each
+            reading
+        """
+        raws = np.asarray(raws, dtype=np.float64)
+        forces = np.asarray(forces, dtype=np.float64)
+        # Powers from degree down to 1, leaving out the constant column
+        powers = np.vander(raws - tare, degree + 1)[:, :-1]
+        coefficients = np.linalg.lstsq(powers, forces, rcond=None)[0]
+        curve = CalibrationCurve([*coefficients, 0.0], tare)
+        return curve, forces - curve(raws)
+
+    @staticmethod
+    def from_config(config: dict) -> "CalibrationCurve":
+        """Builds the calibration curve stored in a load cell config
+
+        Args:
+            config (dict): load cell config
+
+        Returns:
+            CalibrationCurve: the multi-point curve if there is one, otherwise the linear
+            curve from the single-weight calibration, or None if not calibrated
+        """
+        if not all(key in config for key in ("tare", "calibration", "units")):
+            return None
+        if "calibration_curve" in config:
+            return CalibrationCurve(
+                config["calibration_curve"]["coefficients"], config["tare"]
+            )
+        return CalibrationCurve([1 / config["calibration"], 0], config["tare"])
+
+
+class DriftModel:
+    """Model of the load cell's zero reading drifting over time, as exponential creep
+    plus linear drift: a + b*t + c*exp(-t/tau), with t in seconds since start_time. Fit to
+    readings taken while the load cell is unloaded, which are kept as per-bin means so
+    memory stays bounded. For each time constant on a fixed grid the rest of the model is
+    linear, so it's fit by least squares at each and the best one is kept. Time constants
+    the data can't tell apart from a constant or linear drift are left out, since those
+    fits have large terms that nearly cancel and run away when extrapolated."""
+
+    TIME_CONSTANTS = np.geomspace(2, 2000, 40)
+    """Creep time constants to try, in seconds"""
+    MIN_BINS = 10
+    """Number of bins needed before fitting"""
+    RESOLVED_TIME_CONSTANTS = 3
+    """Number of fitted time constants the data has to span before the creep is trusted
+    to have settled, so a slow creep isn't mistaken for linear drift"""
+    MAX_EXTRAPOLATION = 300
+    """Default longest time in seconds past the latest bin to extrapolate the fit"""
+    MAX_CONDITION = 100
+    """Largest condition number of the fit's design matrix, with its columns scaled to
+    unit length, to accept a creep time constant at"""
+    SIGNIFICANCE = 9
+    """How many residual variances a fit has to cut the sum of squared errors by to count
+    as better, so curvature in the noise isn't taken for creep. About three standard
+    errors, since many time constants are tried."""
+
+    def __init__(
+        self,
+        start_time: float,
+        bin_width: float = 1,
+        max_bins: int = 7200,
+        max_extrapolation: float = MAX_EXTRAPOLATION,
+    ):
+        """Create a drift model with no data yet
+
+        Args:
+            start_time (float): host time creep started, usually when the load was
+            removed, in unix seconds
+            bin_width (float, optional): seconds of readings averaged into each bin. Defaults to 1.
+            max_bins (int, optional): number of bins to fit over. Defaults to 7200.
+            max_extrapolation (float, optional): longest time in seconds past the latest
+            bin to extrapolate the fit. Defaults to MAX_EXTRAPOLATION.
+        """
+        self.start_time = start_time
+        """Host time creep started, in unix seconds"""
+        self.bin_width = bin_width
+        """Seconds of readings averaged into each bin"""
+        self.bin_times: deque[float] = deque(maxlen=max_bins)
+        """Center of each closed bin, in seconds since start_time"""
+        self.max_extrapolation = max_extrapolation
+        """Longest time in seconds past the latest bin to extrapolate the fit, after which
+        it's held, so a small slope fit over a short idle period can't run away over a
+        long test"""
+        self.bin_means: deque[float] = deque(maxlen=max_bins)
+        """Mean raw reading in each closed bin"""
+        self.open_bin: int = None
+        """Index of the bin currently being filled"""
+        self.bin_sum = 0.0
+        """Sum of raw readings in the open bin"""
+        self.bin_count = 0
+        """Number of raw readings in the open bin"""
+        self.params: tuple[float, float, float, float] = None
+        """Fitted a, b, c, and tau, or None if not fit yet"""
+        self.residual_std = math.nan
+        """Standard deviation of the bin means around the fit"""
+        self.resolved = False
+        """Whether the best fitting time constant was one the data could resolve. If not,
+        the creep is slower than the data shows, or there's none and only noise was fit,
+        so the model falls back to no creep."""
+
+    def add(self, sample_times: np.ndarray, raws: np.ndarray):
+        """Adds unloaded readings to the model. Doesn't refit it.
+
+        Args:
+            sample_times (np.ndarray): host times the readings were taken, in unix seconds
+            raws (np.ndarray): raw readings
+        """
+        if len(raws) == 0:
+            return
+        bins = np.floor((sample_times - self.start_time) / self.bin_width).astype(
+            np.int64
+        )
+        runs = sum_runs(bins, raws.astype(np.float64))
+        for index, total, count in zip(*runs):
+            if index != self.open_bin:
+                self.close_bin()
+                self.open_bin = index
+            self.bin_sum += total
+            self.bin_count += count
+
+    def close_bin(self):
+        """Finishes the open bin, if it has any readings"""
+        if self.bin_count > 0:
+            self.bin_times.append((self.open_bin + 0.5) * self.bin_width)
+            self.bin_means.append(self.bin_sum / self.bin_count)
+        self.bin_sum = 0.0
+        self.bin_count = 0
+
+    def fit(self, drift: bool = True) -> bool:
+        """Fits the model to the closed bins
+
+        Args:
+            drift (bool, optional): whether to fit the linear drift term. Leave it out
+            to judge whether creep has settled, since over a short time a slow creep
+            fits about as well as linear drift plus a fast creep. Defaults to True.
+
+        Returns:
+            bool: whether there was enough data to fit
+        """
+        if len(self.bin_means) < DriftModel.MIN_BINS:
+            return False
+        t = np.array(self.bin_times)
+        y = np.array(self.bin_means)
+        linear = np.column_stack((np.ones_like(t), t) if drift else (np.ones_like(t),))
+
+        def params(coefficients: np.ndarray, c: float, tau: float) -> tuple:
+            b = coefficients[1] if drift else 0.0
+            return (coefficients[0], b, c, tau)
+
+        # No creep at all is a candidate too, and the fallback if the data can't
+        # resolve the creep or it isn't clearly there
+        coefficients = np.linalg.lstsq(linear, y, rcond=None)[0]
+        no_creep_sse = np.sum((linear @ coefficients - y) ** 2)
+        no_creep = params(coefficients, 0.0, 1.0)
+        best_sse, best = no_creep_sse, no_creep
+        fits = []
+        for tau in DriftModel.TIME_CONSTANTS:
+            design = np.column_stack((linear, np.exp(-t / tau)))
+            coefficients = np.linalg.lstsq(design, y, rcond=None)[0]
+            sse = np.sum((design @ coefficients - y) ** 2)
+            scaled = design / np.linalg.norm(design, axis=0)
+            usable = np.linalg.cond(scaled) <= DriftModel.MAX_CONDITION
+            fits.append((sse, params(coefficients, coefficients[-1], tau), usable))
+        # Slower creep is harder to resolve, so the usable time constants start the
+        # grid. The best fit may lie beyond either end of them, so the ends don't count.
+        usable_count = sum(usable for _, _, usable in fits)
+        unresolved_sse = math.inf
+        for i, (sse, fit_params, _) in enumerate(fits):
+            if i == 0 or i >= usable_count - 1:
+                unresolved_sse = min(unresolved_sse, sse)
+            elif sse < best_sse:
+                best_sse, best = sse, fit_params
+        margin = DriftModel.SIGNIFICANCE * best_sse / max(len(y) - 4, 1)
+        self.resolved = unresolved_sse >= best_sse - margin
+        if not self.resolved or best_sse > no_creep_sse - margin:
+            best_sse, best = no_creep_sse, no_creep
+        self.params = tuple(float(p) for p in best)
+        self.residual_std = math.sqrt(best_sse / max(len(y) - 4, 1))
+        return True
+
+    def zero(self, sample_times: np.ndarray) -> np.ndarray:
+        """Predicts the unloaded reading
+
+        Args:
+            sample_times (np.ndarray): host times in unix seconds
+
+        Returns:
+            np.ndarray: predicted raw reading with no load at each time
+        """
+        a, b, c, tau = self.params
+        t = np.minimum(
+            sample_times - self.start_time, self.bin_times[-1] + self.max_extrapolation
+        )
+        return a + b * t + c * np.exp(-t / tau)
+
+    def creep_remaining(self) -> float:
+        """Gets how much the fitted creep has left to go, as of the latest bin
+
+        Returns:
+            float: remaining creep in raw counts, or inf if not fit yet
+        """
+        if self.params is None:
+            return math.inf
+        _, _, c, tau = self.params
+        return abs(c) * math.exp(-self.bin_times[-1] / tau)
+
+    def creep_settled(self, tolerance: float) -> bool:
+        """Whether the creep has settled to within a tolerance. Only trusted once the
+        fitted time constant is well inside the data, and no time constant the data
+        can't resolve fits better, since a creep slower than that fits about as well as
+        linear drift. If no creep was found, there must be no drift worth mentioning
+        over the data either. Best judged from a fit without the drift term, see fit().
+
+        Args:
+            tolerance (float): remaining creep to accept, in raw counts
+
+        Returns:
+            bool: True if the creep has settled
+        """
+        if self.params is None or not self.resolved:
+            return False
+        _, b, c, tau = self.params
+        span = self.bin_times[-1]
+        if c == 0:
+            return abs(b) * span < tolerance
+        resolved = tau * DriftModel.RESOLVED_TIME_CONSTANTS <= span
+        return resolved and self.creep_remaining() < tolerance
+
+
+TEMPERATURE_DTYPE = np.dtype(
+    [("time", np.float64), ("local_temp", np.float64), ("remote_temp", np.float64)]
+)
+"""Layout of one temperature log entry: center of the interval in host unix seconds, and
+mean local and remote temperatures over it in C (NaN if not reported)"""
+
+
+class TemperatureLog:
+    """The board's temperature readings averaged over fixed intervals, since temperature
+    changes far slower than force. Keeps a fixed number of intervals, overwriting the
+    oldest."""
+
+    def __init__(self, interval: float = 1, capacity: int = 86400):
+        """Create an empty temperature log
+
+        Args:
+            interval (float, optional): seconds per entry. Defaults to 1.
+            capacity (int, optional): number of entries to keep. Defaults to 86400.
+        """
+        self.interval = interval
+        """Seconds per entry"""
+        self.capacity = capacity
+        """Number of entries kept"""
+        self.records = np.full(capacity, np.nan, dtype=TEMPERATURE_DTYPE)
+        """Entries, used as a circular buffer"""
+        self.seq = 0
+        """Total number of entries ever written"""
+        self.open_bin: int = None
+        """Index of the interval currently being averaged"""
+        self.bin_sums = np.zeros(2)
+        """Sums of local and remote temperatures in the open interval"""
+        self.bin_counts = np.zeros(2, dtype=np.int64)
+        """Number of local and remote temperatures in the open interval"""
+
+    def add(
+        self,
+        sample_times: np.ndarray,
+        local_temps: np.ndarray,
+        remote_temps: np.ndarray,
+    ):
+        """Adds temperature readings to the log
+
+        Args:
+            sample_times (np.ndarray): host times in unix seconds
+            local_temps (np.ndarray): local temperatures in C, NaN if not reported
+            remote_temps (np.ndarray): remote temperatures in C, NaN if not reported
+        """
+        if len(sample_times) == 0:
+            return
+        bins = np.floor(sample_times / self.interval).astype(np.int64)
+        runs = sum_runs(bins, np.column_stack((local_temps, remote_temps)))
+        for index, sums, counts in zip(*runs):
+            if index != self.open_bin:
+                self.close_bin()
+                self.open_bin = index
+            self.bin_sums += sums
+            self.bin_counts += counts
+
+    def close_bin(self):
+        """Finishes the open interval, if it has any readings"""
+        if self.bin_counts.any():
+            with np.errstate(invalid="ignore"):
+                means = self.bin_sums / self.bin_counts
+            self.records[self.seq % self.capacity] = (
+                (self.open_bin + 0.5) * self.interval,
+                *means,
+            )
+            self.seq += 1
+        self.bin_sums[:] = 0
+        self.bin_counts[:] = 0
+
+    def latest(self, field: str) -> float:
+        """Gets the most recent temperature, including the interval still being averaged
+
+        Args:
+            field (str): "local_temp" or "remote_temp"
+
+        Returns:
+            float: temperature in C, or NaN if none reported
+        """
+        column = 0 if field == "local_temp" else 1
+        if self.bin_counts[column] > 0:
+            return self.bin_sums[column] / self.bin_counts[column]
+        if self.seq == 0:
+            return math.nan
+        return float(self.records[(self.seq - 1) % self.capacity][field])
+
+    def history(self) -> np.ndarray:
+        """Gets every entry kept, oldest first
+
+        Returns:
+            np.ndarray: entries with fields time, local_temp, and remote_temp
+        """
+        count = min(self.seq, self.capacity)
+        indices = np.arange(self.seq - count, self.seq) % self.capacity
+        return self.records[indices]
+
+
+class DeviceClock:
+    """Maps the OpenScale's own timestamps onto the host clock, so samples can be timed by
+    when the board took them instead of when USB and the OS got around to delivering
+    them. Arrival time is board time plus a clock offset, a slow drift between the two
+    crystals, and a transport delay that is never negative. So the smallest arrival delay
+    in each window of board time marks the offset most closely, and a line fit through
+    those minima gives the offset and drift. Handles the board's counter wrapping around,
+    and starts over if the board resets."""
+
+    def __init__(self, wrap_period: float, window: float = 5, windows_kept: int = 60):
+        """Create a clock mapping with no data yet
+
+        Args:
+            wrap_period (float): seconds of board time before its counter wraps back to zero
+            window (float, optional): seconds of board time per minimum-delay window. Defaults to 5.
+            windows_kept (int, optional): number of windows to fit offset and drift over. Defaults to 60.
+        """
+        self.wrap_period = wrap_period
+        """Seconds of board time before its counter wraps back to zero"""
+        self.window = window
+        """Seconds of board time per minimum-delay window"""
+        self.minima: deque[tuple[float, float]] = deque(maxlen=windows_kept)
+        """Board time and smallest arrival delay of each closed window"""
+        self.window_start: float = None
+        """Board time the current window started"""
+        self.window_min = (math.nan, math.inf)
+        """Board time and arrival delay of the smallest delay in the current window"""
+        self.last_device_time: float = None
+        """Last board time seen, before unwrapping"""
+        self.wrap_offset = 0.0
+        """Time added to board time to account for counter wraparounds"""
+        self.offset = math.nan
+        """Host time minus board time at the reference board time"""
+        self.drift = 0.0
+        """Host seconds gained per board second, minus one"""
+        self.reference = 0.0
+        """Board time the offset is measured at"""
+        self.reset_count = 0
+        """Number of times the board clock was seen to restart"""
+
+    def reset(self):
+        """Forget everything about the board clock"""
+        self.minima.clear()
+        self.window_start = None
+        self.window_min = (math.nan, math.inf)
+        self.last_device_time = None
+        self.wrap_offset = 0.0
+        self.offset = math.nan
+        self.drift = 0.0
+
+    def unwrap(self, device_times: np.ndarray) -> np.ndarray:
+        """Turns wrapped board timestamps into continuously increasing ones
+
+        Args:
+            device_times (np.ndarray): board times in seconds as reported
+
+        Returns:
+            np.ndarray: board times in seconds with wraparounds removed
+        """
+        previous = np.concatenate(
+            (
+                [
+                    (
+                        device_times[0]
+                        if self.last_device_time is None
+                        else self.last_device_time
+                    )
+                ],
+                device_times[:-1],
+            )
+        )
+        wrapped = previous - device_times > self.wrap_period / 2
+        unwrapped = (
+            device_times + self.wrap_offset + np.cumsum(wrapped) * self.wrap_period
+        )
+        self.wrap_offset += np.count_nonzero(wrapped) * self.wrap_period
+        self.last_device_time = float(device_times[-1])
+        return unwrapped
+
+    def update(self, device_times: np.ndarray, arrival_time: float) -> np.ndarray:
+        """Updates the mapping with a batch of samples that had all arrived by a given host
+        time, and maps their board times onto the host clock
+
+        Args:
+            device_times (np.ndarray): board times in seconds as reported
+            arrival_time (float): host time by which all of these samples had arrived
+
+        Returns:
+            np.ndarray: host times the samples were taken, in unix seconds
+        """
+        if len(device_times) == 0:
+            return np.empty(0)
+
+        # A small step backwards means the board restarted, not that its counter wrapped
+        previous = np.concatenate(
+            (
+                [
+                    (
+                        device_times[0]
+                        if self.last_device_time is None
+                        else self.last_device_time
+                    )
+                ],
+                device_times[:-1],
+            )
+        )
+        restarts = np.flatnonzero(
+            (previous > device_times)
+            & (previous - device_times <= self.wrap_period / 2)
+        )
+        if len(restarts) > 0:
+            first = restarts[0]
+            before = self.update(device_times[:first], arrival_time)
+            self.reset()
+            self.reset_count += 1
+            return np.concatenate(
+                (before, self.update(device_times[first:], arrival_time))
+            )
+
+        unwrapped = self.unwrap(device_times)
+        delays = arrival_time - unwrapped
+        i = int(np.argmin(delays))
+        if self.window_start is None:
+            self.window_start = unwrapped[0]
+            self.reference = unwrapped[0]
+        if delays[i] < self.window_min[1]:
+            self.window_min = (unwrapped[i], delays[i])
+        if unwrapped[-1] - self.window_start >= self.window:
+            self.minima.append(self.window_min)
+            self.window_start = unwrapped[-1]
+            self.window_min = (math.nan, math.inf)
+        self._fit()
+        return self.to_host(unwrapped)
+
+    def _fit(self):
+        """Fits offset and drift to the minimum delays seen so far"""
+        points = list(self.minima)
+        if not math.isnan(self.window_min[0]):
+            points.append(self.window_min)
+        if len(points) == 0:
+            return
+        times, delays = np.array(points).T
+        if len(points) < 3 or times[-1] - times[0] < self.window:
+            self.drift = 0.0
+            self.offset = delays.min()
+        else:
+            self.drift, self.offset = np.polyfit(times - self.reference, delays, 1)
+
+    def to_host(self, unwrapped: np.ndarray) -> np.ndarray:
+        """Maps unwrapped board times onto the host clock with the current fit
+
+        Args:
+            unwrapped (np.ndarray): board times in seconds with wraparounds removed
+
+        Returns:
+            np.ndarray: host times in unix seconds
+        """
+        return unwrapped + self.offset + self.drift * (unwrapped - self.reference)
+
+
+BINARY_SYNC = b"\xa5\x5a"
+"""First two bytes of every binary frame from the OpenScale firmware"""
+BINARY_FRAME_SIZE = 12
+"""Length of a binary frame in bytes"""
+BINARY_FRAME_DTYPE = np.dtype(
+    [
+        ("sync", "<u2"),
+        ("seq", "<u2"),
+        ("micros", "<u4"),
+        ("raw", "u1", 3),
+        ("crc", "u1"),
+    ]
+)
+"""Layout of a binary frame as sent by the firmware, see OpenScale/openscale.h"""
+BINARY_SAMPLE_DTYPE = np.dtype(
+    [("seq", np.int64), ("micros", np.int64), ("raw", np.int64)]
+)
+"""Layout of a decoded binary frame"""
+
+
+def _make_crc8_table() -> np.ndarray:
+    """Builds the lookup table for CRC-8 with polynomial 0x07, as used by the firmware"""
+    table = np.zeros(256, dtype=np.uint8)
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x07) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+        table[i] = crc
+    return table
+
+
+CRC8_TABLE = _make_crc8_table()
+"""CRC-8 lookup table for checking binary frames"""
+
+
+class BinaryFrameDecoder:
+    """Decodes the OpenScale firmware's binary output, a stream of fixed-size frames with a
+    sync header, sequence number, microsecond timestamp, 24-bit raw reading, and CRC-8.
+    Whole frames are checked and unpacked with array operations. When the stream is
+    aligned, frames are read straight out of the received bytes without copying. Bytes
+    that don't belong to a valid frame are skipped, and gaps in the sequence numbers are
+    counted as dropped frames."""
+
+    def __init__(self):
+        self.remainder = b""
+        """Bytes at the end of the last chunk that may be the start of a frame"""
+        self.last_seq: int = None
+        """Sequence number of the last decoded frame"""
+        self.frame_count = 0
+        """Number of valid frames decoded"""
+        self.dropped_frames = 0
+        """Number of frames missing according to gaps in the sequence numbers"""
+        self.skipped_bytes = 0
+        """Number of bytes thrown away because they weren't part of a valid frame"""
+
+    @staticmethod
+    def crc8(frames: np.ndarray) -> np.ndarray:
+        """Computes the CRC of many frames at once
+
+        Args:
+            frames (np.ndarray): uint8 array with one frame per row
+
+        Returns:
+            np.ndarray: CRC-8 of bytes 2 through 10 of each frame
+        """
+        crc = np.zeros(len(frames), dtype=np.uint8)
+        for column in range(2, BINARY_FRAME_SIZE - 1):
+            crc = CRC8_TABLE[crc ^ frames[:, column]]
+        return crc
+
+    def decode(self, data: bytes) -> np.ndarray:
+        """Decodes every complete frame in a chunk of the byte stream. Incomplete frames
+        at the end are kept and finished off by the next chunk.
+
+        Args:
+            data (bytes): next chunk of bytes from the OpenScale
+
+        Returns:
+            np.ndarray: decoded frames with fields seq, micros, and raw
+        """
+        buffer = self.remainder + data if self.remainder else data
+        stream = np.frombuffer(memoryview(buffer), dtype=np.uint8)
+        n = len(stream) // BINARY_FRAME_SIZE
+
+        # Fast path: the stream is aligned and every frame is intact
+        rows = stream[: n * BINARY_FRAME_SIZE].reshape(n, BINARY_FRAME_SIZE)
+        if (
+            n > 0
+            and np.all(rows[:, 0] == BINARY_SYNC[0])
+            and np.all(rows[:, 1] == BINARY_SYNC[1])
+            and np.array_equal(BinaryFrameDecoder.crc8(rows), rows[:, -1])
+        ):
+            frames = np.frombuffer(memoryview(buffer), BINARY_FRAME_DTYPE, count=n)
+            self.remainder = buffer[n * BINARY_FRAME_SIZE :]
+            return self._unpack(frames["seq"], frames["raw"], frames["micros"])
+
+        # Slow path: look for every sync header that has a valid frame behind it
+        starts = np.flatnonzero(
+            (stream[:-1] == BINARY_SYNC[0]) & (stream[1:] == BINARY_SYNC[1])
+        )
+        complete = starts[starts + BINARY_FRAME_SIZE <= len(stream)]
+        rows = stream[complete[:, None] + np.arange(BINARY_FRAME_SIZE)]
+        valid = complete[BinaryFrameDecoder.crc8(rows) == rows[:, -1]]
+        if (
+            len(valid) > 1
+        ):  # a sync pattern inside a valid frame can't start another one
+            valid = valid[np.concatenate(([True], np.diff(valid) >= BINARY_FRAME_SIZE))]
+        rows = stream[valid[:, None] + np.arange(BINARY_FRAME_SIZE)]
+
+        # Keep anything after the last valid frame that could still become a frame
+        consumed = valid[-1] + BINARY_FRAME_SIZE if len(valid) > 0 else 0
+        incomplete = starts[starts + BINARY_FRAME_SIZE > len(stream)]
+        if len(incomplete) > 0:
+            keep_from = max(int(incomplete[0]), consumed)
+        elif stream[-1:].tobytes() == BINARY_SYNC[:1]:
+            keep_from = len(stream) - 1
+        else:
+            keep_from = len(stream)
+        self.skipped_bytes += keep_from - len(valid) * BINARY_FRAME_SIZE
+        self.remainder = buffer[keep_from:]
+
+        seq = rows[:, 2].astype(np.uint16) | (rows[:, 3].astype(np.uint16) << 8)
+        micros = rows[:, 4:8].copy().view("<u4").ravel()
+        return self._unpack(seq, rows[:, 8:11], micros)
+
+    def _unpack(
+        self, seq: np.ndarray, raw_bytes: np.ndarray, micros: np.ndarray
+    ) -> np.ndarray:
+        """Sign-extends raw readings, counts sequence gaps, and packs decoded frames"""
+        raw = (
+            raw_bytes[:, 0].astype(np.int64)
+            | (raw_bytes[:, 1].astype(np.int64) << 8)
+            | (raw_bytes[:, 2].astype(np.int64) << 16)
+        )
+        raw = (raw ^ 0x800000) - 0x800000
+
+        decoded = np.empty(len(seq), dtype=BINARY_SAMPLE_DTYPE)
+        decoded["seq"] = seq
+        decoded["micros"] = micros
+        decoded["raw"] = raw
+        if len(seq) > 0:
+            previous = np.concatenate(
+                (
+                    [self.last_seq if self.last_seq is not None else int(seq[0]) - 1],
+                    seq[:-1],
+                )
+            ).astype(np.int64)
+            self.dropped_frames += int(np.sum((decoded["seq"] - previous - 1) & 0xFFFF))
+            self.last_seq = int(seq[-1])
+            self.frame_count += len(seq)
+        return decoded
+
+
+RECORDING_MAGIC = b"OSREC01\n"
+"""First bytes of an OpenScale serial recording file"""
+RECORDING_CHUNK_HEADER = struct.Struct("<dI")
+"""Header before each chunk of bytes in a recording: host arrival time in unix seconds
+as a float64, then the chunk length as a uint32"""
+
+
+def read_recording(path: str) -> tuple[np.ndarray, np.ndarray, bytes]:
+    """Loads a serial recording made by SerialRecorder
+
+    Args:
+        path (str): location of the recording file
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, bytes]: host arrival time of each chunk, offset of
+        the end of each chunk in the byte stream, and the whole byte stream
+    """
+    with open(path, "rb") as read_file:
+        contents = read_file.read()
+    if not contents.startswith(RECORDING_MAGIC):
+        raise ValueError(f"{path} is not an OpenScale serial recording")
+
+    times = []
+    ends = []
+    chunks = []
+    end = 0
+    i = len(RECORDING_MAGIC)
+    while i + RECORDING_CHUNK_HEADER.size <= len(contents):
+        chunk_time, length = RECORDING_CHUNK_HEADER.unpack_from(contents, i)
+        i += RECORDING_CHUNK_HEADER.size
+        chunk = contents[i : i + length]
+        i += length
+        end += len(chunk)
+        times.append(chunk_time)
+        ends.append(end)
+        chunks.append(chunk)
+    return np.array(times), np.array(ends, dtype=np.int64), b"".join(chunks)
+
+
+class SerialRecorder:
+    """Wraps an open serial port and appends every chunk of bytes read from it to a
+    compact binary recording, stamped with the host time it arrived. Anything else is
+    passed straight through to the port, so it can stand in for the port itself."""
+
+    def __init__(self, ser: serial.Serial, path: str):
+        """Start recording a serial port
+
+        Args:
+            ser (serial.Serial): port to record
+            path (str): where to save the recording. Overwritten if it already exists.
+        """
+        self.ser = ser
+        """Port being recorded"""
+        self.recording_file = open(path, "wb")
+        """Open recording file"""
+        self.recording_file.write(RECORDING_MAGIC)
+        self.recording_lock = threading.Lock()
+        """Keeps chunks from different threads from interleaving"""
+
+    def record(self, data: bytes) -> bytes:
+        """Append a chunk of bytes to the recording
+
+        Args:
+            data (bytes): bytes that were just read from the port
+
+        Returns:
+            bytes: the same bytes, for chaining
+        """
+        if data:
+            with self.recording_lock:
+                self.recording_file.write(
+                    RECORDING_CHUNK_HEADER.pack(time(), len(data)) + data
+                )
+        return data
+
+    def read(self, size: int = 1) -> bytes:
+        """Read from the port and record what was read"""
+        return self.record(self.ser.read(size))
+
+    def readline(self) -> bytes:
+        """Read a line from the port and record it"""
+        return self.record(self.ser.readline())
+
+    def stop_recording(self) -> serial.Serial:
+        """Close the recording file
+
+        Returns:
+            serial.Serial: the port that was being recorded
+        """
+        with self.recording_lock:
+            self.recording_file.close()
+        return self.ser
+
+    def __getattr__(self, name: str):
+        return getattr(self.ser, name)
+
+
+class ReplaySerial:
+    """Plays back a recording made by SerialRecorder through the parts of the pyserial
+    interface OpenScale uses, so the whole OpenScale API can run on recorded data with no
+    board attached. Each chunk becomes available at its recorded time scaled by the
+    playback speed. Once the recording runs out, reads raise EOFError."""
+
+    def __init__(self, path: str, speed: float = 1.0):
+        """Load a recording for playback
+
+        Args:
+            path (str): location of the recording file
+            speed (float, optional): Playback speed relative to the original recording.
+            Use math.inf or 0 to make everything available immediately. Defaults to 1.0.
+        """
+        self.chunk_times, self.chunk_ends, self.data = read_recording(path)
+        self.speed = speed
+        """Playback speed relative to the original recording"""
+        self.position = 0
+        """Offset of the next byte to be read"""
+        self.start_time = time()
+        """Host time playback started"""
+        self.timeout = None
+        """Read timeout in seconds, like serial.Serial.timeout"""
+        self.is_open = True
+
+    def available_end(self) -> int:
+        """Gets the offset just past the last byte that has arrived so far
+
+        Returns:
+            int: end of the available bytes
+        """
+        if self.speed == 0 or math.isinf(self.speed) or len(self.chunk_times) == 0:
+            return len(self.data)
+        elapsed = (time() - self.start_time) * self.speed
+        arrived = np.searchsorted(
+            self.chunk_times - self.chunk_times[0], elapsed, side="right"
+        )
+        return int(self.chunk_ends[arrived - 1]) if arrived > 0 else 0
+
+    def next_arrival_delay(self) -> float:
+        """Gets how long until the next chunk arrives
+
+        Returns:
+            float: wait time in seconds, 0 if something is already available
+        """
+        arrived = np.searchsorted(self.chunk_ends, self.position, side="right")
+        if arrived >= len(self.chunk_times):
+            return 0
+        elapsed = (time() - self.start_time) * self.speed
+        return max(
+            (self.chunk_times[arrived] - self.chunk_times[0] - elapsed) / self.speed, 0
+        )
+
+    @property
+    def in_waiting(self) -> int:
+        """Number of bytes that have arrived but haven't been read yet"""
+        return self.available_end() - self.position
+
+    def read(self, size: int = 1) -> bytes:
+        """Reads size bytes, waiting for them to arrive, or until timeout if one is set
+
+        Raises:
+            EOFError: if the recording has run out
+
+        Returns:
+            bytes: the bytes read
+        """
+        if self.position >= len(self.data):
+            raise EOFError("End of OpenScale serial recording")
+        deadline = None if self.timeout is None else time() + self.timeout
+        while self.available_end() - self.position < size:
+            if self.available_end() >= len(self.data):
+                break
+            if deadline is not None and time() >= deadline:
+                break
+            sleep(min(self.next_arrival_delay(), 0.01))
+        end = min(self.position + size, self.available_end())
+        data = self.data[self.position : end]
+        self.position = end
+        return data
+
+    def readline(self) -> bytes:
+        """Reads up to and including the next newline, waiting for it to arrive
+
+        Raises:
+            EOFError: if the recording has run out
+
+        Returns:
+            bytes: the line read
+        """
+        line = b""
+        while not line.endswith(b"\n"):
+            end = self.data.find(b"\n", self.position, self.available_end())
+            if end >= 0:
+                line += self.read(end + 1 - self.position)
+            elif self.position >= len(self.data) and line:
+                break
+            else:
+                line += self.read(max(self.in_waiting, 1))
+        return line
+
+    def reset_input_buffer(self):
+        """Does nothing. The recording only holds bytes that were actually read, so any
+        bytes a flush threw away during recording aren't in it to begin with."""
+
+    def write(self, data: bytes) -> int:
+        """Ignores anything written, there's no board to hear it
+
+        Returns:
+            int: number of bytes "written"
+        """
+        return len(data)
+
+    def close(self):
+        """Stop playback"""
+        self.is_open = False
 
 
 class OpenScale:
@@ -16,29 +1925,49 @@ class OpenScale:
     force readings in coherent units from the load cell"""
 
     OLD_READING_KEEP_AMOUNT = 10
-    """How many old readings to keep"""
+    """Default number of old readings to judge outliers against"""
     OUTLIER_QUORUM_AMOUNT = 5
-    """How many points must be within the outlier jump threshold of the new measurement for it to be considered not an outlier."""
+    """Default number of points that must be within the outlier jump threshold of the new measurement for it to be considered not an outlier."""
     OUTLIER_JUMP_THRESHOLD = 10
-    """The maximum acceptable jump in grams between two force readings"""
-
-    def __init__(self):
-        try:
-            self.ser = serial.Serial(self.get_COM_port(), 115200)
-        except serial.SerialException():
-            print(
-                "Could not open port to read load cell. Is the "
-                "OpenScale board plugged in to the computer?"
-            )
+    """Default maximum acceptable jump in grams between two force readings"""
+    DEFAULT_BAUD = 115200
+    """Baud rate the board ships with, used unless baud is set in the config file"""
+    TRIGGER_TIMEOUT = 1
+    """Default seconds to wait for the board to answer a trigger"""
+    READING_LINE_PATTERN = re.compile(rb"^(-?\d+),\r$", re.MULTILINE)
+    """Matches a complete serial line holding just a raw reading, ex: 8355808,CRLF"""
+    claimed_ports: set[str] = set()
+    """Ports opened by any OpenScale in this process, so a second board doesn't grab the
+    first one's port"""
+
+    def __init__(self, ser: serial.Serial = None, board_name: str = None):
+        """Connects to the OpenScale and loads its configuration
 
+        Args:
+            ser (serial.Serial, optional): An already-open port to read from instead of
+            finding the board, such as a ReplaySerial playing back a recording. Defaults
+            to None, which opens the board's port.
+            board_name (str, optional): Name of this board when using more than one. Each
+            named board keeps its own calibration in LoadCell/config_<name>.json. Defaults
+            to None, the main board, which uses LoadCell/config.json.
+        """
+        self.board_name = board_name
+        """Name of this board, or None for the main board"""
         self.outlier_threshold = (
             100  # g, if a measurement is beyond this limit, throw it out
         )
-        self.old_readings = [None] * (
-            OpenScale.OLD_READING_KEEP_AMOUNT + 1
-        )  # also have to store current value
+        self.outlier_filter = OutlierFilter(
+            OpenScale.OLD_READING_KEEP_AMOUNT,
+            OpenScale.OUTLIER_JUMP_THRESHOLD,
+            OpenScale.OUTLIER_QUORUM_AMOUNT,
+        )
+        """Rejects spikes in calibrated measurements. Settings can be overridden in the config
+        file with outlier_history, outlier_jump_threshold, outlier_quorum, and outlier_rule"""
 
-        self.config_path = os.path.join("LoadCell", "config.json")
+        self.config_path = os.path.join(
+            "LoadCell",
+            "config.json" if board_name is None else f"config_{board_name}.json",
+        )
         """Location of load cell config file"""
         self.config: dict
         """Dict of configuration and calibration data for load cell"""
@@ -48,11 +1977,123 @@ class OpenScale:
         """Calibration constant for the load cell"""
         self.units: str
         """Units the load cell is calibrated to report force in"""
+        self.calibration_curve: CalibrationCurve = None
+        """Converts raw readings to force, or None if not calibrated"""
+        self.force_filter: BiquadFilter = None
+        """Smooths and differentiates force as it streams in, or None to not filter. Set
+        with "force_filter" in the config file, see BiquadFilter.from_config()"""
+        self.drift_model: DriftModel = None
+        """Tracks the zero reading drifting, see is_unloaded(). Started by tare() or
+        start_acquisition()"""
         self.outlier_threshold: float
         self.force_limit: float
         """Max allowable force before the rheometer automatically ends the test."""
         self.load_config()
 
+        self.read_timeout: float = self.config.get("read_timeout", 0.1)
+        """Longest a serial read waits for data, in seconds, so nothing hangs on a dead link"""
+        self.stale_after: float = self.config.get("stale_after", 0.5)
+        """Seconds without a new reading before the data counts as stale"""
+        self.reconnect_after: float = self.config.get("reconnect_after", 2)
+        """Seconds without a new reading before the acquisition thread reopens the port"""
+        self.port_identity: dict = None
+        """USB VID, PID, and serial number of the board's port, to find it again if it
+        drops off and comes back under a different name"""
+
+        self.startup_metrics: dict = {}
+        """How finding the board went: port, whether it came from the cached identity,
+        number of ports tried, and seconds from starting the search to the first valid reading"""
+
+        self.sample_buffer: SampleRingBuffer = None
+        """Samples recorded by the acquisition thread, once it has been started"""
+        self.acquisition_thread: threading.Thread = None
+        """Thread that owns the serial port and fills the sample buffer"""
+        self.stop_acquisition_event = threading.Event()
+        """Set to ask the acquisition thread to finish"""
+        self.partial_line: bytes = b""
+        """Incomplete trailing line left over from the last bulk read"""
+        self.garbled_line_count: int = 0
+        """Number of complete lines the bulk reader could not parse as a reading"""
+        self.report_count: int = 0
+        """Number of valid reports recorded by store_reports()"""
+        self.outlier_count: int = 0
+        """Number of those reports rejected as outliers"""
+        self.frame_decoder: BinaryFrameDecoder = (
+            BinaryFrameDecoder() if self.config.get("binary_output", False) else None
+        )
+        """Decodes the firmware's binary output. Only used if binary_output is set in the
+        config file, meaning the board has been switched to binary output in its menu"""
+        self.report_fields: list[str] = []
+        """Fields the board prints in each text report line, in order"""
+        self.report_pattern: re.Pattern = None
+        """Matches a complete text report line with the enabled fields"""
+        self.set_report_fields(self.config.get("report_fields", ["raw"]))
+        self.device_clock: DeviceClock = None
+        """Maps board timestamps onto the host clock, if the board reports them"""
+        if self.frame_decoder is not None:
+            self.device_clock = DeviceClock(2**32 / 1e6)  # micros() wraps
+        elif "timestamp" in self.report_fields:
+            self.device_clock = DeviceClock(2**32 / 1e3)  # millis() wraps
+        self.triggered: bool = self.config.get("serial_trigger", False)
+        """Whether the board only reports when sent the trigger character, see
+        trigger_sample(). Set with configure()"""
+        self.trigger_character: bytes = bytes(
+            (self.config.get("trigger_character", ord("!")),)
+        )
+        """Character that makes the board take a reading in serial trigger mode"""
+        self.trigger_latency = StreamingStats()
+        """Round trip times of trigger_sample() in ms, from sending the trigger to
+        having the reading"""
+        self.trigger_timeouts: int = 0
+        """Number of triggers the board never answered"""
+        self.trigger_lock = threading.Lock()
+        """Keeps two threads from triggering at once and taking each other's reading"""
+
+        self.last_arrival_time: float = time()
+        """Host time the most recent reading arrived"""
+        self.stall_start: float = None
+        """Host time the last reading before the current stall arrived, or None if not stalled"""
+        self.stall_count: int = 0
+        """Number of times readings stopped arriving for longer than stale_after"""
+        self.stall_durations: list[float] = []
+        """How long each finished stall lasted, in seconds"""
+        self.reconnect_count: int = 0
+        """Number of times the port was reopened"""
+        self.last_reconnect_attempt: float = 0
+        """Host time the port was last reopened or tried to be"""
+
+        self.drift_compensation: bool = self.config.get("drift_compensation", False)
+        """Whether to track the zero drifting while unloaded and subtract it from
+        calibrated forces. Off unless turned on in the config file, since it relies on
+        is_unloaded() to know when nothing is pushing on the load cell."""
+        self.unloaded_band: float = self.config.get("unloaded_band", 0.5)
+        """Largest force, in calibrated units, still counted as unloaded for the drift model"""
+        self.unloaded_check: Callable[[], bool] = None
+        """Tells is_unloaded() whether nothing is pushing on the load cell, set by whatever
+        knows when a test is running, ex: for extra boards in a rheometer"""
+        self.temperature_log = TemperatureLog(
+            self.config.get("temperature_interval", 1)
+        )
+        """Temperatures reported by the board, averaged over intervals"""
+        self.temperature_compensation: dict = self.config.get(
+            "temperature_compensation", None
+        )
+        """Which temperature field to compensate for, the force change per degree C, and
+        the reference temperature, from fit_temperature_coefficient(). None to not
+        compensate"""
+        self.drift_fit_interval: float = 5
+        """Seconds between refitting the drift model during acquisition"""
+        self.last_drift_fit: float = 0
+        """Host time the drift model was last fit"""
+
+        if ser is not None:
+            self.ser = ser
+        elif not self.open_port():
+            print(
+                "Could not open port to read load cell. Is the "
+                "OpenScale board plugged in to the computer?"
+            )
+
     def load_config(self) -> dict:
         """Load load cell calibration and configuration info from file"""
         try:
@@ -72,135 +2113,969 @@ class OpenScale:
                         )
         except:
             self.config = {}
+            self.calibration_curve = None
+            self.force_filter = None
+            return self.config
+
+        # Optional sections, each parsed on its own so a bad one doesn't lose the rest
+        self.calibration_curve = self.parse_config_section(
+            "calibration_curve", lambda: CalibrationCurve.from_config(self.config)
+        )
+        self.force_filter = self.parse_config_section(
+            "force_filter", lambda: BiquadFilter.from_config(self.config)
+        )
+        self.outlier_filter = self.parse_config_section(
+            "outlier_rule",
+            lambda: OutlierFilter(
+                self.config.get("outlier_history", OpenScale.OLD_READING_KEEP_AMOUNT),
+                self.config.get(
+                    "outlier_jump_threshold", OpenScale.OUTLIER_JUMP_THRESHOLD
+                ),
+                self.config.get("outlier_quorum", OpenScale.OUTLIER_QUORUM_AMOUNT),
+                self.config.get("outlier_rule", "quorum"),
+            ),
+            self.outlier_filter,
+        )
         return self.config
 
-    def flush_old_lines(self):
-        """Clears existing serial buffer"""
-        self.ser.reset_input_buffer()
+    def parse_config_section(self, key: str, parse: Callable, default=None):
+        """Parses an optional section of the config file. If it's malformed, says which
+        one and uses the default, instead of throwing out the whole config.
+
+        Args:
+            key (str): config key of the section, for the message
+            parse (Callable): builds the section's object from the config
+            default (optional): what to use if the section is rejected. Defaults to None.
+
+        Returns:
+            _type_: what parse returned, or default if it failed
+        """
+        try:
+            return parse()
+        except (KeyError, IndexError, TypeError, ValueError, ArithmeticError) as e:
+            print(f"Ignoring {key} in {self.config_path}, it couldn't be used: {e!r}")
+            return default
+
+    def flush_old_lines(self):
+        """Clears existing serial buffer, and any partial line or frame held over from
+        before it, so it can't be joined onto what arrives next"""
+        self.ser.reset_input_buffer()
+        self.partial_line = b""
+        if self.frame_decoder is not None:
+            self.frame_decoder = BinaryFrameDecoder()
+
+    def start_recording(self, path: str):
+        """Starts recording every byte read from the OpenScale, with arrival times, to a
+        binary file that can be played back later with ReplaySerial
+
+        Args:
+            path (str): where to save the recording
+        """
+        self.ser = SerialRecorder(self.ser, path)
+
+    def stop_recording(self):
+        """Stops recording the OpenScale's serial output"""
+        if isinstance(self.ser, SerialRecorder):
+            self.ser = self.ser.stop_recording()
+
+    def read_until(self, marker: bytes, timeout: float = 5) -> bytes:
+        """Reads serial input until a marker shows up. Only reads what's already waiting, so
+        it can't block past the timeout. Anything after the marker is kept for the next read.
+
+        Args:
+            marker (bytes): text to wait for
+            timeout (float, optional): seconds to wait for it. Defaults to 5.
+
+        Raises:
+            TimeoutError: if the marker didn't show up in time
+
+        Returns:
+            bytes: everything read, up to and including the marker
+        """
+        text = self.partial_line
+        self.partial_line = b""
+        deadline = time() + timeout
+        while marker not in text:
+            if time() > deadline:
+                raise TimeoutError(
+                    f"OpenScale never sent {marker!r}, got {text[-200:]!r}"
+                )
+            waiting = self.ser.in_waiting
+            if waiting:
+                text += self.ser.read(waiting)
+            else:
+                sleep(0.005)
+        end = text.find(marker) + len(marker)
+        self.partial_line = text[end:]
+        return text[:end]
+
+    def enter_menu(self) -> dict:
+        """Stops the board reporting and brings up its configuration menu. The acquisition
+        thread can't be running.
+
+        Returns:
+            dict: current board settings, see parse_menu()
+        """
+        if self.acquisition_thread is not None and self.acquisition_thread.is_alive():
+            raise RuntimeError("Stop acquisition before configuring the OpenScale")
+        self.ser.write(b"x")
+        return parse_menu(self.read_until(MENU_END))
+
+    def menu_command(
+        self, command: bytes, answer: bytes = None, prompt: bytes = b": "
+    ) -> bytes:
+        """Runs one configuration menu command. The menu must already be up.
+
+        Args:
+            command (bytes): menu key, ex: b"8" for average amount
+            answer (bytes, optional): value to enter when the command prompts for one. Defaults to None.
+            prompt (bytes, optional): end of the command's prompt. Defaults to b": ".
+
+        Returns:
+            bytes: everything the board sent in response, ending with the redisplayed menu
+        """
+        self.ser.write(command)
+        text = b""
+        if answer is not None:
+            text = self.read_until(prompt)
+            self.ser.write(answer + b"\r")
+        return text + self.read_until(MENU_END)
+
+    def exit_menu(self):
+        """Closes the configuration menu so the board goes back to reporting"""
+        self.ser.write(b"x")
+        self.read_until(b"Exiting")
+        self.partial_line = b""
+        if self.frame_decoder is not None:
+            self.frame_decoder = BinaryFrameDecoder()
+        if self.device_clock is not None:
+            self.device_clock.reset()
+
+    def configure(
+        self,
+        report_rate: float = None,
+        average: int = None,
+        baud: int = None,
+        decimals: int = None,
+        serial_trigger: bool = None,
+        trigger_character: bytes = None,
+    ) -> dict:
+        """Changes the board's settings through its configuration menu, checks that they
+        took, and reconnects at the new baud rate. The board saves them to its EEPROM, and
+        the baud rate and trigger settings are saved to the config file so the next
+        connection uses them. Settings left as None are not changed.
+
+        Args:
+            report_rate (float, optional): reports per second. The board can only go as fast
+            as its averaging and enabled fields allow, see probe_max_report_rate(). Defaults to None.
+            average (int, optional): number of HX711 readings averaged into each report, 1 to 64. Defaults to None.
+            baud (int, optional): serial baud rate. Defaults to None.
+            decimals (int, optional): decimal places in unit readings, 0 to 4. Defaults to None.
+            serial_trigger (bool, optional): whether the board only reports when sent the
+            trigger character, see trigger_sample(). Defaults to None.
+            trigger_character (bytes, optional): character that triggers a reading. Defaults to None.
+
+        Raises:
+            ValueError: if the board didn't accept a setting
+
+        Returns:
+            dict: board settings afterwards, see parse_menu()
+        """
+        settings = self.enter_menu()
+        try:
+            # Average first, since it limits how fast the board can report
+            if average is not None:
+                settings = parse_menu(self.menu_command(b"8", b"%d" % average))
+            if decimals is not None:
+                settings = parse_menu(self.menu_command(b"7", b"%d" % decimals))
+            if serial_trigger is not None and serial_trigger != settings.get(
+                "serial_trigger"
+            ):
+                settings = parse_menu(self.menu_command(b"t"))
+            if trigger_character is not None:
+                self.ser.write(b"c")
+                self.read_until(b"character: ")
+                self.ser.write(trigger_character)
+                settings = parse_menu(self.read_until(MENU_END))
+            if report_rate is not None:
+                report_period = round(1000 / report_rate)
+                settings = parse_menu(
+                    self.menu_command(b"4", b"%d" % report_period, b"(ms): ")
+                )
+            if baud is not None:
+                self.ser.write(b"5")
+                self.read_until(b">")
+                self.ser.write(b"%d\r" % baud)
+                reply = self.read_until(b"bps\r\n")
+                if b"Going to" in reply:
+                    self.ser.baudrate = baud
+                settings = parse_menu(self.read_until(MENU_END))
+        finally:
+            self.exit_menu()
+
+        requested = {
+            "average": average,
+            "decimals": decimals,
+            "report_period": None if report_rate is None else report_period,
+            "baud": baud,
+            "serial_trigger": serial_trigger,
+            "trigger_character": (
+                None if trigger_character is None else ord(trigger_character)
+            ),
+        }
+        rejected = {
+            name: value
+            for name, value in requested.items()
+            if value is not None and settings.get(name) != value
+        }
+        if rejected:
+            raise ValueError(
+                f"OpenScale rejected {rejected}, its settings are now {settings}"
+            )
+
+        # Save what the host needs to know to talk to the board next time
+        saved = {
+            name: settings[name]
+            for name in ("baud", "serial_trigger", "trigger_character", "report_period")
+            if name in settings
+        }
+        if any(self.config.get(name) != value for name, value in saved.items()):
+            self.config.update(saved)
+            with open(self.config_path, "w") as write_file:
+                json.dump(self.config, write_file)
+            self.force_filter = BiquadFilter.from_config(self.config)
+        self.triggered = settings.get("serial_trigger", self.triggered)
+        if "trigger_character" in settings:
+            self.trigger_character = bytes((settings["trigger_character"],))
+        return settings
+
+    def probe_max_report_rate(
+        self, averages: list[int] = (1,), duration: float = 2
+    ) -> dict[int, float]:
+        """Finds how fast the board can report at each averaging amount. For each one, asks
+        the board for the shortest report period it allows, sets that, and counts how many
+        reports actually arrive. Puts the board's averaging and report rate back afterwards.
+
+        Args:
+            averages (list[int], optional): averaging amounts to try. Defaults to just 1.
+            duration (float, optional): seconds to count reports for at each. Defaults to 2.
+
+        Returns:
+            dict[int, float]: measured reports per second for each averaging amount
+        """
+        original = self.enter_menu()
+        self.exit_menu()
+        rates = {}
+        for average in averages:
+            self.enter_menu()
+            self.menu_command(b"8", b"%d" % average)
+            self.ser.write(b"4")
+            prompt = self.read_until(b"(ms): ")
+            minimum = int(re.search(rb"Minimum: (\d+)ms", prompt).group(1))
+            self.ser.write(b"%d\r" % (minimum + 1))  # must be more than the minimum
+            self.read_until(MENU_END)
+            self.exit_menu()
+
+            self.read_all_readings()  # throw out anything sent before it settled
+            count = 0
+            start_time = time()
+            while time() - start_time < duration:
+                count += len(self.read_all_readings())
+            rates[average] = count / (time() - start_time)
+            print(f"Average {average:2d}: {rates[average]:.1f} reports/s")
+
+        self.configure(
+            report_rate=1000 / original["report_period"], average=original["average"]
+        )
+        return rates
+
+    def get_line(self) -> bytes:
+        """Grabs the next line of serial input from the OpenScale
+
+        Returns:
+            bytes: next line from OpenScale, or b"" if a whole line didn't arrive before
+            the read timeout
+        """
+        line = self.partial_line + self.ser.readline()
+        if not line.endswith(b"\n"):  # timed out partway, finish it next time
+            self.partial_line = line
+            return b""
+        self.partial_line = b""
+        return line
+
+    @staticmethod
+    def ser_to_reading(serial_line: bytes) -> int:
+        """Takes in serial line and returns raw reading reported therein
+
+        Args:
+                serial_line (bytes): a line of load cell serial input
+
+        Returns:
+                int: the load cell reading in that line, or None if it's garbled
+        """
+        try:
+            num_string = serial_line.decode("utf-8")[:-3]  # just get the actual content
+            reading = int(num_string)
+            return reading
+        except (UnicodeDecodeError, ValueError):
+            return None
+
+    def set_report_fields(self, fields: list[str]):
+        """Sets which fields the board prints in each text report line. This has to match
+        what's turned on in the board's menu.
+
+        Args:
+            fields (list[str]): any of "timestamp", "units", "raw", "local_temp", and
+            "remote_temp". "raw" is required.
+        """
+        unknown = set(fields) - set(REPORT_FIELD_PATTERNS)
+        if unknown or "raw" not in fields:
+            raise ValueError(
+                f"Report fields must include raw and come from {list(REPORT_FIELD_PATTERNS)}"
+            )
+        self.report_fields = [
+            field for field in REPORT_FIELD_PATTERNS if field in fields
+        ]
+        if self.report_fields == ["raw"]:
+            self.report_pattern = OpenScale.READING_LINE_PATTERN
+        else:
+            self.report_pattern = re.compile(
+                b"^"
+                + b"".join(REPORT_FIELD_PATTERNS[field] for field in self.report_fields)
+                + b"\r$",
+                re.MULTILINE,
+            )
+
+    def read_all_reports(self) -> np.ndarray:
+        """Reads every byte waiting on the serial port in one call, and parses all the
+        complete reports in it at once. Waits for at least one byte if nothing is waiting.
+        Any incomplete line at the end is kept for the next call, and lines that aren't
+        a report are counted in garbled_line_count instead of being printed.
+
+        Returns:
+            np.ndarray: every complete, valid report, with fields raw, device_time,
+            local_temp, and remote_temp
+        """
+        return self.parse_chunk(self.ser.read(max(self.ser.in_waiting, 1)))
+
+    def parse_chunk(self, chunk: bytes) -> np.ndarray:
+        """Parses the next chunk of the board's serial output, in either text or binary
+        format. Any incomplete line at the end is kept for the next call. Used for both
+        live reads and recordings.
+
+        Args:
+            chunk (bytes): serial output that came right after the last chunk
+
+        Returns:
+            np.ndarray: every complete, valid report, with fields raw, device_time,
+            local_temp, and remote_temp
+        """
+        if self.frame_decoder is not None:
+            frames = self.frame_decoder.decode(chunk)
+            reports = empty_reports(len(frames))
+            reports["raw"] = frames["raw"]
+            reports["device_time"] = frames["micros"] / 1e6
+            return reports
+        buffer = self.partial_line + chunk
+        end = buffer.rfind(b"\n") + 1
+        self.partial_line = buffer[end:]
+        return self.parse_reports(buffer[:end])
+
+    def read_all_readings(self) -> np.ndarray:
+        """Like read_all_reports(), but just returns the raw readings. In serial trigger
+        mode, triggers and returns one reading instead.
+
+        Returns:
+            np.ndarray: raw readings from every complete, valid report, as int64
+        """
+        if self.triggered:
+            reading = self.get_reading()
+            return np.array([] if reading is None else [reading], dtype=np.int64)
+        return self.read_all_reports()["raw"]
+
+    def parse_reports(self, lines: bytes) -> np.ndarray:
+        """Parses a block of complete serial lines into reports
+
+        Args:
+            lines (bytes): one or more complete lines of load cell serial input
+
+        Returns:
+            np.ndarray: every valid report, with fields raw, device_time, local_temp,
+            and remote_temp
+        """
+        matches = self.report_pattern.findall(lines)
+        self.garbled_line_count += lines.count(b"\n") - len(matches)
+        columns = np.array(matches, dtype=np.bytes_).reshape(
+            len(matches), len(self.report_fields)
+        )
+        reports = empty_reports(len(matches))
+        for i, field in enumerate(self.report_fields):
+            if field == "raw":
+                reports["raw"] = columns[:, i].astype(np.int64)
+            elif field == "timestamp":
+                reports["device_time"] = columns[:, i].astype(np.float64) / 1e3
+            elif field in ("local_temp", "remote_temp"):
+                reports[field] = columns[:, i].astype(np.float64)
+        return reports
+
+    def parse_readings(self, lines: bytes) -> np.ndarray:
+        """Parses a block of complete serial lines into raw readings
+
+        Args:
+            lines (bytes): one or more complete lines of load cell serial input
+
+        Returns:
+            np.ndarray: raw readings from every valid line, as int64
+        """
+        return self.parse_reports(lines)["raw"]
+
+    def reading_to_units(self, reading: int | np.ndarray) -> float | np.ndarray:
+        """Takes in raw load cell reading and returns calibrated measurement. Also takes
+        a whole array of readings, such as from a recording.
+
+        Args:
+                reading (int | np.ndarray): raw value from load cell input, or array of them
+
+        Raises:
+            Exception: If load cell has not been calibrated, cannot give a calibrated measurement.
+
+        Returns:
+                float | np.ndarray: calibrated measurement in units the load cell is calibrated to
+        """
+
+        # pylint: disable=broad-exception-raised
+        if self.calibration_curve is None:
+            raise Exception(
+                "Load cell has not been calibrated, cannot report a calibrated measurement."
+            )
+        if reading is None:
+            return None
+        return self.calibration_curve(reading)
+
+    def get_reading(self) -> int:
+        """Grabs the next serial line and returns the reading. In serial trigger mode,
+        sends the trigger first and waits for the board to answer it.
+
+        Returns:
+            int: raw reading from OpenScale, or None if the line wasn't a reading or the
+            trigger wasn't answered in time
+        """
+        if not self.triggered:
+            return self.read_reading()
+        with self.trigger_lock:
+            self.ser.write(self.trigger_character)
+            deadline = time() + OpenScale.TRIGGER_TIMEOUT
+            reading = self.read_reading()
+            while reading is None and time() < deadline:
+                reading = self.read_reading()
+        if reading is None:
+            self.trigger_timeouts += 1
+        return reading
+
+    def read_reading(self) -> int:
+        """Grabs the next serial line and returns the reading, without triggering
+
+        Returns:
+            int: raw reading from OpenScale, or None if the line wasn't a reading
+        """
+        if self.frame_decoder is not None:
+            frames = self.frame_decoder.decode(self.ser.read(BINARY_FRAME_SIZE))
+            return int(frames["raw"][0]) if len(frames) > 0 else None
+        line = self.get_line()
+        if not line:
+            return None
+        if self.report_fields == ["raw"]:
+            reading = OpenScale.ser_to_reading(line)
+            if reading is None:
+                self.garbled_line_count += 1
+            return reading
+        raws = self.parse_readings(line)
+        return int(raws[0]) if len(raws) > 0 else None
+
+    def wait_for_reading(self) -> int:
+        """Wait aas long as needed to get next load cell reading."""
+        reading = None
+        while reading is None:
+            reading = self.get_reading()
+        return reading
+
+    def get_calibrated_measurement(self) -> float:
+        """Grabs the next serial line and returns the calibrated measurement
+
+        Returns:
+            float: force measurement in units chosen during calibration
+        """
+        meas = self.reading_to_units(self.get_reading())
+        if meas is not None:
+            self.outlier_filter.push(meas)
+        return meas
+
+    def wait_for_calibrated_measurement(self) -> float:
+        """Waits for the next valid reading and returns the calibrated measurement
+
+        Returns:
+            float: force measurement in units chosen during calibration
+        """
+        meas = None
+        while meas is None:
+            meas = self.reading_to_units(self.wait_for_reading())
+            if self.outlier_filter.check(
+                meas
+            ):  # if it's too far from all of the previous readings
+                meas = None
+        return meas
+
+    def check_if_outlier(self, measurement: float) -> bool:
+        """Checks if a measurement is too far from enough previous stored values,
+        according to the outlier filter's rule. Doesn't store the measurement.
+
+        Args:
+            measurement (float): the new measurement to check if it's an outlier
+
+        Returns:
+            bool: True if it's an utlier (too far from prior measurements),
+                False if it's considered a real measurement.
+        """
+        return self.outlier_filter.is_outlier(measurement)
+
+    def is_calibrated(self) -> bool:
+        """Checks whether the load cell has the tare, calibration, and units needed to
+        report a calibrated measurement
+
+        Returns:
+            bool: True if calibrated measurements are available
+        """
+        return self.calibration_curve is not None
+
+    def start_acquisition(self, capacity: int = 2**16) -> SampleRingBuffer:
+        """Starts a background thread that owns the serial port and records every
+        valid reading into a ring buffer. Once started, read samples through latest(),
+        since(), and window() instead of calling get_line() or wait_for_reading().
+        If the board is in serial trigger mode, no thread is started, and readings are
+        only taken and recorded when trigger_sample() is called.
+
+        Args:
+            capacity (int, optional): Number of samples to keep. Defaults to 2**16.
+
+        Returns:
+            SampleRingBuffer: the buffer samples are recorded to
+        """
+        if self.acquisition_thread is not None and self.acquisition_thread.is_alive():
+            return self.sample_buffer
+
+        if self.triggered:
+            self.ser.timeout = 0.01  # so trigger_sample() can give up on a lost reading
+            self.flush_old_lines()
+            self.sample_buffer = SampleRingBuffer(capacity)
+            self.last_arrival_time = time()
+            if self.force_filter is not None:
+                self.force_filter.reset()
+            if self.drift_compensation and self.drift_model is None:
+                self.drift_model = DriftModel(time())
+            return self.sample_buffer
+
+        self.flush_old_lines()  # get rid of lines generated when we were busy setting up
+        self.sniff()  # and line back up with the start of a report
+
+        self.sample_buffer = SampleRingBuffer(capacity)
+        self.last_arrival_time = time()
+        if self.force_filter is not None:
+            self.force_filter.reset()
+        if self.drift_compensation and self.drift_model is None:
+            self.drift_model = DriftModel(time())
+        self.stop_acquisition_event.clear()
+        self.acquisition_thread = threading.Thread(
+            name="openscale", target=self.acquisition_thread_method, daemon=True
+        )
+        self.acquisition_thread.start()
+        return self.sample_buffer
+
+    def stop_acquisition(self):
+        """Stops the background acquisition thread and waits for it to finish"""
+        self.stop_acquisition_event.set()
+        if self.acquisition_thread is not None:
+            self.acquisition_thread.join()
+        self.acquisition_thread = None
+
+    def acquisition_thread_method(self):
+        """Reads the serial port until asked to stop, recording each reading that
+        isn't an outlier into the sample buffer"""
+        prev_time = time()
+        while not self.stop_acquisition_event.is_set():
+            port_error = False
+            try:
+                reports = self.read_all_reports()
+            except EOFError:  # played back recording is over
+                break
+            except (serial.SerialException, OSError):  # unplugged, or the port broke
+                reports = empty_reports(0)
+                port_error = True
+            if len(reports) == 0:
+                self.check_for_stall(port_error)
+                if port_error:
+                    sleep(self.read_timeout)  # don't spin on a dead port
+                continue
+            if self.stall_start is not None:
+                prev_time = time()  # nothing to spread readings over after a stall
+
+            # Readings that piled up arrived sometime since the last read, so
+            # spread them out over that interval instead of stamping them all now
+            cur_time = time()
+            host_times = np.linspace(prev_time, cur_time, len(reports) + 1)[1:]
+            prev_time = cur_time
+            self.store_reports(reports, host_times, cur_time)
+
+    def check_for_stall(self, port_error: bool = False):
+        """Keeps track of readings that have stopped arriving, and reopens the port if
+        they've been gone for reconnect_after or the port itself failed
+
+        Args:
+            port_error (bool, optional): whether reading the port raised an error. Defaults to False.
+        """
+        now = time()
+        if self.stall_start is None and now - self.last_arrival_time > self.stale_after:
+            self.stall_start = self.last_arrival_time
+            self.stall_count += 1
+            print(f"OpenScale stalled, no readings for {self.stale_after}s")
+        if (
+            port_error or now - self.last_arrival_time > self.reconnect_after
+        ) and now - self.last_reconnect_attempt > self.reconnect_after:
+            self.last_reconnect_attempt = now
+            if self.reconnect():
+                print("Reconnected to OpenScale")
+
+    def end_stall(self, arrival_time: float):
+        """Records that readings are arriving again
+
+        Args:
+            arrival_time (float): host time the latest reading arrived
+        """
+        if self.stall_start is not None:
+            duration = arrival_time - self.stall_start
+            self.stall_durations.append(duration)
+            self.stall_start = None
+            print(f"OpenScale readings resumed after {duration:.2f}s")
+        self.last_arrival_time = arrival_time
+
+    def reconnect(self) -> bool:
+        """Closes and reopens the board's port, finding it by USB VID/PID and serial number
+        in case it came back under a different name
 
-    def get_line(self) -> bytes:
-        """Grabs the next line of serial input from the OpenScale
+        Returns:
+            bool: whether the port was reopened
+        """
+        port = None
+        if self.port_identity is not None:
+            port = self.find_port(self.port_identity)
+        elif isinstance(getattr(self.ser, "port", None), str):
+            port = self.ser.port
+        if not port:
+            return False
+
+        baudrate = getattr(self.ser, "baudrate", OpenScale.DEFAULT_BAUD)
+        try:
+            self.ser.close()
+        except (serial.SerialException, OSError):
+            pass
+        try:
+            new_ser = serial.Serial(port, baudrate, timeout=self.read_timeout)
+        except (serial.SerialException, OSError):
+            return False
+        if isinstance(self.ser, SerialRecorder):  # keep recording through the reconnect
+            self.ser.ser = new_ser
+        else:
+            self.ser = new_ser
+
+        self.partial_line = b""
+        if self.frame_decoder is not None:
+            self.frame_decoder = BinaryFrameDecoder()
+        if self.device_clock is not None:
+            self.device_clock.reset()
+        self.reconnect_count += 1
+        return True
+
+    def data_age(self) -> float:
+        """Gets how long it's been since a reading arrived. Doesn't depend on the
+        acquisition thread, so it keeps counting if that thread is stuck.
 
         Returns:
-            bytes: next line from OpenScale
+            float: seconds since the latest reading arrived
         """
-        return self.ser.readline()
+        return time() - self.last_arrival_time
 
-    @staticmethod
-    def ser_to_reading(serial_line: bytes) -> int:
-        """Takes in serial line and returns raw reading reported therein
+    def is_stale(self) -> bool:
+        """Checks whether readings have stopped arriving, meaning the current force can't
+        be trusted
+
+        Returns:
+            bool: True if no reading has arrived for longer than stale_after
+        """
+        return self.data_age() > self.stale_after
+
+    def stall_metrics(self) -> dict:
+        """Gets statistics about the serial link stalling
+
+        Returns:
+            dict: number of stalls, whether currently stalled, current, total and longest
+            stall durations in seconds, number of reconnects, and age of the latest reading
+        """
+        current = 0 if self.stall_start is None else time() - self.stall_start
+        return {
+            "stall_count": self.stall_count,
+            "stalled": self.stall_start is not None,
+            "current_stall": current,
+            "total_stall_time": sum(self.stall_durations) + current,
+            "longest_stall": max(self.stall_durations + [current]),
+            "reconnect_count": self.reconnect_count,
+            "data_age": self.data_age(),
+        }
+
+    def store_reports(
+        self, reports: np.ndarray, host_times: np.ndarray, arrival_time: float
+    ):
+        """Calibrates reports and records each one that isn't an outlier into the
+        sample buffer
 
         Args:
-                serial_line (bytes): a line of load cell serial input
+            reports (np.ndarray): reports from read_all_reports()
+            host_times (np.ndarray): host time each report arrived, in unix seconds
+            arrival_time (float): host time by which all of them had arrived
+        """
+        raws = reports["raw"]
+        self.end_stall(arrival_time)
+
+        # If the board timestamps its readings, use those instead
+        if self.device_clock is not None:
+            sample_times = self.device_clock.update(
+                reports["device_time"], arrival_time
+            )
+        else:
+            sample_times = host_times
+
+        if not self.is_calibrated():
+            self.report_count += len(raws)
+            self.sample_buffer.extend(
+                sample_times, raws, np.full(len(raws), math.nan), host_times
+            )
+            return
+
+        corrected = raws.astype(np.float64)
+        compensating = self.drift_compensation and self.drift_model is not None
+        if compensating and self.drift_model.params is not None:
+            # Shift readings by how far the zero has drifted from the tare
+            corrected -= self.drift_model.zero(sample_times) - self.tare_value
+        forces = self.calibration_curve(corrected)
+        if self.reports_temperature():
+            self.temperature_log.add(
+                sample_times, reports["local_temp"], reports["remote_temp"]
+            )
+        if self.temperature_compensation is not None:
+            forces -= self.temperature_correction(reports)
+        if compensating and self.is_unloaded():
+            unloaded = np.abs(forces) < self.unloaded_band
+            self.drift_model.add(sample_times[unloaded], raws[unloaded])
+            if arrival_time - self.last_drift_fit > self.drift_fit_interval:
+                self.last_drift_fit = arrival_time
+                self.drift_model.fit()
+
+        keep = np.ones(len(raws), dtype=bool)
+        for i, force in enumerate(forces):
+            keep[i] = not self.outlier_filter.check(force)
+        self.report_count += len(keep)
+        self.outlier_count += len(keep) - int(keep.sum())
+        sample_times = sample_times[keep]
+        forces = forces[keep]
+        if self.force_filter is not None:
+            filtered = self.force_filter.process(forces)
+            rates = self.force_filter.differentiate(filtered, sample_times)
+        else:
+            filtered = forces
+            rates = None
+        self.sample_buffer.extend(
+            sample_times, raws[keep], forces, host_times[keep], filtered, rates
+        )
+
+    def reports_temperature(self) -> bool:
+        """Whether the board is reporting any temperatures
 
         Returns:
-                int: the load cell reading in that line
+            bool: True if local or remote temperature is in the report fields
         """
-        try:
-            num_string = serial_line.decode("utf-8")[:-3]  # just get the actual content
-            reading = int(num_string)
-            return reading
-        except:
-            print(serial_line)
-            return None
+        return "local_temp" in self.report_fields or "remote_temp" in self.report_fields
 
-    def reading_to_units(self, reading: int) -> float:
-        """Takes in raw load cell reading and returns calibrated measurement
+    def temperature_correction(self, reports: np.ndarray) -> np.ndarray:
+        """Computes how much temperature has shifted each report's force, using the
+        temperature in the report itself, or the latest logged one if the report doesn't
+        have it
 
         Args:
-                reading (int): raw value from load cell input
+            reports (np.ndarray): reports from read_all_reports()
 
-        Raises:
-            Exception: If load cell has not been calibrated, cannot give a calibrated measurement.
+        Returns:
+            np.ndarray: force to subtract from each report's calibrated force
+        """
+        compensation = self.temperature_compensation
+        temps = reports[compensation["field"]]
+        missing = np.isnan(temps)
+        if missing.any():
+            latest = self.temperature_log.latest(compensation["field"])
+            if math.isnan(latest):
+                return np.zeros(len(reports))
+            temps = np.where(missing, latest, temps)
+        return compensation["coefficient"] * (temps - compensation["reference"])
+
+    def replay_reports(self, path: str) -> tuple[np.ndarray, np.ndarray]:
+        """Parses every report in a serial recording, the same way as live reads
+
+        Args:
+            path (str): location of a recording made with start_recording()
 
         Returns:
-                float: calibrated measurement in units the load cell is calibrated to
+            tuple[np.ndarray, np.ndarray]: the reports, and host time each one arrived
         """
+        times, ends, data = read_recording(path)
+        self.partial_line = b""
+        reports = []
+        report_times = []
+        start = 0
+        for chunk_time, end in zip(times, ends):
+            chunk_reports = self.parse_chunk(data[start:end])
+            start = end
+            reports.append(chunk_reports)
+            report_times.append(np.full(len(chunk_reports), chunk_time))
+        if len(reports) == 0:
+            return empty_reports(0), np.empty(0)
+        return np.concatenate(reports), np.concatenate(report_times)
+
+    def fit_temperature_coefficient(
+        self, paths: list[str], field: str = "local_temp"
+    ) -> dict:
+        """Fits how much the unloaded force shifts with temperature, from recordings of
+        the board reporting temperature with nothing on the load cell. Fits a linear
+        drift over time alongside, so slow drift isn't blamed on temperature. The result
+        is saved to the config file and applied to calibrated forces from then on.
 
-        # pylint: disable=broad-exception-raised
-        if (
-            ("tare" not in self.config)
-            or ("calibration" not in self.config)
-            or ("units" not in self.config)
-        ):
-            raise Exception(
-                "Load cell has not been calibrated, cannot report a calibrated measurement."
+        Args:
+            paths (list[str]): locations of recordings made with start_recording()
+            field (str, optional): "local_temp" or "remote_temp". Defaults to "local_temp".
+
+        Returns:
+            dict: the temperature field, coefficient in force units per degree C,
+            reference temperature, and the fraction of force variance it explains
+        """
+        columns = []
+        for path in paths:
+            reports, report_times = self.replay_reports(path)
+            valid = ~np.isnan(reports[field])
+            forces = self.calibration_curve(reports["raw"][valid].astype(np.float64))
+            columns.append(
+                (report_times[valid] - report_times[0], reports[field][valid], forces)
             )
-        if reading is None:
-            return None
-        return (reading - self.tare_value) / self.calibration
+        times, temps, forces = (np.concatenate(column) for column in zip(*columns))
+
+        reference = float(np.mean(temps))
+        design = [np.ones_like(times), times - times.mean(), temps - reference]
+        for i in range(1, len(paths)):  # each recording gets its own zero
+            design.append(
+                np.concatenate(
+                    [np.full(len(c[0]), i == j) for j, c in enumerate(columns)]
+                )
+            )
+        design = np.column_stack(design)
+        coefficients = np.linalg.lstsq(design, forces, rcond=None)[0]
+        residuals = forces - design @ coefficients
+        explained = float(1 - np.var(residuals) / np.var(forces))
+
+        self.temperature_compensation = {
+            "field": field,
+            "coefficient": float(coefficients[2]),
+            "reference": reference,
+        }
+        self.config["temperature_compensation"] = self.temperature_compensation
+        with open(self.config_path, "w") as write_file:
+            json.dump(self.config, write_file)
+        print(
+            f"Force changes {coefficients[2]:.4f}{self.units} per degree C "
+            f"around {reference:.2f}C, explaining {explained:.0%} of the variance"
+        )
+        return {**self.temperature_compensation, "explained_variance": explained}
 
-    def get_reading(self) -> int:
-        """Grabs the next serial line and returns the reading
+    def is_unloaded(self) -> bool:
+        """Whether nothing should be pushing on the load cell right now, so readings near
+        zero can be used to track drift. A plain load cell can't tell, so this is False
+        unless a subclass that knows when a test is running overrides it, or
+        unloaded_check is set.
 
         Returns:
-            int: raw reading from OpenScale
+            bool: True if readings near zero are from an unloaded load cell
         """
-        return OpenScale.ser_to_reading(self.get_line())
+        return False if self.unloaded_check is None else self.unloaded_check()
 
-    def wait_for_reading(self) -> int:
-        """Wait aas long as needed to get next load cell reading."""
-        reading = None
-        while reading is None:
-            reading = self.get_reading()
+    def trigger_sample(self, timeout: float = TRIGGER_TIMEOUT) -> np.void:
+        """Asks the board for one reading and waits for it, for lockstep sampling with
+        the control loop. The board must be in serial trigger mode, and acquisition must
+        have been started with start_acquisition(). The reading is also recorded into the
+        sample buffer, and the round trip time into trigger_latency.
 
-        if (
-            ("tare" in self.config)
-            and ("calibration" in self.config)
-            and ("units" in self.config)
-        ):
-            self.old_readings.pop(0)
-            self.old_readings.append(self.reading_to_units(reading))
-        return reading
+        Args:
+            timeout (float, optional): seconds to wait for the reading. Defaults to 1.
 
-    def get_calibrated_measurement(self) -> float:
-        """Grabs the next serial line and returns the calibrated measurement
+        Returns:
+            np.void: the new sample with fields time, raw, force, and host_time, or None if
+            the board didn't answer in time or the reading was an outlier
+        """
+        with self.trigger_lock:
+            seq = self.sample_buffer.seq
+            self.ser.write(self.trigger_character)
+            sent_time = time()
+            reports = self.read_all_reports()
+            while len(reports) == 0 and time() - sent_time < timeout:
+                reports = self.read_all_reports()
+            cur_time = time()
+            if len(reports) == 0:
+                self.trigger_timeouts += 1
+                self.check_for_stall()
+                return None
+
+            self.trigger_latency.add((cur_time - sent_time) * 1e3)
+            self.end_stall(cur_time)
+            self.store_reports(reports[-1:], np.array([cur_time]), cur_time)
+            return self.sample_buffer.latest() if self.sample_buffer.seq > seq else None
+
+    def latest(self) -> np.void:
+        """Gets the most recent sample from the acquisition thread without waiting
 
         Returns:
-            float: force measurement in units chosen during calibration
+            np.void: latest sample with fields time, raw, and force, or None if
+            nothing has been recorded yet
         """
-        meas = self.reading_to_units(self.get_reading())
-        self.old_readings.pop(0)
-        self.old_readings.append(meas)
-        return meas
+        return self.sample_buffer.latest()
 
-    def wait_for_calibrated_measurement(self) -> float:
-        """Waits for the next valid reading and returns the calibrated measurement
+    def since(self, seq: int) -> tuple[np.ndarray, int]:
+        """Gets every sample from the acquisition thread since a given sequence number
+        without waiting
+
+        Args:
+            seq (int): sequence number of the first sample wanted, usually the value
+            returned by the previous call
 
         Returns:
-            float: force measurement in units chosen during calibration
+            tuple[np.ndarray, int]: samples recorded since seq, and the sequence
+            number to pass in next time
         """
-        meas = None
-        while meas is None:
-            meas = self.reading_to_units(self.wait_for_reading())
-            if self.check_if_outlier(
-                meas
-            ):  # if it's too far from all of the previous readings
-                meas = None
-        return meas
+        return self.sample_buffer.since(seq)
 
-    def check_if_outlier(self, measurement: float) -> bool:
-        """Checks if a measurement is too far from enough previous stored values.
-        If it is within a certain threshold for at least the quorum amount of values, returns false. Otherwise returns true.
+    def window(self, seconds: float) -> np.ndarray:
+        """Gets all samples from the acquisition thread from the last given number of
+        seconds without waiting
 
         Args:
-            measurement (float): the new measurement to check if it's an outlier
+            seconds (float): how far back from the latest sample to go, in seconds
 
         Returns:
-            bool: True if it's an utlier (too far from prior measurements),
-                False if it's considered a real measurement.
+            np.ndarray: samples in chronological order
         """
-
-        distance_from_old_measurement: list[float] = [
-            abs(measurement - (old if old is not None else 0))
-            for old in self.old_readings[0:-1]
-        ]
-        close_enough: list[bool] = [
-            d <= OpenScale.OUTLIER_JUMP_THRESHOLD for d in distance_from_old_measurement
-        ]
-        number_close_enough: int = sum(close_enough)
-        is_outlier = number_close_enough < OpenScale.OUTLIER_QUORUM_AMOUNT
-        return is_outlier
+        return self.sample_buffer.window(seconds)
 
     @staticmethod
     def grams_to_N(f: float) -> float:
@@ -214,68 +3089,135 @@ class OpenScale:
         """
         return 0.00980665 * f
 
-    def tare(self, wait_time: int = 120, n: int = 1000) -> float:
-        """Performs taring of the load cell. Saves tare value
+    def record_reading_stats(self, n: int, offset: float = 0) -> StreamingStats:
+        """Records statistics of the next n raw readings in constant memory, reporting
+        progress about once a second instead of printing every reading
 
         Args:
-            wait_time (int, optional): Time to wait for load cell creep to occur. Defaults to 120.
-            n (int, optional): Number of samples to average over. Defaults to 1000.
+            n (int): Number of readings to record
+            offset (float, optional): Subtracted from each reading before it's recorded. Defaults to 0.
 
         Returns:
-            float: tare value - the average reading when the load cell has no force applied
+            StreamingStats: statistics of the recorded readings
+        """
+        stats = StreamingStats()
+        last_report = time()
+        for i in range(n):
+            stats.add(self.wait_for_reading() - offset)
+            if time() - last_report >= 1:
+                last_report = time()
+                print(f"{i + 1:7d}/{n:d} readings, running mean {stats.mean:10.1f}")
+        return stats
+
+    @staticmethod
+    def plot_reading_stats(stats: StreamingStats, center: float):
+        """Shows a histogram of recorded readings and waits for the window to be closed
+
+        Args:
+            stats (StreamingStats): statistics of the recorded readings
+            center (float): value to plot deviations from, usually the mean
         """
+        counts, edges = stats.histogram()
+        plt.stairs(counts, edges - center, fill=True)
+        plt.xlabel("Deviation from the mean")
+        plt.ylabel("Number of samples")
+        plt.title(f"{stats.count:d} readings")
+        plt.show()
 
-        print(
-            f"Taking first {wait_time:d} seconds to let load cell creep happen. "
-            "This will lead to a more accurate tare value."
-        )
+    def wait_for_creep(
+        self, wait_time: float, tolerance: float = None, n: int = 1000
+    ) -> float:
+        """Records load cell readings into a new drift model while load cell creep happens,
+        reporting the time remaining about once a second. Stops early once the fitted
+        creep has less than the tolerance left to go, and the data spans enough of its
+        time constant to trust the fit.
+
+        Args:
+            wait_time (float): longest to wait in seconds
+            tolerance (float, optional): remaining creep to stop at, in raw counts. Defaults
+            to the creep_tolerance config setting, or if that isn't set, to what would be
+            lost in the noise of averaging n readings.
+            n (int, optional): number of readings the tare will average. Defaults to 1000.
+
+        Returns:
+            float: how long it waited in seconds
+        """
+        if tolerance is None:
+            tolerance = self.config.get("creep_tolerance", None)
         start_time = time()
+        self.drift_model = DriftModel(start_time)
+        noise = StreamingStats()
+        last_report = 0
+        last_raw = None
+        prev_time = start_time
+        self.flush_old_lines()
         while time() - start_time <= wait_time:
-            remaining = wait_time - (time() - start_time)
-            print(f"{remaining:5.1f}: {self.get_line()}")
+            raws = self.read_all_readings()
+            if len(raws) == 0:
+                continue
+            cur_time = time()
+            self.drift_model.add(
+                np.linspace(prev_time, cur_time, len(raws) + 1)[1:], raws
+            )
+            prev_time = cur_time
+            # Differences between readings cancel the drift and leave the noise
+            steps = np.diff(raws if last_raw is None else np.append(last_raw, raws))
+            for step in steps:
+                noise.add(step / math.sqrt(2))
+            last_raw = raws[-1]
+
+            if time() - last_report >= 1:
+                last_report = time()
+                self.drift_model.fit(drift=False)
+                limit = tolerance
+                if limit is None:
+                    limit = noise.std / math.sqrt(n)
+                remaining_creep = self.drift_model.creep_remaining()
+                remaining = wait_time - (time() - start_time)
+                print(
+                    f"{remaining:5.1f}s left, creep left to go: {remaining_creep:8.1f} "
+                    f"(stopping below {limit:.1f})"
+                )
+                if self.drift_model.creep_settled(limit):
+                    print("Creep has settled")
+                    break
         self.flush_old_lines()  # and clear any extra lines that may
         # have been generated, we don't need them
+        return time() - start_time
 
-        readings = [0] * n
-        print("Now recording values for taring")
-        for i in range(n):
-            readings[i] = self.wait_for_reading()
-            print(f"{i:5d}: {readings[i]:8d}")
-
-        # Throw out top 1% and bottom 1%
-        remove_rate = 0.01
-        readings = sorted(readings)
-        readings = readings[
-            math.floor(remove_rate * n) : math.floor((1 - remove_rate) * n)
-        ]
-        print(
-            f"Keeping the middle {(1 - 2 * remove_rate):.0%} of samples "
-            "to remove outliers due to noise"
-        )
+    def tare(
+        self, wait_time: int = 120, n: int = 1000, headless: bool = False
+    ) -> float | StreamingStats:
+        """Performs taring of the load cell. Saves tare value
 
-        tare_value = sum(readings) / len(readings)
-        print(f"The tare value is {tare_value:.2f}")
+        Args:
+            wait_time (int, optional): Longest time to wait for load cell creep to occur. Ends
+            early once the fitted creep has settled. Defaults to 120.
+            n (int, optional): Number of samples to average over. Defaults to 1000.
+            headless (bool, optional): If True, don't show a histogram of the readings,
+            and return the reading statistics instead of the tare value. Defaults to False.
+
+        Returns:
+            float | StreamingStats: tare value - the average reading when the load cell has
+            no force applied, or the statistics of the readings if headless
+        """
 
-        reading_std = np.std(readings)
-        max_reading = max(readings)
-        min_reading = min(readings)
-        print(f"min: {min_reading}, max: {max_reading}, standard dev: {reading_std}")
-        readings_over = sorted(i for i in readings if i >= tare_value + reading_std)
-        readings_under = sorted(
-            (i for i in readings if i <= tare_value - reading_std), reverse=True
-        )
         print(
-            f"Number over 1std: {len(readings_over)}, Number under 1std: {len(readings_under)}, "
-            f"total outside 1std: {(len(readings_over) + len(readings_under))}"
+            f"Taking up to {wait_time:d} seconds to let load cell creep happen. "
+            "This will lead to a more accurate tare value."
         )
+        waited = self.wait_for_creep(wait_time, n=n)
+        print(f"Waited {waited:.0f}s for creep")
+
+        print("Now recording values for taring")
+        stats = self.record_reading_stats(n)
         print(
-            f"Number within 1std: {(len(readings) - len(readings_over) - len(readings_under))}"
+            f"Keeping the middle {(1 - 2 * stats.trim):.0%} of samples "
+            "to remove outliers due to noise"
         )
-        plt.hist(sorted(np.array(readings) - tare_value), 50)
-        plt.xlabel("Deviation from the mean")
-        plt.ylabel("Number of samples")
-        plt.title(f"Middle {(1 - 2 * remove_rate):.0%} of readings")
-        plt.show()
+        tare_value = stats.trimmed_mean
+        print(f"The tare value is {tare_value:.2f}")
+        print(stats.summary())
 
         self.config["tare"] = tare_value
         if "limit_fraction" not in self.config:
@@ -284,20 +3226,32 @@ class OpenScale:
             json.dump(self.config, write_file)
 
         self.tare_value = tare_value
+        self.calibration_curve = CalibrationCurve.from_config(self.config)
+        if headless:
+            return stats
+        OpenScale.plot_reading_stats(stats, tare_value)
         return tare_value
 
     def calibrate(
-        self, tare_first: bool = False, n: int = 1000, report_duration: int = 10
-    ) -> float:
+        self,
+        tare_first: bool = False,
+        n: int = 1000,
+        report_duration: int = 10,
+        headless: bool = False,
+    ) -> float | StreamingStats:
         """Performs calibration of load cell
 
         Args:
             n (int, optional): Number of samples to average over. Defaults to 1000.
             report_duration (int, optional): Amount of time to report values after
             calibration is complete. Defaults to 10.
+            headless (bool, optional): If True, don't show a histogram of the readings or
+            report values afterwards, and return the reading statistics instead of the
+            calibration value. Defaults to False.
 
         Returns:
-            float: _description_
+            float | StreamingStats: calibration value, or the statistics of the readings
+            if headless
         """
         if "tare" not in self.config:
             print("Load cell has not been tared, will now perform taring.")
@@ -306,11 +3260,9 @@ class OpenScale:
             input(
                 "Please remove any weights you had placed. Press enter to being taring process."
             )
-            self.tare(n=n)
+            self.tare(n=n, headless=headless)
             print("Taring complete. Now to calibrate.")
 
-        total = 0
-
         # Have the user place the calibration weight and ask what the weight is
         print("Please place the calibration weight(s).")
         cal_weight_str = input(
@@ -337,56 +3289,30 @@ class OpenScale:
         self.flush_old_lines()  # and clear any extra lines that may have been
         # generated, we don't need them
 
-        readings = [0] * n
-        for i in range(n):
-            # reading = self.get_reading()
-            reading = self.wait_for_reading() - self.tare_value
-            readings[i] = reading
-            print(f"{i:5d}: {reading:10.1f}")
-            total += reading - self.tare_value
-
-        # Throw out top 1% and bottom 1%
-        remove_rate = 0.01
-        readings = sorted(readings)
-        readings = readings[
-            math.floor(remove_rate * n) : math.floor((1 - remove_rate) * n)
-        ]
+        stats = self.record_reading_stats(n, offset=self.tare_value)
         print(
-            f"Keeping the middle {(1 - 2 * remove_rate):.0%} of "
+            f"Keeping the middle {(1 - 2 * stats.trim):.0%} of "
             "samples to remove outliers due to noise"
         )
-
-        # average = total / N
-        average = sum(readings) / len(readings)
+        average = stats.trimmed_mean
         print(f"The calibration average is {average:.2f}")
-
-        reading_std = np.std(readings)
-        max_reading = max(readings)
-        min_reading = min(readings)
-        print(f"min: {min_reading}, max: {max_reading}, standard dev: {reading_std}")
-        readings_over = sorted(i for i in readings if i >= average + reading_std)
-        readings_under = sorted(
-            (i for i in readings if i <= average - reading_std), reverse=True
-        )
-        print(
-            f"Number over 1std: {len(readings_over)}, Number under 1std: {len(readings_under)}, "
-            f"total outside 1std: {(len(readings_over) + len(readings_under))}"
-        )
-        print(
-            f"Number within 1std: {(len(readings) - len(readings_over) - len(readings_under))}"
-        )
-        plt.hist(sorted(np.array(readings) - average), 50)
-        plt.xlabel("Deviation from the mean")
-        plt.ylabel("Number of samples")
-        plt.title(f"Middle {(1 - 2 * remove_rate):.0%} of readings")
-        plt.show()
+        print(stats.summary())
 
         calibration = -average / cal_weight
         self.config["calibration"] = calibration
+        self.config.pop(
+            "calibration_curve", None
+        )  # replaces any multi-point calibration
         with open(self.config_path, "w") as write_file:
             json.dump(self.config, write_file)
+        self.calibration = calibration
+        self.calibration_curve = CalibrationCurve.from_config(self.config)
 
         print(f"The calibration value is {calibration:.2f}")
+        if headless:
+            return stats
+        OpenScale.plot_reading_stats(stats, average)
+
         input(
             "You should now change the weights. For the next 10 seconds, "
             "the measured weight will be constantly printed. Press enter to begin."
@@ -401,9 +3327,108 @@ class OpenScale:
 
         return calibration
 
-    def check_tare(self):
-        """Check if load cell is within tare, otherwise tare it."""
-        weight = self.wait_for_calibrated_measurement()
+    def calibrate_multipoint(
+        self, degree: int = 1, n: int = 1000, headless: bool = False
+    ) -> CalibrationCurve:
+        """Performs calibration of load cell with several weights, fitting a linear or
+        polynomial response through them that reads zero at the tare. The fit and each weight's
+        residual are printed, and the curve is saved to the config file.
+
+        Args:
+            degree (int, optional): polynomial degree to fit. Needs at least this many
+            weights. Defaults to 1.
+            n (int, optional): Number of samples to average over at each weight. Defaults to 1000.
+            headless (bool, optional): If True, don't show histograms of the readings. Defaults to False.
+
+        Returns:
+            CalibrationCurve: the fitted calibration curve
+        """
+        if "tare" not in self.config:
+            input(
+                "Load cell has not been tared. Please remove any weights you had placed. "
+                "Press enter to being taring process."
+            )
+            self.tare(n=n, headless=headless)
+
+        if "max_force" not in self.config:
+            max_force_str = input("Enter the load cell capacity in your units: ")
+            self.outlier_threshold = abs(float(max_force_str))
+            self.config["max_force"] = self.outlier_threshold
+            self.force_limit = self.outlier_threshold * self.config.get(
+                "limit_fraction", 0.8
+            )
+
+        # The fit is pinned to zero force at the tare, listed here so its residual shows
+        raws = [self.tare_value]
+        weights = [0.0]
+        temp = re.compile("([0-9.]+)([a-zA-Z]+)")
+        while True:
+            cal_weight_str = input(
+                "Place the next calibration weight(s), then enter the total weight with "
+                "units (ex: 50g), or press enter to finish: "
+            ).replace(" ", "")
+            if len(cal_weight_str) == 0:
+                if len(weights) > degree:
+                    break
+                print(f"A degree {degree} fit needs at least {degree} weights")
+                continue
+            res = temp.match(cal_weight_str).groups()
+            if len(weights) > 1 and res[1] != self.units:
+                print(f"Please use the same units as before, {self.units}")
+                continue
+            self.units = res[1]
+
+            self.flush_old_lines()
+            self.sniff()
+            stats = self.record_reading_stats(n)
+            print(stats.summary())
+            if not headless:
+                OpenScale.plot_reading_stats(stats, stats.trimmed_mean)
+            raws.append(stats.trimmed_mean)
+            weights.append(abs(float(res[0])))
+
+        # Weight pushes down, so it's a negative upward force
+        forces = -np.array(weights)
+        curve, residuals = CalibrationCurve.fit(raws, forces, degree, self.tare_value)
+        print(f"{'Weight':>10} {'Fit':>10} {'Residual':>10}")
+        for weight, residual in zip(weights, residuals):
+            print(
+                f"{weight:10.3f} {weight + residual:10.3f} {residual:10.4f} {self.units}"
+            )
+        rms = float(np.sqrt(np.mean(residuals**2)))
+        print(f"RMS residual: {rms:.4f}{self.units}")
+
+        self.config["units"] = self.units
+        self.config["calibration"] = 1 / curve.coefficients[-2]  # slope at zero load
+        self.config["calibration_curve"] = {
+            "coefficients": curve.coefficients,
+            "raws": [float(raw) for raw in raws],
+            "forces": forces.tolist(),
+            "rms_residual": rms,
+        }
+        with open(self.config_path, "w") as write_file:
+            json.dump(self.config, write_file)
+        self.calibration = self.config["calibration"]
+        self.calibration_curve = curve
+        return curve
+
+    def check_tare(self, n: int = 5, timeout: float = 1):
+        """Check if load cell is within tare, otherwise tare it. Uses the median of the
+        next few readings, which ignores spikes without waiting for the outlier filter to
+        build up a history.
+
+        Args:
+            n (int, optional): number of readings to take the median of. Defaults to 5.
+            timeout (float, optional): seconds to wait for them. Defaults to 1.
+        """
+        raws = self.read_all_readings()
+        start_time = time()
+        while len(raws) < n and time() - start_time < timeout:
+            raws = np.concatenate((raws, self.read_all_readings()))
+        if len(raws) == 0:
+            print("No load cell readings, can't check the tare")
+            return
+        weight = self.reading_to_units(np.median(raws))
         if abs(weight) > 0.5:
             ans = input(
                 f"The load cell is out of tare! Current reading is {weight:.2f}{self.units}. "
@@ -412,15 +3437,401 @@ class OpenScale:
             if ans == "y":
                 self.tare()
 
-    def get_COM_port(self):
-        """Finds COM ports connected to USB
+    def candidate_ports(self) -> list[tuple[str, dict]]:
+        """Lists ports the board might be on, most likely first: the OPENSCALE_PORT
+        environment variable if set (OPENSCALE_PORT_<NAME> for a named board), then the
+        port cached in the config file, then every other USB serial port, newest first.
+        Ports already opened by another board are skipped.
+
+        Returns:
+            list[tuple[str, dict]]: each port and its USB identity, which is None if unknown
+        """
+        variable = "OPENSCALE_PORT"
+        if self.board_name is not None:
+            variable += "_" + self.board_name.upper()
+        if os.environ.get(variable):
+            return [(os.environ[variable], None)]
+
+        candidates = []
+        com_ports = [
+            port
+            for port in serial.tools.list_ports.comports()
+            if port.vid and port.device not in OpenScale.claimed_ports
+        ]
+        if "port" in self.config:
+            cached = self.find_port(self.config["port"])
+            if cached is not None and cached not in OpenScale.claimed_ports:
+                candidates.append((cached, self.config["port"]))
+        for port in reversed(com_ports):
+            if port.device not in (device for device, _ in candidates):
+                identity = {
+                    "vid": port.vid,
+                    "pid": port.pid,
+                    "serial_number": port.serial_number,
+                }
+                candidates.append((port.device, identity))
+        return candidates
+
+    def open_port(self, sniff_timeout: float = 2) -> bool:
+        """Finds and opens the board's port. Tries each candidate port in turn, and keeps
+        the first one that sends a valid report, so other USB serial devices are skipped.
+        The board's USB identity is cached in the config file so it's tried first next
+        time, and startup_metrics records how long it took to get a valid reading.
+
+        Args:
+            sniff_timeout (float, optional): seconds to wait for a valid report on each port. Defaults to 2.
+
+        Returns:
+            bool: whether the board was found
+        """
+        start_time = time()
+        baud = self.config.get("baud", OpenScale.DEFAULT_BAUD)
+        candidates = self.candidate_ports()
+        for tried, (device, identity) in enumerate(candidates, start=1):
+            try:
+                self.ser = serial.Serial(device, baud, timeout=self.read_timeout)
+            except serial.SerialException:
+                continue
+            # Only send the trigger to a port known to be the board, not to whatever
+            # other USB serial device happens to be plugged in
+            known = identity is None or identity == self.config.get("port")
+            if self.sniff(sniff_timeout, trigger=known) is None:
+                self.ser.close()
+                continue
+            self.flush_old_lines()  # so a stale answer isn't taken for the next reading
+
+            self.port_identity = identity
+            OpenScale.claimed_ports.add(device)
+            self.startup_metrics = {
+                "port": device,
+                "from_cache": identity is not None
+                and identity == self.config.get("port"),
+                "ports_tried": tried,
+                "time_to_first_sample": time() - start_time,
+            }
+            print(
+                f"OpenScale found on {device}, first reading after "
+                f"{self.startup_metrics['time_to_first_sample'] * 1e3:.0f}ms"
+            )
+            if identity is not None and identity != self.config.get("port"):
+                self.config["port"] = identity
+                with open(self.config_path, "w") as write_file:
+                    json.dump(self.config, write_file)
+            return True
+        return False
+
+    def sniff(self, timeout: float = 2, trigger: bool = False) -> np.ndarray:
+        """Reads until a complete, valid report arrives in the expected format, to check
+        that the board is there and to line up with the start of a report
+
+        Args:
+            timeout (float, optional): seconds to wait. Defaults to 2.
+            trigger (bool, optional): whether to send the trigger character, about every
+            half second, if the board is in serial trigger mode. Defaults to False.
+
+        Returns:
+            np.ndarray: the valid reports read, or None if none arrived in time
+        """
+        self.partial_line = b""
+        # may start partway through a line, unless the board only speaks when triggered
+        first_line = self.frame_decoder is None and not (trigger and self.triggered)
+        start_time = time()
+        trigger_time = -math.inf
+        while time() - start_time < timeout:
+            if trigger and self.triggered and time() - trigger_time > 0.5:
+                self.ser.write(self.trigger_character)
+                trigger_time = time()
+            try:
+                reports = self.read_all_reports()
+            except (serial.SerialException, OSError):
+                return None
+            if first_line and len(reports) > 0:
+                reports = reports[1:]
+                first_line = False
+            if len(reports) > 0:
+                self.last_arrival_time = time()
+                return reports
+        return None
+
+    def get_COM_port(self) -> str:
+        """Finds the port the board is most likely on, in the same order open_port() tries
+        them, see candidate_ports(). Doesn't open it, so unlike open_port() it can't check
+        that the board is really there.
+
+        Returns:
+            str: the port, or "" if there are no USB serial ports
+        """
+        candidates = self.candidate_ports()
+        if not candidates:
+            return ""
+        device, identity = candidates[0]
+        if identity is not None:
+            self.port_identity = identity
+        return device
+
+    @staticmethod
+    def find_port(identity: dict) -> str:
+        """Finds the port of a USB device by its identity
+
+        Args:
+            identity (dict): vid, pid, and serial_number of the device. A serial number
+            of None matches any.
+
+        Returns:
+            str: the device's port, or None if it isn't connected
+        """
+        for port in serial.tools.list_ports.comports():
+            if (
+                port.vid == identity["vid"]
+                and port.pid == identity["pid"]
+                and identity.get("serial_number") in (None, port.serial_number)
+            ):
+                return port.device
+        return None
+
+
+class OpenScaleArray:
+    """Several OpenScale boards read together, ex: one load cell above the sample and one
+    under the bottom plate. Each board is read concurrently by its own acquisition
+    thread and stamps its samples on the host clock (through its DeviceClock when it
+    reports timestamps), and the other boards' forces are interpolated to the
+    reference board's sample times to give one multi-channel sample stream."""
+
+    def __init__(self, scales: dict[str, OpenScale], reference: str = None):
+        """Group boards together
+
+        Args:
+            scales (dict[str, OpenScale]): each board by channel name
+            reference (str, optional): channel whose sample times the others are
+            interpolated to. Defaults to the first one.
+        """
+        self.scales = scales
+        """Each board by channel name"""
+        self.reference = reference if reference is not None else next(iter(scales))
+        """Channel whose sample times the others are interpolated to"""
+        self.dtype = np.dtype(
+            [("time", np.float64)] + [(name, np.float64) for name in scales]
+        )
+        """Layout of one merged sample: time in host unix seconds, then the force on each
+        channel"""
+
+    def start_acquisition(self, capacity: int = 2**16):
+        """Starts acquisition on every board that isn't already running
+
+        Args:
+            capacity (int, optional): Number of samples to keep per board. Defaults to 2**16.
+        """
+        for scale in self.scales.values():
+            scale.start_acquisition(capacity)
+
+    def stop_acquisition(self):
+        """Stops acquisition on every board"""
+        for scale in self.scales.values():
+            scale.stop_acquisition()
+
+    def merge(self, samples: np.ndarray) -> np.ndarray:
+        """Puts every channel's force at the reference channel's sample times
+
+        Args:
+            samples (np.ndarray): samples from the reference board
+
+        Returns:
+            np.ndarray: merged samples, with NaN where a channel has no samples on both
+            sides of the time
+        """
+        merged = np.empty(len(samples), dtype=self.dtype)
+        merged["time"] = samples["time"]
+        for name, scale in self.scales.items():
+            if name == self.reference:
+                merged[name] = samples["force"]
+                continue
+            if len(samples) == 0:
+                continue
+            latest = scale.latest()
+            if latest is None:
+                merged[name] = math.nan
+                continue
+            others = scale.window(latest["time"] - samples["time"][0] + 1)
+            merged[name] = np.interp(
+                samples["time"],
+                others["time"],
+                others["force"],
+                left=math.nan,
+                right=math.nan,
+            )
+        return merged
+
+    def covered_until(self) -> float:
+        """Gets the latest time every channel has a sample at or after
+
+        Returns:
+            float: time in host unix seconds, or -inf if a channel has no samples yet
+        """
+        times = []
+        for name, scale in self.scales.items():
+            latest = scale.latest()
+            if latest is None:
+                return -math.inf
+            times.append(latest["time"])
+        return min(times)
+
+    def since(self, seq: int) -> tuple[np.ndarray, int]:
+        """Gets merged samples since a given sequence number of the reference board,
+        without waiting. Reference samples newer than the latest sample of some other
+        channel are held back until that channel catches up, so channels are always
+        interpolated and never extrapolated.
+
+        Args:
+            seq (int): sequence number of the first sample wanted, usually the value
+            returned by the previous call
+
+        Returns:
+            tuple[np.ndarray, int]: merged samples, and the sequence number to pass in
+            next time
+        """
+        covered = self.covered_until()
+        samples, next_seq = self.scales[self.reference].since(seq)
+        # Mapped device times aren't guaranteed to be in order, so stop at the first
+        # uncovered one rather than searching
+        uncovered = np.flatnonzero(~(samples["time"] <= covered))
+        ready = uncovered[0] if len(uncovered) > 0 else len(samples)
+        return self.merge(samples[:ready]), next_seq - (len(samples) - ready)
+
+    def latest(self) -> np.void:
+        """Gets the most recent merged sample that every channel covers
+
+        Returns:
+            np.void: merged sample, or None if there isn't one yet
+        """
+        recent = self.window(1)
+        complete = ~np.isnan(
+            np.column_stack([recent[name] for name in self.scales])
+        ).any(axis=1)
+        if not complete.any():
+            return None
+        return recent[np.flatnonzero(complete)[-1]]
+
+    def window(self, seconds: float) -> np.ndarray:
+        """Gets merged samples from the last given number of seconds of the reference
+        board
+
+        Args:
+            seconds (float): how far back from the latest sample to go, in seconds
+
+        Returns:
+            np.ndarray: merged samples in chronological order
+        """
+        return self.merge(self.scales[self.reference].window(seconds))
+
+
+class AcquisitionDiagnostics:
+    """Tracks the quality of an OpenScale's readings while it acquires: distributions of
+    reading values, jumps between consecutive readings, and time between arrivals, plus
+    how often readings are rejected as outliers and lines come in garbled. Everything is
+    kept in fixed-bin histograms and running counts, so memory and the cost of a summary
+    don't grow with run length. Export the summary to JSON to compare boards and cables.
+    """
+
+    def __init__(self, scale: OpenScale, bins: int = 100):
+        """Start tracking a board. Starts its acquisition if it isn't running.
+
+        Args:
+            scale (OpenScale): board to track
+            bins (int, optional): Number of histogram bins. Defaults to 100.
+        """
+        self.scale = scale
+        """Board being tracked"""
+        scale.start_acquisition()
+        self.seq = scale.sample_buffer.seq
+        """Sequence number of the next sample to look at"""
+        self.start_time = time()
+        """When tracking started, in unix seconds"""
+        self.start_counts = self.counts()
+        """Board's report, outlier, and garbled line counts when tracking started"""
+        self.readings = StreamingStats(bins=bins)
+        """Reading values, in calibrated units if calibrated, otherwise raw"""
+        self.jumps = StreamingStats(bin_edges=np.geomspace(1e-4, 1e4, bins + 1))
+        """Absolute differences between consecutive accepted readings"""
+        self.intervals = StreamingStats(bin_edges=np.geomspace(1e-4, 10, bins + 1))
+        """Seconds between consecutive readings' host times. Readings that arrive in the
+        same chunk are spread evenly over the time since the chunk before, so a backlog
+        shows up as a run of short intervals rather than a spike at zero"""
+        self.last_value: float = None
+        """Latest reading value seen"""
+        self.last_arrival: float = None
+        """When the latest reading seen arrived, in unix seconds"""
+
+    def counts(self) -> dict:
+        """Gets the board's running counts
+
+        Returns:
+            dict: reports, outliers, and garbled_lines seen by the board so far
+        """
+        return {
+            "reports": self.scale.report_count,
+            "outliers": self.scale.outlier_count,
+            "garbled_lines": self.scale.garbled_line_count,
+        }
+
+    def update(self):
+        """Folds in every sample recorded since the last update"""
+        samples, self.seq = self.scale.since(self.seq)
+        field = "force" if self.scale.is_calibrated() else "raw"
+        for value, arrival in zip(samples[field].tolist(), samples["host_time"]):
+            self.readings.add(value)
+            if self.last_value is not None:
+                self.jumps.add(abs(value - self.last_value))
+                self.intervals.add(arrival - self.last_arrival)
+            self.last_value = value
+            self.last_arrival = arrival
+
+    def rates(self) -> dict:
+        """Gets how often readings were rejected or garbled since tracking started
+
+        Returns:
+            dict: reports, outliers, and garbled_lines counted, outlier_rate as a
+            fraction of reports, and garbled_rate as a fraction of all lines
+        """
+        now = self.counts()
+        counted = {name: now[name] - self.start_counts[name] for name in now}
+        lines = counted["reports"] + counted["garbled_lines"]
+        return {
+            **counted,
+            "outlier_rate": (
+                counted["outliers"] / counted["reports"] if counted["reports"] else 0.0
+            ),
+            "garbled_rate": counted["garbled_lines"] / lines if lines else 0.0,
+        }
+
+    def as_dict(self) -> dict:
+        """Gets the full summary as a JSON-serializable dict
+
+        Returns:
+            dict: board, duration, rates, link stalls, and each distribution's statistics
+        """
+        self.update()
+        return {
+            "port": self.scale.startup_metrics.get("port"),
+            "port_identity": self.scale.port_identity,
+            "units": self.scale.units if self.scale.is_calibrated() else "raw",
+            "duration": time() - self.start_time,
+            **self.rates(),
+            "link": self.scale.stall_metrics(),
+            "readings": self.readings.as_dict(),
+            "jumps": self.jumps.as_dict(),
+            "intervals": self.intervals.as_dict(),
+        }
+
+    def export(self, path: str) -> dict:
+        """Saves the summary to a JSON file
+
+        Args:
+            path (str): where to save it
 
         Returns:
-            _type_: _description_
+            dict: the summary saved
         """
-        com_ports = serial.tools.list_ports.comports()
-        usable_port = ""
-        for port in com_ports:
-            if port.vid:  # if
-                usable_port = port.device
-        return usable_port
+        summary = self.as_dict()
+        with open(path, "w") as write_file:
+            json.dump(summary, write_file, indent=4)
+        return summary
@@ -0,0 +1,731 @@
+"""Simulates an OpenScale board on a pseudo-terminal, so the whole load cell acquisition
+stack can be run and load-tested with no hardware attached. Linux/macOS only.
+
+Run this script, then point OpenScale at the port it prints by setting the
+OPENSCALE_PORT environment variable, ex:
+    python LoadCell/openscale_simulator.py --rate 1000 --model sine
+    OPENSCALE_PORT=/dev/pts/5 python LoadCell/read_load_cell.py
+"""
+
+import os
+import tty
+import json
+import math
+import errno
+import select
+import struct
+import argparse
+import threading
+from time import time, sleep
+from typing import Callable
+import numpy as np
+
+
+def constant_force(force: float = 0) -> Callable[[float], float]:
+    """Force model that always applies the same force
+
+    Args:
+        force (float, optional): force to apply. Defaults to 0.
+
+    Returns:
+        Callable[[float], float]: force as a function of time since start in seconds
+    """
+    return lambda t: force
+
+
+def step_force(
+    force: float = 50, period: float = 10, steps: int = 5
+) -> Callable[[float], float]:
+    """Force model that steps up by a fixed amount every period, then starts over
+
+    Args:
+        force (float, optional): force added each step. Defaults to 50.
+        period (float, optional): duration of each step in seconds. Defaults to 10.
+        steps (int, optional): number of steps before returning to zero. Defaults to 5.
+
+    Returns:
+        Callable[[float], float]: force as a function of time since start in seconds
+    """
+    return lambda t: force * (math.floor(t / period) % (steps + 1))
+
+
+def ramp_force(rate: float = 5, max_force: float = 250) -> Callable[[float], float]:
+    """Force model that ramps up linearly to a maximum, then starts over
+
+    Args:
+        rate (float, optional): force increase per second. Defaults to 5.
+        max_force (float, optional): force at which the ramp restarts. Defaults to 250.
+
+    Returns:
+        Callable[[float], float]: force as a function of time since start in seconds
+    """
+    return lambda t: (rate * t) % max_force
+
+
+def sine_force(
+    amplitude: float = 50, period: float = 10, offset: float = 50
+) -> Callable[[float], float]:
+    """Force model that oscillates sinusoidally
+
+    Args:
+        amplitude (float, optional): force amplitude. Defaults to 50.
+        period (float, optional): oscillation period in seconds. Defaults to 10.
+        offset (float, optional): mean force. Defaults to 50.
+
+    Returns:
+        Callable[[float], float]: force as a function of time since start in seconds
+    """
+    return lambda t: offset + amplitude * math.sin(2 * math.pi * t / period)
+
+
+FORCE_MODELS = {
+    "constant": constant_force,
+    "step": step_force,
+    "ramp": ramp_force,
+    "sine": sine_force,
+}
+"""Built-in force models by name"""
+
+
+class OpenScaleSimulator:
+    """Emits simulated OpenScale report lines on a pseudo-terminal at a fixed rate, in
+    the same format the board uses: comma-terminated fields (only the raw count by
+    default) followed by "\\r\\n", or as binary frames if binary output is turned on.
+    Lines that can't be written because the reader isn't keeping up are dropped and
+    counted, like a USB serial adapter with a full buffer. Sending "x" brings up a
+    configuration menu like the firmware's, where the report period, averaging, baud
+    rate, decimals, and serial trigger mode can be changed."""
+
+    def __init__(
+        self,
+        rate: float = 80,
+        force_model: Callable[[float], float] = None,
+        tare: float = 0,
+        calibration: float = 1000,
+        noise: float = 0,
+        spike_rate: float = 0,
+        spike_size: float = 0,
+        drift: float = 0,
+        seed: int = None,
+        binary: bool = False,
+        report_fields: list[str] = ("raw",),
+        temperature: float = 22,
+        clock_error: float = 0,
+        sample_rate: float = 80,
+        creep: float = 0,
+        creep_time: float = 30,
+        temperature_swing: float = 0,
+        temperature_period: float = 600,
+        temperature_coefficient: float = 0,
+    ):
+        """Set up a simulated OpenScale. Call start() to open the pseudo-terminal.
+
+        Args:
+            rate (float, optional): Report rate in Hz. Defaults to 80.
+            force_model (Callable[[float], float], optional): Force in load cell units as a
+            function of seconds since start. Defaults to no force.
+            tare (float, optional): Raw reading with no force applied. Defaults to 0.
+            calibration (float, optional): Raw counts per load cell unit, as stored by
+            OpenScale.calibrate(). Defaults to 1000.
+            noise (float, optional): Standard deviation of Gaussian noise in raw counts. Defaults to 0.
+            spike_rate (float, optional): Probability of any given reading being a spike. Defaults to 0.
+            spike_size (float, optional): Size of spikes in raw counts, randomly signed. Defaults to 0.
+            drift (float, optional): Zero drift in raw counts per second. Defaults to 0.
+            seed (int, optional): Random seed for repeatable noise. Defaults to None.
+            binary (bool, optional): Send binary frames like the firmware's binary output
+            mode instead of text lines. Defaults to False.
+            report_fields (list[str], optional): Fields in each text line, like
+            OpenScale.set_report_fields(). Defaults to just "raw".
+            temperature (float, optional): Reported temperature in C. Defaults to 22.
+            clock_error (float, optional): How fast the board's clock runs compared to the
+            host's, in parts per million. Defaults to 0.
+            sample_rate (float, optional): Conversions per second of the simulated HX711,
+            which limits how fast the menu lets the report rate be set. Defaults to 80.
+            creep (float, optional): Size of exponentially decaying zero creep at the start,
+            in raw counts. Defaults to 0.
+            creep_time (float, optional): Time constant of the creep in seconds. Defaults to 30.
+            temperature_swing (float, optional): Amplitude of a sinusoidal swing in
+            temperature around the reported temperature, in C. Defaults to 0.
+            temperature_period (float, optional): Period of the temperature swing in
+            seconds. Defaults to 600.
+            temperature_coefficient (float, optional): Zero shift in raw counts per degree
+            C away from the reported temperature. Defaults to 0.
+        """
+        self.rate = rate
+        """Report rate in Hz"""
+        self.force_model = force_model if force_model is not None else constant_force()
+        """Force in load cell units as a function of seconds since start"""
+        self.tare = tare
+        """Raw reading with no force applied"""
+        self.calibration = calibration
+        """Raw counts per load cell unit"""
+        self.noise = noise
+        """Standard deviation of Gaussian noise in raw counts"""
+        self.spike_rate = spike_rate
+        """Probability of any given reading being a spike"""
+        self.spike_size = spike_size
+        """Size of spikes in raw counts"""
+        self.drift = drift
+        """Zero drift in raw counts per second"""
+        self.creep = creep
+        """Size of exponentially decaying zero creep at the start, in raw counts"""
+        self.creep_time = creep_time
+        """Time constant of the creep in seconds"""
+        self.rng = np.random.default_rng(seed)
+        """Random number generator for noise and spikes"""
+        self.binary = binary
+        """Whether to send binary frames instead of text lines"""
+        self.report_fields = report_fields
+        """Fields in each text line"""
+        self.temperature = temperature
+        """Reported temperature in C, around which it swings"""
+        self.temperature_swing = temperature_swing
+        """Amplitude of the temperature swing in C"""
+        self.temperature_period = temperature_period
+        """Period of the temperature swing in seconds"""
+        self.temperature_coefficient = temperature_coefficient
+        """Zero shift in raw counts per degree C away from the reported temperature"""
+        self.clock_error = clock_error
+        """How fast the board's clock runs compared to the host's, in parts per million"""
+        self.sample_rate = sample_rate
+        """Conversions per second of the simulated HX711"""
+        self.average = 1
+        """Number of HX711 conversions averaged into each report, as set in the menu"""
+        self.baud = 115200
+        """Baud rate set in the menu. Has no effect on a pseudo-terminal"""
+        self.decimals = 2
+        """Decimal places in unit readings, as set in the menu"""
+        self.serial_trigger = False
+        """Whether to report only when sent the trigger character, as set in the menu"""
+        self.trigger_character = b"!"
+        """Character that triggers a reading in serial trigger mode"""
+        self.triggers_pending = 0
+        """Triggers received that haven't been answered yet"""
+
+        self.master_fd: int = None
+        """Simulator's end of the pseudo-terminal"""
+        self.slave_fd: int = None
+        """Host's end of the pseudo-terminal, kept open so the port doesn't vanish between connections"""
+        self.port: str = None
+        """Device path OpenScale should open"""
+        self.start_time: float = 0
+        """Host time the simulation started"""
+        self.lines_sent = 0
+        """Number of report lines written to the pseudo-terminal"""
+        self.lines_dropped = 0
+        """Number of report lines dropped because the reader wasn't keeping up"""
+        self.received = b""
+        """Everything the host has written to the simulated board"""
+        self.pending = b""
+        """Input received after the menu escape character that the menu hasn't read yet"""
+        self.stop_event = threading.Event()
+        """Set to stop the simulation"""
+        self.thread: threading.Thread = None
+        """Thread emitting report lines"""
+
+    def open(self) -> str:
+        """Opens the pseudo-terminal
+
+        Returns:
+            str: device path for OpenScale to open
+        """
+        self.master_fd, self.slave_fd = os.openpty()
+        tty.setraw(self.master_fd)
+        tty.setraw(self.slave_fd)  # no newline translation or echo
+        os.set_blocking(self.master_fd, False)
+        self.port = os.ttyname(self.slave_fd)
+        return self.port
+
+    def start(self) -> str:
+        """Opens the pseudo-terminal and starts emitting report lines in a background thread
+
+        Returns:
+            str: device path for OpenScale to open
+        """
+        if self.master_fd is None:
+            self.open()
+        self.stop_event.clear()
+        self.thread = threading.Thread(
+            name="openscale_simulator", target=self.run, daemon=True
+        )
+        self.thread.start()
+        return self.port
+
+    def stop(self):
+        """Stops emitting lines and closes the pseudo-terminal"""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+        for fd in (self.master_fd, self.slave_fd):
+            if fd is not None:
+                os.close(fd)
+        self.master_fd = None
+        self.slave_fd = None
+
+    def raw_readings(self, sample_times: np.ndarray) -> np.ndarray:
+        """Computes simulated raw readings
+
+        Args:
+            sample_times (np.ndarray): seconds since start of each reading
+
+        Returns:
+            np.ndarray: raw readings as int64
+        """
+        forces = np.array([self.force_model(t) for t in sample_times])
+        raws = self.tare + self.calibration * forces + self.drift * sample_times
+        if self.temperature_coefficient != 0:
+            raws += self.temperature_coefficient * (
+                self.temperatures(sample_times) - self.temperature
+            )
+        if self.creep != 0:
+            raws += self.creep * np.exp(-sample_times / self.creep_time)
+        if self.noise > 0:
+            raws += self.rng.normal(0, self.noise, len(raws))
+        if self.spike_rate > 0:
+            spikes = self.rng.random(len(raws)) < self.spike_rate
+            raws[spikes] += self.spike_size * self.rng.choice((-1, 1), spikes.sum())
+        return np.round(raws).astype(np.int64)
+
+    def temperatures(self, sample_times: np.ndarray) -> np.ndarray:
+        """Computes the simulated board temperature
+
+        Args:
+            sample_times (np.ndarray): seconds since start of each reading
+
+        Returns:
+            np.ndarray: temperature in C at each reading
+        """
+        return self.temperature + self.temperature_swing * np.sin(
+            2 * np.pi * sample_times / self.temperature_period
+        )
+
+    def board_times(self, sample_times: np.ndarray) -> np.ndarray:
+        """Converts seconds since start to what the board's own clock reads
+
+        Args:
+            sample_times (np.ndarray): seconds since start on the host clock
+
+        Returns:
+            np.ndarray: seconds since start on the board clock
+        """
+        return sample_times * (1 + self.clock_error * 1e-6)
+
+    def format_lines(self, sample_times: np.ndarray, raws: np.ndarray) -> list[bytes]:
+        """Formats raw readings the way the OpenScale reports them
+
+        Args:
+            sample_times (np.ndarray): seconds since start of each reading
+            raws (np.ndarray): raw readings
+
+        Returns:
+            list[bytes]: one report line per reading
+        """
+        if tuple(self.report_fields) == ("raw",):
+            return [b"%d,\r\n" % raw for raw in raws]
+        millis = (self.board_times(sample_times) * 1e3).astype(np.int64) & 0xFFFFFFFF
+        temperatures = self.temperatures(sample_times)
+        lines = []
+        for board_millis, raw, temperature in zip(millis, raws, temperatures):
+            fields = []
+            if "timestamp" in self.report_fields:
+                fields.append(b"%d" % board_millis)
+            if "units" in self.report_fields:
+                units = (raw - self.tare) / self.calibration
+                fields.append(b"%.*f,kg" % (self.decimals, units))
+            fields.append(b"%d" % raw)
+            if "local_temp" in self.report_fields:
+                fields.append(b"%.2f" % temperature)
+            if "remote_temp" in self.report_fields:
+                fields.append(b"%.2f" % temperature)
+            lines.append(b",".join(fields) + b",\r\n")
+        return lines
+
+    @staticmethod
+    def crc8(data: bytes) -> int:
+        """CRC-8 with polynomial 0x07 and initial value 0, the same as the firmware
+
+        Args:
+            data (bytes): bytes to check
+
+        Returns:
+            int: CRC of the bytes
+        """
+        crc = 0
+        for byte in data:
+            crc ^= byte
+            for _ in range(8):
+                crc = ((crc << 1) ^ 0x07) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+        return crc
+
+    def format_frames(
+        self, first_seq: int, sample_times: np.ndarray, raws: np.ndarray
+    ) -> list[bytes]:
+        """Formats raw readings the way the firmware's binary output mode sends them, see
+        OpenScale/openscale.h for the layout
+
+        Args:
+            first_seq (int): sequence number of the first reading
+            sample_times (np.ndarray): seconds since start of each reading
+            raws (np.ndarray): raw readings
+
+        Returns:
+            list[bytes]: one frame per reading
+        """
+        frames = []
+        for i, (sample_time, raw) in enumerate(zip(sample_times, raws)):
+            body = struct.pack(
+                "<HI",
+                (first_seq + i) & 0xFFFF,
+                int(self.board_times(sample_time) * 1e6) & 0xFFFFFFFF,
+            ) + (int(raw) & 0xFFFFFF).to_bytes(3, "little")
+            frames.append(b"\xa5\x5a" + body + bytes((OpenScaleSimulator.crc8(body),)))
+        return frames
+
+    def write_line(self, line: bytes) -> bool:
+        """Writes one line to the pseudo-terminal without blocking
+
+        Args:
+            line (bytes): line to write
+
+        Returns:
+            bool: False if it was dropped because the reader isn't keeping up
+        """
+        try:
+            written = os.write(self.master_fd, line)
+        except OSError as e:
+            if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return False
+            raise
+        if written < len(line):  # finish a partial line so the stream stays parseable
+            os.set_blocking(self.master_fd, True)
+            os.write(self.master_fd, line[written:])
+            os.set_blocking(self.master_fd, False)
+        return True
+
+    def write_text(self, text: bytes):
+        """Writes menu text to the pseudo-terminal, waiting for room instead of dropping it
+
+        Args:
+            text (bytes): text to write
+        """
+        os.set_blocking(self.master_fd, True)
+        os.write(self.master_fd, text)
+        os.set_blocking(self.master_fd, False)
+
+    def read_input(self) -> bool:
+        """Collects anything the host has written to the simulated board, counting any
+        triggers in triggers_pending
+
+        Returns:
+            bool: whether the host sent the menu escape character
+        """
+        try:
+            data = os.read(self.master_fd, 1024)
+        except OSError as e:
+            if e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EIO):
+                raise
+            return False
+        self.received += data
+        escape = data.find(b"x")
+        if escape >= 0:
+            self.pending = data[escape + 1 :]
+            data = data[:escape]
+        if self.serial_trigger:
+            self.triggers_pending += data.count(self.trigger_character)
+        return escape >= 0
+
+    def read_char(self) -> bytes:
+        """Waits for the next character from the host, for the menu
+
+        Returns:
+            bytes: the character, or the exit command if the simulator is stopped
+        """
+        while not self.pending:
+            if self.stop_event.is_set():
+                return b"x"
+            try:
+                data = os.read(self.master_fd, 1024)
+            except OSError as e:
+                if e.errno not in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EIO):
+                    raise
+                sleep(0.001)
+                continue
+            self.received += data
+            self.pending += data
+        char, self.pending = self.pending[:1], self.pending[1:]
+        return char
+
+    def read_menu_line(self) -> bytes:
+        """Reads and echoes a line typed into the menu, like the firmware's read_line()
+
+        Returns:
+            bytes: the line, without the carriage return
+        """
+        line = b""
+        while True:
+            char = self.read_char()
+            self.write_text(char)
+            if char == b"\r":
+                self.write_text(b"\r\n")
+                return line
+            if char != b"\n":
+                line += char
+
+    def minimum_report_period(self) -> int:
+        """Shortest time between reports the menu allows, like the firmware's
+        calcMinimumReadTime()
+
+        Returns:
+            int: time in ms
+        """
+        characters = 12 if self.binary else len(b"8355808")  # frame or raw reading
+        return math.ceil(
+            self.average * 1000 / self.sample_rate + characters * 10000 / self.baud
+        )
+
+    def menu_text(self) -> bytes:
+        """Builds the configuration menu the way the firmware prints it
+
+        Returns:
+            bytes: the menu, ending at the command prompt
+        """
+        on_off = {True: b"On", False: b"Off"}
+        lines = [
+            b"\r\nSerial Load Cell Converter version 1.3 (simulated)",
+            b"No remote sensor found",
+            b"System Configuration",
+            b"1) Tare scale to zero [%d]" % self.tare,
+            b"2) Calibrate scale [%d]" % self.calibration,
+            b"3) Timestamp [%s]" % on_off["timestamp" in self.report_fields],
+            b"4) Set report rate [%d]" % round(1000 / self.rate),
+            b"5) Set baud rate [%d bps]" % self.baud,
+            b"6) Change units of measure [kg]",
+            b"7) Decimals [%d]" % self.decimals,
+            b"8) Average amount [%d]" % self.average,
+            b"9) Local temp [%s]" % on_off["local_temp" in self.report_fields],
+            b"r) Remote temp [%s]" % on_off["remote_temp" in self.report_fields],
+            b"s) Status LED [Off]",
+            b"q) Raw reading [%s]" % on_off["raw" in self.report_fields],
+            b"u) Unit reading [%s]" % on_off["units" in self.report_fields],
+            b"t) Serial trigger [%s]" % on_off[self.serial_trigger],
+            b"c) Trigger character: [%d / '%s']"
+            % (ord(self.trigger_character), self.trigger_character),
+            b"b) Binary output [%s]" % on_off[self.binary],
+            b"x) Exit",
+        ]
+        return b"\r\n".join(lines) + b"\r\n>"
+
+    def menu(self):
+        """Runs the configuration menu until the host exits it. Supports changing the
+        report rate, baud rate, decimals, and averaging."""
+        while True:
+            self.write_text(self.menu_text())
+            command = self.read_char()
+            if command == b"x":
+                self.write_text(b"Exiting\r\n")
+                return
+            if command == b"4":
+                minimum = self.minimum_report_period()
+                self.write_text(
+                    b"\n\n\rSet time between reports\r\nMinimum: %dms\r\n"
+                    b"Current Time: %dms\r\nEnter new time (ms): "
+                    % (minimum, max(round(1000 / self.rate), minimum))
+                )
+                line = self.read_menu_line()
+                if line.isdigit() and int(line) > minimum:
+                    self.rate = 1000 / int(line)
+                    self.write_text(b"Time between reports now: %sms\r\n" % line)
+                else:
+                    self.write_text(b"Error: Out of bounds\r\n")
+            elif command == b"5":
+                self.write_text(
+                    b"\n\n\rCurrent rate: %d bps\r\n"
+                    b"Enter new baud rate ('x' to abort):\r\n>" % self.baud
+                )
+                line = self.read_menu_line()
+                if line.startswith(b"x"):
+                    self.write_text(b"Exiting\r\n")
+                elif line.isdigit() and 1200 <= int(line) <= 1000000:
+                    self.baud = int(line)
+                    self.write_text(b"Going to %dbps\r\n" % self.baud)
+                else:
+                    self.write_text(b"Out of bounds\r\n")
+            elif command == b"t":
+                self.serial_trigger = not self.serial_trigger
+                self.write_text(
+                    b"\n\rSerial trigger o%s\r\n"
+                    % (b"n" if self.serial_trigger else b"ff")
+                )
+            elif command == b"c":
+                self.write_text(b"\n\rEnter new trigger character: ")
+                self.trigger_character = self.read_char()
+                self.write_text(
+                    b"\r\n\n\rNew character: %d" % ord(self.trigger_character)
+                )
+            elif command == b"7":
+                self.write_text(
+                    b"\n\n\rEnter the number of decimals to display (0 to 4): "
+                )
+                line = self.read_menu_line()
+                if line.isdigit() and 0 <= int(line) <= 4:
+                    self.decimals = int(line)
+                    self.write_text(b"Decimal places: %s\r\n" % line)
+                else:
+                    self.write_text(b"Error: Out of bounds\r\n")
+            elif command == b"8":
+                self.write_text(
+                    b"\n\n\rEnter the number of readings to average together "
+                    b"(1 to 64): "
+                )
+                line = self.read_menu_line()
+                if line.isdigit() and 1 <= int(line) <= 64:
+                    self.average = int(line)
+                    self.write_text(b"Average amount: %s\r\n" % line)
+                else:
+                    self.write_text(b"Error: Out of bounds\r\n")
+
+    def send_readings(self, sample_times: np.ndarray):
+        """Takes readings and sends them to the host
+
+        Args:
+            sample_times (np.ndarray): seconds since start of each reading
+        """
+        first = self.lines_sent + self.lines_dropped
+        raws = self.raw_readings(sample_times)
+        if self.binary:
+            lines = self.format_frames(first, sample_times, raws)
+        else:
+            lines = self.format_lines(sample_times, raws)
+        for line in lines:
+            if self.write_line(line):
+                self.lines_sent += 1
+            else:
+                self.lines_dropped += 1
+
+    def run(self):
+        """Emits report lines until stopped. Lines are scheduled against the start time,
+        so a late wakeup sends every line that has come due instead of drifting. In serial
+        trigger mode, sends one line for each trigger instead, after the time it takes
+        the HX711 to do the averaged reading."""
+        if not self.binary:
+            self.write_line(b"Readings:\r\n")
+
+        self.start_time = time()
+        next_time = 0.0  # seconds since start the next line is due
+        while not self.stop_event.is_set():
+            escaped = self.read_input()
+            while self.triggers_pending > 0:
+                sleep(self.average / self.sample_rate)
+                self.send_readings(np.array([time() - self.start_time]))
+                self.triggers_pending -= 1
+            if escaped:
+                self.menu()
+                next_time = time() - self.start_time
+                continue
+
+            now = time() - self.start_time
+            if self.serial_trigger:
+                next_time = now + 0.01
+            elif now >= next_time:
+                count = int((now - next_time) * self.rate) + 1
+                sample_times = next_time + np.arange(count) / self.rate
+                next_time = sample_times[-1] + 1 / self.rate
+                self.send_readings(sample_times)
+            # Wait for the next line to come due, waking early if the host sends anything
+            wait = max(min(next_time - (time() - self.start_time), 0.01), 0)
+            select.select([self.master_fd], [], [], wait)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("--rate", type=float, default=80, help="report rate in Hz")
+    parser.add_argument(
+        "--model", choices=FORCE_MODELS, default="constant", help="force signal"
+    )
+    parser.add_argument(
+        "--noise", type=float, default=0, help="Gaussian noise std in raw counts"
+    )
+    parser.add_argument(
+        "--spike-rate", type=float, default=0, help="probability of a spike per line"
+    )
+    parser.add_argument(
+        "--spike-size", type=float, default=0, help="spike size in raw counts"
+    )
+    parser.add_argument(
+        "--drift", type=float, default=0, help="zero drift in raw counts per second"
+    )
+    parser.add_argument(
+        "--creep", type=float, default=0, help="zero creep at start in raw counts"
+    )
+    parser.add_argument(
+        "--creep-time", type=float, default=30, help="creep time constant in seconds"
+    )
+    parser.add_argument(
+        "--temperature-swing",
+        type=float,
+        default=0,
+        help="amplitude of temperature swing in C",
+    )
+    parser.add_argument(
+        "--temperature-coefficient",
+        type=float,
+        default=0,
+        help="zero shift in raw counts per degree C",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    parser.add_argument(
+        "--binary", action="store_true", help="send binary frames instead of text"
+    )
+    parser.add_argument(
+        "--fields",
+        nargs="+",
+        default=["raw"],
+        help="fields in each text line, ex: timestamp raw local_temp",
+    )
+    parser.add_argument(
+        "--clock-error",
+        type=float,
+        default=0,
+        help="board clock speed error in parts per million",
+    )
+    parser.add_argument(
+        "--config",
+        default=os.path.join("LoadCell", "config.json"),
+        help="load cell config to take tare and calibration from",
+    )
+    args = parser.parse_args()
+
+    config = {}
+    if os.path.exists(args.config):
+        with open(args.config, "r") as read_file:
+            config = json.load(read_file)
+
+    simulator = OpenScaleSimulator(
+        rate=args.rate,
+        force_model=FORCE_MODELS[args.model](),
+        tare=config.get("tare", 0),
+        calibration=config.get("calibration", 1000),
+        noise=args.noise,
+        spike_rate=args.spike_rate,
+        spike_size=args.spike_size,
+        drift=args.drift,
+        creep=args.creep,
+        creep_time=args.creep_time,
+        temperature_swing=args.temperature_swing,
+        temperature_coefficient=args.temperature_coefficient,
+        seed=args.seed,
+        binary=args.binary,
+        report_fields=args.fields,
+        clock_error=args.clock_error,
+    )
+    port = simulator.start()
+    print(f"Simulated OpenScale at {port}, reporting at {args.rate:g}Hz")
+    print(f"Run the host side with OPENSCALE_PORT={port}")
+    try:
+        while True:
+            sleep(1)
+            print(
+                f"sent: {simulator.lines_sent:9d}, dropped: {simulator.lines_dropped:7d}"
+            )
+    except KeyboardInterrupt:
+        simulator.stop()
@@ -102,6 +102,11 @@ void system_setup(void)
     Serial.write(setting_trigger_character);
     Serial.println(F("']"));
 
+    Serial.print(F("b) Binary output [O"));
+    if (setting_binary_output_enable == true) Serial.print(F("n"));
+    else Serial.print(F("ff"));
+    Serial.println(F("]"));
+
 
     Serial.println(F("x) Exit"));
     Serial.print(F(">"));
@@ -284,6 +289,21 @@ void system_setup(void)
 
       record_system_settings();
     }
+    else if (command == 'b')
+    {
+      Serial.print(F("\n\rBinary output o"));
+      if (setting_binary_output_enable == true)
+      {
+        Serial.println(F("ff"));
+        setting_binary_output_enable = false;
+      }
+      else
+      {
+        Serial.println(F("n"));
+        setting_binary_output_enable = true;
+      }
+      record_system_settings();
+    }
     else if (command == 'x')
     {
       //Do nothing, just exit
@@ -528,6 +548,16 @@ int calcMinimumReadTime(void)
   //Calculate number of characters per report
   int characters = 0;
 
+  //Binary frames only carry the raw reading, in a fixed number of bytes
+  if (setting_binary_output_enable)
+  {
+    long startTime = millis();
+    scale.read_average(setting_average_amount); //Do a dummy read and time it
+    averageReadTime = ceil((millis() - startTime));
+
+    return (averageReadTime + ceil((float)BINARY_FRAME_SIZE * characterTime));
+  }
+
   if (setting_timestamp_enable) characters += strlen("51588595,"); //Timestamp has characters
 
   if (setting_local_temp_enable)
@@ -55,6 +55,9 @@
   to text enter. Now you can calibrate your system by typing in '0.5762' and OpenScale
   will figure out all the calibration factors.
   * Fixed a bug with the EEPROM defaulting to the wrong values
+  v1.3 - Added opt-in binary output frames with sequence number, microsecond timestamp and CRC
+  v1.4 - In serial trigger mode, report as soon as triggered instead of waiting out the report rate,
+  and don't drop triggers that arrive early
 */
 
 #include "HX711.h" //Original Repository Created by Bodge https://github.com/bogde/HX711
@@ -66,7 +69,7 @@
 #include <avr/sleep.h> //Needed for sleep_mode
 #include <avr/power.h> //Needed for powering down perihperals such as the ADC/TWI and Timers
 
-#define FIRMWARE_VERSION "1.2"
+#define FIRMWARE_VERSION "1.4"
 
 //Global variables
 //-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
@@ -85,6 +88,8 @@ byte setting_serial_trigger_enable; //Takes reading when serial character is rec
 byte setting_raw_reading_enable; //Prints the raw, 24bit, long from the HX711, ex: 8355808
 byte setting_unit_reading_enable; //Prints the raw, 24bit, long from the HX711, ex: 8355808
 byte setting_trigger_character; //The character that will cause OpenScale to report a reading
+byte setting_binary_output_enable; //Sends each raw reading as a compact binary frame instead of text
+unsigned int binarySequence = 0; //Sequence number of the next binary frame, lets the host spot dropped frames
 boolean setupMode = false; //This is set to true if user presses x
 
 const byte escape_character = 'x'; //This is the ASCII character we look for to break reporting
@@ -159,62 +164,79 @@ void loop()
 
   long startTime = millis();
 
-  //Print time stamp
-  if (setting_timestamp_enable)
+  //Send a binary frame instead of a text report
+  if (setting_binary_output_enable)
   {
-    Serial.print(startTime);
-    Serial.print(F(","));
-  }
-
-  //Print calibrated reading
-  if (setting_unit_reading_enable){
+    unsigned long readingMicros = micros();
+    long rawReading = scale.read_average(setting_average_amount); //Take average reading over a given number of times
+    sendBinaryFrame(rawReading, readingMicros);
 
-    //Take average of readings with calibration and tare taken into account
-    float currentReading = scale.get_units(setting_average_amount);
-    Serial.print(currentReading, setting_decimal_places);
-    Serial.print(F(","));
-    if (setting_units == UNITS_LBS) Serial.print(F("lbs"));
-    if (setting_units == UNITS_KG) Serial.print(F("kg"));
-    Serial.print(F(","));
+    if (setting_status_enable) toggleLED();
+    Serial.flush();
   }
 
-  //Print raw reading
-  if (setting_raw_reading_enable)
+  //Otherwise print a text report
+  else
   {
-    long rawReading = scale.read_average(setting_average_amount); //Take average reading over a given number of times
+    //Print time stamp
+    if (setting_timestamp_enable)
+    {
+      Serial.print(startTime);
+      Serial.print(F(","));
+    }
 
-    Serial.print(rawReading);
-    Serial.print(F(","));
-  }
+    //Print calibrated reading
+    if (setting_unit_reading_enable){
 
-  //Print local temp
-  if (setting_local_temp_enable)
-  {
-    Serial.print(getLocalTemperature(), setting_decimal_places);
-    Serial.print(F(","));
-  }
+      //Take average of readings with calibration and tare taken into account
+      float currentReading = scale.get_units(setting_average_amount);
+      Serial.print(currentReading, setting_decimal_places);
+      Serial.print(F(","));
+      if (setting_units == UNITS_LBS) Serial.print(F("lbs"));
+      if (setting_units == UNITS_KG) Serial.print(F("kg"));
+      Serial.print(F(","));
+    }
 
-  //Print remote temp
-  if (setting_remote_temp_enable)
-  {
-    if (remoteSensorAttached)
+    //Print raw reading
+    if (setting_raw_reading_enable)
     {
-      Serial.print(getRemoteTemperature(), setting_decimal_places);
+      long rawReading = scale.read_average(setting_average_amount); //Take average reading over a given number of times
+
+      Serial.print(rawReading);
       Serial.print(F(","));
     }
-    else
+
+    //Print local temp
+    if (setting_local_temp_enable)
     {
-      Serial.print(F("0,")); //There is no sensor to check
+      Serial.print(getLocalTemperature(), setting_decimal_places);
+      Serial.print(F(","));
     }
-  }
 
-  if (setting_status_enable) toggleLED();
+    //Print remote temp
+    if (setting_remote_temp_enable)
+    {
+      if (remoteSensorAttached)
+      {
+        Serial.print(getRemoteTemperature(), setting_decimal_places);
+        Serial.print(F(","));
+      }
+      else
+      {
+        Serial.print(F("0,")); //There is no sensor to check
+      }
+    }
+
+    if (setting_status_enable) toggleLED();
 
-  Serial.println();
-  Serial.flush();
+    Serial.println();
+    Serial.flush();
+  }
 
   //Hang out until the end of this report period
-  while (1)
+  //When serially triggered the host sets the pace, so skip this. Reading here would also eat
+  //a trigger character that arrived early, stalling the host until its timeout
+  while (setting_serial_trigger_enable == false)
   {
     //If we see escape char then drop to setup menu
     if (Serial.available())
@@ -239,8 +261,7 @@ void loop()
   {
     //Power everything down and go to sleep until a char is received
 
-    delay(100); //Give the micro time to clear out the transmit buffer
-    //Any less than this and micro doesn't sleep
+    Serial.flush(); //Wait for the transmit buffer to clear out, otherwise the micro doesn't sleep
 
     char incoming = 0;
 
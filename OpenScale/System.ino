@@ -107,6 +107,9 @@ void set_default_settings(void)
   //Reset trigger character
   setting_trigger_character = '!';
 
+  //Reset binary output
+  setting_binary_output_enable = false;
+
   //Commit these new settings to memory
   record_system_settings();
 }
@@ -141,6 +144,8 @@ void record_system_settings(void)
   EEPROM.write(LOCATION_RAW_READING_ENABLE, setting_raw_reading_enable);
 
   EEPROM.write(LOCATION_TRIGGER_CHARACTER, setting_trigger_character);
+
+  EEPROM.write(LOCATION_BINARY_OUTPUT_ENABLE, setting_binary_output_enable);
 }
 
 //Reads the current system settings from EEPROM
@@ -259,6 +264,14 @@ void readSystemSettings(void)
     EEPROM.write(LOCATION_TRIGGER_CHARACTER, setting_trigger_character);
   }
 
+  //Look up if we send binary frames instead of text
+  setting_binary_output_enable = EEPROM.read(LOCATION_BINARY_OUTPUT_ENABLE);
+  if (setting_binary_output_enable > 1)
+  {
+    setting_binary_output_enable = false; //Default to false
+    EEPROM.write(LOCATION_BINARY_OUTPUT_ENABLE, setting_binary_output_enable);
+  }
+
 }
 
 //Record a series of bytes to EEPROM starting at address
@@ -285,6 +298,41 @@ long readBytes(byte address, byte sizeOfSetting)
   return (setting);
 }
 
+//CRC-8 with polynomial 0x07 and initial value 0, used to check binary frames
+byte crc8(const byte* data, byte length)
+{
+  byte crc = 0;
+  for (byte x = 0 ; x < length ; x++)
+  {
+    crc ^= data[x];
+    for (byte bit = 0 ; bit < 8 ; bit++)
+    {
+      if (crc & 0x80) crc = (crc << 1) ^ 0x07;
+      else crc <<= 1;
+    }
+  }
+  return crc;
+}
+
+//Send one raw reading as a binary frame, see openscale.h for the layout
+void sendBinaryFrame(long rawReading, unsigned long readingMicros)
+{
+  byte frame[BINARY_FRAME_SIZE];
+
+  frame[0] = BINARY_SYNC_1;
+  frame[1] = BINARY_SYNC_2;
+  frame[2] = binarySequence & 0xFF;
+  frame[3] = binarySequence >> 8;
+  for (byte x = 0 ; x < 4 ; x++)
+    frame[4 + x] = readingMicros >> (8 * x);
+  for (byte x = 0 ; x < 3 ; x++)
+    frame[8 + x] = rawReading >> (8 * x); //HX711 readings fit in 24 bits
+  frame[11] = crc8(frame + 2, BINARY_FRAME_SIZE - 3);
+
+  Serial.write(frame, BINARY_FRAME_SIZE);
+  binarySequence++;
+}
+
 //Reads the user's input until the \n enter character is found
 //Allows user to use the backspace key
 byte read_line(char* buffer, byte buffer_length)
@@ -29,6 +29,7 @@
 #define LOCATION_SERIAL_TRIGGER_ENABLE          (LOCATION_MASS_UNITS + 21)
 #define LOCATION_RAW_READING_ENABLE             (LOCATION_MASS_UNITS + 22)
 #define LOCATION_TRIGGER_CHARACTER              (LOCATION_MASS_UNITS + 23)
+#define LOCATION_BINARY_OUTPUT_ENABLE           (LOCATION_MASS_UNITS + 24)
 
 //Arduino doesn't properly handle bauds lower than 500bps
 #define BAUD_MIN  1200
@@ -36,3 +37,10 @@
 
 #define UNITS_KG  0
 #define UNITS_LBS 1
+
+//Binary output frame, all fields little endian:
+//sync (2 bytes), sequence number (uint16), micros() at start of reading (uint32),
+//raw reading (int24), CRC-8 of sequence through raw reading (poly 0x07, init 0x00)
+#define BINARY_SYNC_1      0xA5
+#define BINARY_SYNC_2      0x5A
+#define BINARY_FRAME_SIZE  12
@@ -23,6 +23,7 @@ if __name__ == "__main__":
     targets = SqueezeFlowRheometer.input_targets(sfr.units, sfr.test_settings)
     sfr.target = targets[0]  # start at first step
     sfr.start_gap = SqueezeFlowRheometer.input_start_gap(sfr)
+    sfr.start_estimator()
     sfr.step_duration = SqueezeFlowRheometer.input_step_duration(sfr.default_duration)
     sfr.sample_volume = SqueezeFlowRheometer.input_sample_volume()
     sample_str = input("What's the sample made of? This will be used for file naming. ")
@@ -75,6 +76,10 @@ def actuator_thread():
     sfr.set_vel_mms(approach_velocity)
     while True:
         sfr.heartbeat()
+        sfr.trigger_force_update()  # only reads the load cell here in trigger mode
+        if not sfr.wait_out_stall():  # load cell readings stopped
+            sfr.end_test(fig)
+            return
         if abs(sfr.force) > sfr.force_limit:
             sfr.end_test(fig)
             return
@@ -117,6 +122,11 @@ def actuator_thread():
     mute_derivative_term_steps = 0
     mute_derivative_term_steps_max = 100
     while True:
+        sfr.trigger_force_update()  # only reads the load cell here in trigger mode
+        if not sfr.wait_out_stall():  # load cell readings stopped
+            sfr.end_test(fig)
+            return
+
         # Check if force beyond max amount
         if abs(sfr.force) > sfr.force_limit:
             print(f"Force was too large, stopping - {sfr.force:3.2f}{sfr.units}")
@@ -124,8 +134,11 @@ def actuator_thread():
             return
 
         # Check if went too far
-        cur_pos_mm = sfr.get_pos_mm()
-        gap_m = (cur_pos_mm + sfr.start_gap) / 1000.0  # current gap in m
+        cur_pos_mm = sfr.poll_actuator()
+        # Estimated force and its rate are less noisy and less late than the raw samples
+        force, force_rate, gap_m = sfr.estimate()  # gap in m
+        error = sfr.target - force
+        der_error = -force_rate
         if cur_pos_mm >= sfr.start_gap:
             print("Hit the hard-stop, stopping.")
             sfr.end_test(fig)
@@ -157,14 +170,14 @@ def actuator_thread():
 
         # vel_P = -K_P * error
         vel_P = (
-            -sfr.variable_K_P(sfr.error, step_increase) * sfr.error
+            -sfr.variable_K_P(error, step_increase) * error
         )  # Proportional component of velocity response
         vel_I = -sfr.K_I * sfr.int_error  # Integral component of velocity response
-        vel_D = -sfr.K_D * sfr.der_error  # Derivative component of velocity response
+        vel_D = -sfr.K_D * der_error  # Derivative component of velocity response
 
         if mute_derivative_term_steps > 0:
             mute_derivative_term_steps = mute_derivative_term_steps - 1
-            sfr.der_error = 0
+            der_error = 0
             vel_D = 0
 
         # v_new = vel_P + vel_D + vel_I # modified PID control
@@ -176,8 +189,8 @@ def actuator_thread():
         sfr.set_vel_mms(v_new)
 
         out_str = (
-            f"{sfr.force:6.2f}{sfr.units}, err = {sfr.error:6.2f}, "
-            + f"errI = {sfr.int_error:6.2f}, errD = {sfr.der_error:7.2f}, "
+            f"{force:6.2f}{sfr.units}, err = {error:6.2f}, "
+            + f"errI = {sfr.int_error:6.2f}, errD = {der_error:7.2f}, "
             + f"gap = {gap_m * 1000:6.2f}mm, v = {v_new:11.5f} : vP = {vel_P:6.2f}, "
             + f"vI = {vel_I:6.2f}, vD = {vel_D:6.2f}"
         )
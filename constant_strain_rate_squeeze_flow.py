@@ -74,6 +74,9 @@ def actuator_thread():
     sfr.set_vel_mms(approach_velocity)
     while True:
         sfr.heartbeat()
+        if not sfr.wait_out_stall():  # load cell readings stopped
+            sfr.end_test(fig)
+            return
         if abs(sfr.force) > sfr.force_limit:
             sfr.end_test(fig)
             break
@@ -109,6 +112,10 @@ def actuator_thread():
     step_start_time = time()
 
     while True:
+        if not sfr.wait_out_stall():  # load cell readings stopped
+            sfr.end_test(fig)
+            return
+
         # Check if force beyond max amount
         if abs(sfr.force) > sfr.force_limit:
             print(f"Force was too large, stopping - {sfr.force:3.2f}{sfr.units}")
@@ -76,7 +76,10 @@ def actuator_thread():
     print(f"Target gap is {target_gap:.2f}mm")
     target_pos = target_gap - sfr.start_gap
 
-    sfr.move_to_mm(target_pos)  # Move continuously to the target gap
+    # Move continuously to the target gap
+    if not sfr.move_to_mm_through_stalls(target_pos):  # load cell readings stopped
+        sfr.end_test(fig)
+        return
     sfr.heartbeat()
 
     # Track movement start time
@@ -94,13 +97,15 @@ def actuator_thread():
                         
         sleep(0.1)  # Check the position every 0.1 seconds
         sfr.heartbeat()
+        if not sfr.wait_out_stall():  # load cell readings stopped
+            sfr.end_test(fig)
+            return
 
     print("Reached position, waiting")
 
-    rest_start_time = time()
-    while time() - rest_start_time <= sfr.step_duration:
-        sleep(0.1)
-        sfr.heartbeat()
+    if not sfr.rest_for(sfr.step_duration):  # load cell readings stopped
+        sfr.end_test(fig)
+        return
 
     print("Test is done.")
     sfr.test_active = False
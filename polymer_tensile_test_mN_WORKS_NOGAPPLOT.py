@@ -82,7 +82,9 @@ def actuator_thread():
     print(f"Target gap is {target_gap:.2f}mm")
     target_pos = target_gap - sfr.start_gap
     sfr.heartbeat()
-    sfr.move_to_mm(target_pos)
+    if not sfr.move_to_mm_through_stalls(target_pos):  # load cell readings stopped
+        sfr.end_test(fig)
+        return
     sfr.heartbeat()
     print("Reached position, waiting")
 
@@ -105,6 +107,9 @@ def actuator_thread():
             mm_count += actuator_speed  # Adjust to match the correct increment
             sfr.move_to_mm(mm_count)
         sfr.heartbeat()
+        if not sfr.wait_out_stall():  # load cell readings stopped
+            sfr.end_test(fig)
+            return
 
     print("Test is done.")
     sfr.test_active = False
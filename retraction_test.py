@@ -83,10 +83,9 @@ def actuator_thread():
     print("Reached start position. Pausing for {:d} second(s).".format(pause_time))
 
     sfr.set_max_speed_mms(retract_speed)
-    for i in range(0, int(pause_time / 0.1)):
-        sfr.heartbeat()
-        sleep(0.1)
-        sfr.heartbeat()
+    if not sfr.rest_for(pause_time):  # load cell readings stopped
+        sfr.end_test(fig)
+        return
 
     # Now that test is about to start, throw away most of the pre-test data.
     data_keep_time = 2  # how many seconds to keep
@@ -104,7 +103,10 @@ def actuator_thread():
     print("Starting retraction.")
     test_active = True
     print(sfr.get_pos_mm())
-    sfr.move_to_mm(0)
+    if not sfr.move_to_mm_through_stalls(0):  # load cell readings stopped
+        test_active = False
+        sfr.end_test(fig)
+        return
     print(sfr.get_pos_mm())
     test_active = False
     print("Retraction complete.")
@@ -64,6 +64,8 @@ def actuator_thread():
     sfr.set_vel_mms(approach_velocity)
     while abs(sfr.force) < sfr.force_limit:
         sfr.heartbeat()
+        if not sfr.wait_out_stall():  # load cell readings stopped
+            break
         gap_mm = sfr.get_gap() * 1000
         out_str = f"F = {sfr.force:7.3f}{sfr.units}, pos = {gap_mm:8.3f}mm"
         print(out_str)
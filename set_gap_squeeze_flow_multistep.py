@@ -93,14 +93,15 @@ def actuator_thread():
         sfr.set_max_speed_mms(max_speed)
 
         sfr.heartbeat()
-        sfr.move_to_mm(target_pos)
+        if not sfr.move_to_mm_through_stalls(target_pos):  # load cell readings stopped
+            sfr.end_test(fig)
+            return
         sfr.heartbeat()
         print("Reached position, waiting")
 
-        step_rest_start_time = time()
-        while time() - step_rest_start_time <= step_rest_length:
-            sleep(0.1)
-            sfr.heartbeat()
+        if not sfr.rest_for(step_rest_length):  # load cell readings stopped
+            sfr.end_test(fig)
+            return
 
     print("Last step complete. Test is done.")
     sfr.test_active = False
@@ -9,9 +9,179 @@ import threading
 from time import sleep, time
 import json
 import os
+import numpy as np
 from matplotlib.figure import Figure
-from LoadCell.openscale import OpenScale
-from Actuator.ticactuator import TicActuator
+from LoadCell.openscale import OpenScale, OpenScaleArray
+from Actuator.ticactuator import TicActuator, TicReadTimeout, TicSnapshot
+
+
+class ForceGapEstimator:
+    """Kalman filter that fuses timestamped load cell samples with actuator position and
+    velocity polls into one estimate of force, its rate of change, and the gap, which
+    can be read out at any time instead of waiting for the next reading.
+
+    State is [force, dF/dt, position in mm, velocity in mm/s]. Force is modeled as
+    changing at a steady rate disturbed by random jerk (the sample's response), and the
+    actuator as moving at a steady velocity disturbed by random acceleration. The frame
+    stretches under load, so the gap is the actuator's gap plus frame compliance times
+    force.
+
+    Load cell samples are usually older than the state by the time they arrive. Rather
+    than rewinding, a late measurement is compared against the state extrapolated back to
+    when it was taken.
+    """
+
+    def __init__(
+        self,
+        start_gap: float,
+        force_noise: float = 0.1,
+        force_jerk: float = 10,
+        position_noise: float = 0.001,
+        velocity_noise: float = 0.01,
+        accel_noise: float = 10,
+        compliance: float = 0,
+    ):
+        """Create an estimator that knows nothing yet
+
+        Args:
+            start_gap (float): gap at actuator position zero, in mm
+            force_noise (float, optional): standard deviation of load cell samples, in
+            force units. Defaults to 0.1.
+            force_jerk (float, optional): how quickly dF/dt can wander, in force units/s^2
+            per root second. Defaults to 10.
+            position_noise (float, optional): standard deviation of position polls in mm,
+            about a microstep. Defaults to 0.001.
+            velocity_noise (float, optional): standard deviation of velocity polls in mm/s.
+            Defaults to 0.01.
+            accel_noise (float, optional): how quickly velocity can wander, in mm/s^2 per
+            root second. Defaults to 10.
+            compliance (float, optional): how far the frame stretches per unit of upward
+            force, in mm. Defaults to 0.
+        """
+        self.start_gap = start_gap
+        """Gap at actuator position zero, in mm"""
+        self.force_variance = force_noise**2
+        """Variance of load cell samples"""
+        self.jerk_density = force_jerk**2
+        """Spectral density of the random jerk driving dF/dt"""
+        self.position_variance = position_noise**2
+        """Variance of position polls"""
+        self.velocity_variance = velocity_noise**2
+        """Variance of velocity polls"""
+        self.accel_density = accel_noise**2
+        """Spectral density of the random acceleration driving velocity"""
+        self.compliance = compliance
+        """How far the frame stretches per unit of upward force, in mm"""
+        self.state = np.zeros(4)
+        """[force, dF/dt, position in mm, velocity in mm/s]"""
+        self.covariance = np.diag([1e6, 1e6, 1e6, 1e6])
+        """Uncertainty in the state"""
+        self.state_time: float = None
+        """Time the state is for, in unix seconds"""
+        self.lock = threading.Lock()
+        """Guards the state, since the load cell and actuator are polled from different
+        threads"""
+
+    def transition(self, dt: float) -> tuple[np.ndarray, np.ndarray]:
+        """Gets how the state evolves over a time step
+
+        Args:
+            dt (float): time step in seconds
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: state transition matrix and process noise
+        """
+        step = np.array([[1, dt], [0, 1]])
+        noise = np.array([[dt**3 / 3, dt**2 / 2], [dt**2 / 2, dt]])
+        transition = np.zeros((4, 4))
+        transition[:2, :2] = step
+        transition[2:, 2:] = step
+        process_noise = np.zeros((4, 4))
+        process_noise[:2, :2] = self.jerk_density * noise
+        process_noise[2:, 2:] = self.accel_density * noise
+        return transition, process_noise
+
+    def predict(self, at_time: float) -> tuple[np.ndarray, np.ndarray]:
+        """Extrapolates the state forward. Caller must hold the lock.
+
+        Args:
+            at_time (float): time to extrapolate to, in unix seconds
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: state and covariance at that time
+        """
+        if self.state_time is None or at_time <= self.state_time:
+            return self.state, self.covariance
+        transition, process_noise = self.transition(at_time - self.state_time)
+        return (
+            transition @ self.state,
+            transition @ self.covariance @ transition.T + process_noise,
+        )
+
+    def update(self, at_time: float, row: np.ndarray, value: float, variance: float):
+        """Folds in one measurement, which is row @ state when it was taken
+
+        Args:
+            at_time (float): when the measurement was taken, in unix seconds
+            row (np.ndarray): which combination of the state was measured
+            value (float): the measurement
+            variance (float): the measurement's variance
+        """
+        with self.lock:
+            if self.state_time is None or at_time > self.state_time:
+                self.state, self.covariance = self.predict(at_time)
+                self.state_time = at_time
+            else:
+                # Taken before the state's time, so compare against the state
+                # extrapolated back to then
+                transition, _ = self.transition(at_time - self.state_time)
+                row = row @ transition
+            innovation = value - row @ self.state
+            gain = self.covariance @ row / (row @ self.covariance @ row + variance)
+            self.state = self.state + gain * innovation
+            self.covariance = self.covariance - np.outer(gain, row @ self.covariance)
+
+    def add_force(self, sample_time: float, force: float):
+        """Folds in a load cell sample
+
+        Args:
+            sample_time (float): when the reading was taken, in unix seconds
+            force (float): upward force
+        """
+        self.update(sample_time, np.array([1.0, 0, 0, 0]), force, self.force_variance)
+
+    def add_actuator(self, poll_time: float, position: float, velocity: float = None):
+        """Folds in an actuator poll
+
+        Args:
+            poll_time (float): when the actuator was polled, in unix seconds
+            position (float): actuator position in mm
+            velocity (float, optional): actuator velocity in mm/s. Defaults to None,
+            not polled.
+        """
+        self.update(
+            poll_time, np.array([0, 0, 1.0, 0]), position, self.position_variance
+        )
+        if velocity is not None:
+            self.update(
+                poll_time, np.array([0, 0, 0, 1.0]), velocity, self.velocity_variance
+            )
+
+    def estimate(self, at_time: float) -> tuple[float, float, float]:
+        """Gets the estimated force, its rate of change, and the gap at a given time
+
+        Args:
+            at_time (float): time of interest in unix seconds, usually now
+
+        Returns:
+            tuple[float, float, float]: upward force, dF/dt in force units per second,
+            and gap in m
+        """
+        with self.lock:
+            state, _ = self.predict(at_time)
+        force, force_rate, position, _ = state
+        gap = (position + self.start_gap + self.compliance * force) / 1000
+        return float(force), float(force_rate), float(gap)
 
 
 class SqueezeFlowRheometer(OpenScale, TicActuator):
@@ -27,6 +197,9 @@ class SqueezeFlowRheometer(OpenScale, TicActuator):
     used to compute velocity based on force"""
     MAX_TEST_DURATION = 7200
     """Max test duration in seconds. Once the test is this long, it will end."""
+    MAX_STALL_DURATION = 10
+    """Max time in seconds to hold the actuator waiting for load cell readings to resume.
+    After this long, the test ends."""
     DEFAULT_STEP_DURATION = 300
     """Default length of a test step in seconds"""
 
@@ -66,11 +239,13 @@ class SqueezeFlowRheometer(OpenScale, TicActuator):
         """How long the test has been going on"""
         self.force: float = 0
         """The current force in g"""
+        self.force_time: float = 0
+        """When the current force was measured, in unix time, measured in seconds"""
         self.target: float = 0
         """The current target value. For constant-force tests, this is a force in grams.
         For set-gap tests, this is the target gap in mm"""
         self.gap: float = 0
-        """The current gap in m"""
+        """The current gap in m, dead-reckoned to when the current force was measured"""
         self.eta_guess: float = 0
         """A guess at the fluid's Newtonian viscosity"""
         self.yield_stress_guess: float = 0
@@ -111,6 +286,20 @@ class SqueezeFlowRheometer(OpenScale, TicActuator):
         """Derivative error for PID loop."""
         self.K_D: float = 0
         """Derivative coefficient for PID loop"""
+        self.load_cells: OpenScaleArray
+        """This load cell plus any extra ones listed under extra_load_cells in the test
+        settings, read together onto a common time base"""
+        self.channel_forces: dict[str, float] = {}
+        """Latest force on each load cell channel, interpolated to the same time"""
+        self.estimator: ForceGapEstimator = None
+        """Fuses load cell and actuator readings, see estimate(). Started by
+        start_estimator() once the start gap is known"""
+        self.control_loop_triggers: bool = False
+        """Whether the control loop has taken over triggering load cell readings through
+        trigger_force_update(). Until then, the load cell thread triggers them."""
+
+        self.skipped_rows = 0
+        """Number of data rows left out because the actuator couldn't be read"""
 
         ## Plotting values
         self.times: list[float] = []
@@ -125,6 +314,18 @@ class SqueezeFlowRheometer(OpenScale, TicActuator):
         ## Initialize load cell reading
         OpenScale.__init__(self)
         self.load_settings()
+        self.load_cells = OpenScaleArray(
+            {
+                "main": self,
+                **{
+                    name: OpenScale(board_name=name)
+                    for name in self.test_settings.get("extra_load_cells", [])
+                },
+            }
+        )
+        for name in self.extra_load_cells():
+            # Their drift models mustn't take real force mid-test for drift either
+            self.load_cells.scales[name].unloaded_check = self.is_unloaded
 
         ## Initialize actuator controller
         TicActuator.__init__(self, step_mode=self.test_settings["actuator_step_mode"])
@@ -347,12 +548,27 @@ class SqueezeFlowRheometer(OpenScale, TicActuator):
                 self.a - self.b
             ) / 2 * math.tanh(self.c * ((er / tar) ** 2 - self.d))
 
+    def extra_load_cells(self) -> list[str]:
+        """Gets the names of load cells other than this one
+
+        Returns:
+            list[str]: channel names, empty if there's only the one load cell
+        """
+        return [
+            name for name in self.load_cells.scales if name != self.load_cells.reference
+        ]
+
     def create_data_file(self, file_heading: str):
         """Create a .csv data file for an SFR test
 
         Args:
             file_heading (str): first row of .csv file, a comma separated string of headers
         """
+        for name in self.extra_load_cells():
+            file_heading = (
+                file_heading.rstrip("\n")
+                + f",{name.capitalize()} Force ({self.load_cells.scales[name].units})\n"
+            )
         file_path = os.path.join(self.data_folder, self.data_file_name)
         with open(file_path, "a") as datafile:
             datafile.write(file_heading)
@@ -396,6 +612,12 @@ class SqueezeFlowRheometer(OpenScale, TicActuator):
             self.save_figure(fig)
         except:
             print("Failed to save figure.")
+        if self.variable_errors:
+            print(f"Actuator read errors: {self.variable_errors}")
+        if self.skipped_rows:
+            print(f"Data rows skipped for missed actuator reads: {self.skipped_rows}")
+        print(f"Actuator USB traffic: {self.io_metrics()}")
+        print(f"Actuator position prediction: {self.prediction_metrics()}")
         self.go_home_quiet_down()
 
     def get_day_date_str(self) -> str:
@@ -473,16 +695,66 @@ class SqueezeFlowRheometer(OpenScale, TicActuator):
         """Computes the current gap in meters
 
         Args:
-            pos (float, optional): Current position in mm. If not provided, will get from actuator
+            pos (float, optional): Current position in mm. If not provided, will predict
+            it from the latest actuator poll
 
         Returns:
             float: gap between plates, measured in m
         """
         if pos is None:
-            pos = self.steps_to_mm(self.get_pos())
+            pos = self.predict_pos_mm()
         gap = (pos + self.start_gap) / 1000
         return gap
 
+    def start_estimator(self):
+        """Starts estimating force and gap from load cell samples and actuator polls.
+        Call once the start gap is known, or the load cell thread starts it. Noise levels and frame compliance can be set in
+        the test settings file, see ForceGapEstimator."""
+        settings = self.test_settings
+        self.estimator = ForceGapEstimator(
+            self.start_gap,
+            settings.get("estimator_force_noise", 0.1),
+            settings.get("estimator_force_jerk", 10),
+            self.steps_to_mm(1) / math.sqrt(12),
+            settings.get("estimator_velocity_noise", 0.01),
+            settings.get("estimator_accel_noise", 10),
+            settings.get("frame_compliance", 0),
+        )
+
+    def poll_actuator(self) -> float:
+        """Gets the actuator's position and velocity, and folds them into the estimate.
+        If the actuator can't be read, the estimate carries on from its model instead.
+
+        Returns:
+            float: actuator position in mm, predicted if the poll was missed
+        """
+        try:
+            state = self.snapshot()
+        except TicReadTimeout as e:
+            print(f"Missed actuator poll, predicting through it: {e}")
+            return self.predict_pos_mm()
+        pos_mm = self.steps_to_mm(state.current_position)
+        if self.estimator is not None:
+            self.estimator.add_actuator(
+                state.host_time, pos_mm, self.vel_to_mms(state.current_velocity)
+            )
+        return pos_mm
+
+    def estimate(self, at_time: float = None) -> tuple[float, float, float]:
+        """Gets the best current estimate of force, its rate of change, and the gap, from
+        every load cell sample and actuator poll so far. Falls back to the latest force
+        and gap if the estimator hasn't been started.
+
+        Args:
+            at_time (float, optional): time of interest in unix seconds. Defaults to now.
+
+        Returns:
+            tuple[float, float, float]: force, dF/dt in force units per second, and gap in m
+        """
+        if self.estimator is None:
+            return self.force, -self.der_error, self.gap
+        return self.estimator.estimate(time() if at_time is None else at_time)
+
     def data_writing_thread_method(self, include_PID_values: bool = False):
         """Records data to csv
 
@@ -493,75 +765,13 @@ class SqueezeFlowRheometer(OpenScale, TicActuator):
 
         self.start_time = time()
         while True:
-            cur_pos = self.get_pos()
-            cur_pos_mm = self.steps_to_mm(cur_pos)
-            tar_pos = self.get_variable_by_name("target_position")
-            cur_vel = self.get_vel()
-            cur_vel_mms = self.vel_to_mms(cur_vel)
-            tar_vel = self.get_variable_by_name("target_velocity")
-            max_speed = self.get_variable_by_name("max_speed")
-            max_decel = self.get_variable_by_name("max_decel")
-            max_accel = self.get_variable_by_name("max_accel")
-            step_mode = self.get_variable_by_name("step_mode")
-            vin_voltage = self.get_variable_by_name("vin_voltage")
-            self.gap = self.get_gap(cur_pos_mm)  # set gap whether or not test is active
-
-            # self.visc_volume=min(self.sample_volume,SqueezeFlowRheometer.HAMMER_AREA*self.gap)
-            self.visc_volume = (
-                self.sample_volume  # Carbopol keeps being predicted to over spread too soon
-            )
-
-            self.yield_stress_guess = self.get_perfect_slip_yield_stress()
-
-            cur_time = time()
-            cur_duration = cur_time - self.start_time
-
-            output_params = [
-                cur_time,
-                cur_duration,
-                cur_pos_mm,
-                cur_pos,
-                tar_pos,
-                cur_vel_mms,
-                cur_vel,
-                tar_vel,
-                max_speed,
-                max_decel,
-                max_accel,
-                step_mode,
-                vin_voltage,
-                self.force,
-                self.target,
-                self.start_gap / 1000.0,
-                self.gap,
-                self.eta_guess,
-                self.yield_stress_guess,
-                self.sample_volume,
-                self.visc_volume,
-                self.test_active,
-                self.spread_beyond_hammer,
-            ]
-
-            # Only output these if the test requests it, otherwise they're
-            # probably not in use and therefore meaningless
-            if include_PID_values:
-                output_params.extend(
-                    [
-                        self.error,
-                        self.variable_K_P(self.error, self.target),
-                        self.int_error,
-                        self.K_I,
-                        self.der_error,
-                        self.K_D,
-                    ]
-                )
-
-            self.write_data_to_file(output_params)
-
-            self.times.append(cur_duration)
-            self.forces.append(self.force)
-            self.gaps.append(self.gap)
-            self.yield_stress_guesses.append(self.yield_stress_guess)
+            try:
+                state = self.snapshot()
+            except TicReadTimeout:
+                # Leave the row out, but still check for the end of the test below
+                self.skipped_rows += 1
+            else:
+                self.write_data_row(state, include_PID_values)
 
             sleep(0.02)
 
@@ -574,49 +784,290 @@ class SqueezeFlowRheometer(OpenScale, TicActuator):
                 break
         print("=" * 20 + " BACKGROUND IS DONE " + "=" * 20)
 
-    def load_cell_thread_method(self, compute_errors: bool = False):
-        """Continuously reads load cell and reports the upward force on the load cell
+    def write_data_row(self, state: TicSnapshot, include_PID_values: bool = False):
+        """Records one row of data to csv, and to the lists used to liveplot it
 
         Args:
-            compute_errors (bool, optional): Whether to compute force error and integrated
-            error / derivative error, which are used for PID force control. Defaults to False.
+            state (TicSnapshot): the actuator's state for this row
+            include_PID_values (bool, optional): Whether or not to include PID values like error
+            and K_P in the data output. Defaults to False.
         """
+        cur_pos = state.current_position
+        cur_pos_mm = self.steps_to_mm(cur_pos)
+        cur_vel = state.current_velocity
+        cur_vel_mms = self.vel_to_mms(cur_vel)
+        if self.estimator is not None:
+            self.estimator.add_actuator(state.host_time, cur_pos_mm, cur_vel_mms)
+        tar_pos = state.target_position
+        tar_vel = state.target_velocity
+        max_speed = state.max_speed
+        max_decel = state.max_decel
+        max_accel = state.max_accel
+        step_mode = state.step_mode
+        vin_voltage = state.vin_voltage
+        # set gap whether or not test is active, at the same time as the force
+        self.gap = self.get_gap(
+            self.predict_pos_mm(self.force_time) if self.force_time > 0 else cur_pos_mm
+        )
 
-        for _ in range(10):  # get rid of first few lines that aren't readings
-            self.get_line()
-        self.flush_old_lines()  # and get rid of any others that
-        # were generated when we were busy setting up
+        # self.visc_volume=min(self.sample_volume,SqueezeFlowRheometer.HAMMER_AREA*self.gap)
+        self.visc_volume = (
+            self.sample_volume  # Carbopol keeps being predicted to over spread too soon
+        )
 
-        old_error = self.error
+        self.yield_stress_guess = self.get_perfect_slip_yield_stress()
 
         cur_time = time()
-        prev_time = cur_time
-
-        while True:
-            self.force = (
-                self.wait_for_calibrated_measurement()
-                * SqueezeFlowRheometer.FORCE_UP_SIGN
+        cur_duration = cur_time - self.start_time
+
+        output_params = [
+            cur_time,
+            cur_duration,
+            cur_pos_mm,
+            cur_pos,
+            tar_pos,
+            cur_vel_mms,
+            cur_vel,
+            tar_vel,
+            max_speed,
+            max_decel,
+            max_accel,
+            step_mode,
+            vin_voltage,
+            self.force,
+            self.target,
+            self.start_gap / 1000.0,
+            self.gap,
+            self.eta_guess,
+            self.yield_stress_guess,
+            self.sample_volume,
+            self.visc_volume,
+            self.test_active,
+            self.spread_beyond_hammer,
+        ]
+
+        # Only output these if the test requests it, otherwise they're
+        # probably not in use and therefore meaningless
+        if include_PID_values:
+            output_params.extend(
+                [
+                    self.error,
+                    self.variable_K_P(self.error, self.target),
+                    self.int_error,
+                    self.K_I,
+                    self.der_error,
+                    self.K_D,
+                ]
             )
 
-            if compute_errors:
-                prev_time = cur_time
-                cur_time = time()
-                dt_force = cur_time - prev_time
-
-                old_error = self.error
-                self.error = self.target - self.force
-                self.int_error = self.int_error * math.exp(self.decay_rate_r * dt_force)
-                self.int_error += (
-                    ((old_error + self.error) / 2 * dt_force) if dt_force > 0 else 0
-                )  # trapezoidal integration
+        output_params.extend(
+            self.channel_forces.get(name, math.nan) for name in self.extra_load_cells()
+        )
+
+        self.write_data_to_file(output_params)
+
+        self.times.append(cur_duration)
+        self.forces.append(self.force)
+        self.gaps.append(self.gap)
+        self.yield_stress_guesses.append(self.yield_stress_guess)
+
+    def update_force(self, sample, compute_errors: bool = False):
+        """Takes in a new load cell sample, updating the force and optionally the PID errors
+
+        Args:
+            sample (np.void): sample from the load cell's sample buffer
+            compute_errors (bool, optional): Whether to compute force error and integrated
+            error / derivative error, which are used for PID force control. Defaults to False.
+        """
+        self.force = sample["force"] * SqueezeFlowRheometer.FORCE_UP_SIGN
+        if self.estimator is not None:
+            self.estimator.add_force(sample["time"], self.force)
+        # Use when the board took the reading, not when it arrived, if the
+        # board reports timestamps, so USB and OS delays don't add jitter
+        prev_time = self.force_time
+        self.force_time = sample["time"]
+        # Gap at the same moment, predicted instead of polled so it costs no USB traffic
+        self.gap = self.get_gap(self.predict_pos_mm(self.force_time))
+
+        if compute_errors:
+            dt_force = self.force_time - prev_time
+
+            old_error = self.error
+            self.error = self.target - self.force
+            self.int_error = self.int_error * math.exp(self.decay_rate_r * dt_force)
+            self.int_error += (
+                ((old_error + self.error) / 2 * dt_force) if dt_force > 0 else 0
+            )  # trapezoidal integration
+            if not math.isnan(sample["force_rate"]):
+                # Derivative of the filtered force instead, which is late by a known
+                # force_filter.rate_delay() but not swamped by noise. Target changes
+                # are left out, so stepping the target doesn't kick the derivative term.
+                self.der_error = (
+                    -sample["force_rate"] * SqueezeFlowRheometer.FORCE_UP_SIGN
+                )
+            else:
                 self.der_error = (
                     ((self.error - old_error) / dt_force) if dt_force > 0 else 0
                 )  # first order backwards difference
 
+    def trigger_force_update(self, compute_errors: bool = True) -> float:
+        """In serial trigger mode, takes one load cell reading at the start of a control
+        cycle and updates the force and PID errors from it, so force and actuator state
+        are sampled in a known order. Does nothing if the load cell isn't in trigger mode,
+        since the load cell thread keeps the force updated instead.
+
+        Args:
+            compute_errors (bool, optional): Whether to compute force error and integrated
+            error / derivative error, which are used for PID force control. Defaults to True.
+
+        Returns:
+            float: the current force
+        """
+        if self.triggered:
+            self.control_loop_triggers = True
+            sample = self.trigger_sample()
+            if sample is not None:
+                self.update_force(sample, compute_errors)
+        return self.force
+
+    def is_unloaded(self) -> bool:
+        """Whether readings near zero can be used to track load cell drift. Only while no
+        test is running, so a small real force mid-test isn't mistaken for drift. Scripts
+        that turn on drift_compensation need to keep test_active set whenever the sample
+        may be loaded, including on approach.
+
+        Returns:
+            bool: True if no test is active
+        """
+        return not self.test_active
+
+    def wait_out_stall(self) -> bool:
+        """Call once per control cycle. If load cell readings have stopped arriving, stops
+        the actuator where it is and holds it there until readings resume, then restores
+        what the actuator was doing. Returns right away if readings are fresh.
+
+        Returns:
+            bool: False if readings didn't resume within MAX_STALL_DURATION, meaning the
+            test should end
+        """
+        if not self.is_stale():
+            return True
+
+        planning_mode = self.get_variable_by_name("planning_mode")
+        target_name = "target_velocity" if planning_mode == 2 else "target_position"
+        target = self.get_variable_by_name(target_name)
+        self.halt_and_hold()
+        print(f"Load cell readings stopped, holding actuator: {self.stall_metrics()}")
+
+        stall_time = time()
+        while self.is_stale():
+            if time() - stall_time > SqueezeFlowRheometer.MAX_STALL_DURATION:
+                print("Load cell readings never resumed")
+                return False
+            self.heartbeat()
+            if self.control_loop_triggers:
+                self.trigger_force_update()
+            sleep(0.05)
+
+        print("Load cell readings resumed, continuing")
+        if planning_mode == 2:
+            self.set_target_velocity(target)
+        elif planning_mode == 1:
+            self.set_target_position(target)
+        return True
+
+    def rest_for(self, duration: float) -> bool:
+        """Keeps the actuator where it is for a while, sending heartbeats and waiting out
+        load cell stalls with wait_out_stall()
+
+        Args:
+            duration (float): how long to rest in seconds
+
+        Returns:
+            bool: False if load cell readings stopped and didn't resume, meaning the test
+            should end
+        """
+        rest_start_time = time()
+        while time() - rest_start_time <= duration:
+            sleep(0.1)
+            self.heartbeat()
+            if not self.wait_out_stall():
+                return False
+        return True
+
+    def move_to_mm_through_stalls(self, pos_mm: float) -> bool:
+        """Moves actuator to desired position in mm like move_to_mm(), but holds it
+        wherever it is while load cell readings are stalled, see wait_out_stall()
+
+        Args:
+            pos_mm (float): desired position in mm
+
+        Returns:
+            bool: False if load cell readings stopped and didn't resume, meaning the test
+            should end
+        """
+        pos = math.floor(self.mm_to_steps(pos_mm))
+        handle = self.start_move(pos)
+        while not handle.wait(0.05):
+            if self.is_stale():
+                if not self.wait_out_stall():
+                    return False
+                handle = self.start_move(pos)  # the hold took over the old move
+            elif handle.done():
+                return True  # something else took over the actuator
+        return True
+
+    def load_cell_thread_method(self, compute_errors: bool = False):
+        """Continuously reads load cell and reports the upward force on the load cell.
+        In serial trigger mode, this thread sends the triggers itself until the control
+        loop takes over by calling trigger_force_update().
+
+        Args:
+            compute_errors (bool, optional): Whether to compute force error and integrated
+            error / derivative error, which are used for PID force control. Defaults to False.
+        """
+
+        self.force_time = time()
+        if self.estimator is None:
+            self.start_estimator()  # the start gap is known by the time threads start
+        self.load_cells.start_acquisition()
+        seq = self.sample_buffer.seq
+        merged_seq = seq
+        if self.force_filter is not None:
+            print(
+                f"Force filtered, derivative lags by "
+                f"{self.force_filter.rate_delay() * 1000:.1f}ms"
+            )
+
+        while True:
+            if self.triggered and self.control_loop_triggers:
+                sleep(0.1)
+            elif self.triggered:
+                sample = self.trigger_sample()
+                if sample is not None:
+                    self.update_force(sample, compute_errors)
+            else:
+                samples, seq = self.sample_buffer.wait_since(seq, timeout=0.1)
+                for sample in samples:
+                    self.update_force(sample, compute_errors)
+            if self.extra_load_cells():
+                merged, merged_seq = self.load_cells.since(merged_seq)
+                if len(merged) > 0:
+                    self.channel_forces = {
+                        name: float(merged[-1][name]) for name in self.load_cells.scales
+                    }
+
             if (time() - self.start_time) >= SqueezeFlowRheometer.MAX_TEST_DURATION or (
                 (not self.actuator_thread.is_alive())
                 and (not self.data_writing_thread.is_alive())
                 and (time() - self.start_time) > 1
             ):
                 print("Stopping load cell reading")
+                self.load_cells.stop_acquisition()
+                print(f"Load cell link: {self.stall_metrics()}")
+                if self.triggered:
+                    print(
+                        f"Trigger round trip (ms), {self.trigger_timeouts} timed out:\n"
+                        + self.trigger_latency.summary()
+                    )
                 break
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Run the actuator on the simulated Tic, sped up, since there's no hardware here. Must be
+# set before ticactuator is imported.
+os.environ.setdefault("TIC_SIMULATOR", "20")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
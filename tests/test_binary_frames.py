@@ -0,0 +1,39 @@
+import os
+import warnings
+
+import numpy as np
+import pytest
+
+from LoadCell.openscale import BinaryFrameDecoder
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "binary_frames.bin")
+"""Frames with sequence numbers 0 to 19 and raw readings 1000 * seq - 5000, recorded
+from the simulator's binary output. The stream starts with 3 stray bytes, frame 5 has a
+bad CRC, and frames 10 and 11 were dropped."""
+
+EXPECTED_SEQ = [*range(5), *range(6, 10), *range(12, 20)]
+
+
+def load_fixture() -> bytes:
+    with open(FIXTURE, "rb") as read_file:
+        return read_file.read()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 12, 64, 1024])
+def test_decodes_fixture_in_chunks(chunk_size):
+    stream = load_fixture()
+    decoder = BinaryFrameDecoder()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        chunks = [
+            decoder.decode(stream[i : i + chunk_size])
+            for i in range(0, len(stream), chunk_size)
+        ]
+    frames = np.concatenate(chunks)
+
+    assert frames["seq"].tolist() == EXPECTED_SEQ
+    assert frames["raw"].tolist() == [1000 * seq - 5000 for seq in EXPECTED_SEQ]
+    assert np.all(np.diff(frames["micros"]) > 0)
+    assert decoder.frame_count == len(EXPECTED_SEQ)
+    assert decoder.dropped_frames == 3
+    assert decoder.skipped_bytes == 3 + 12
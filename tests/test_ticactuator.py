@@ -0,0 +1,125 @@
+from time import sleep, time
+
+import pytest
+
+from Actuator import ticactuator
+from Actuator.ticactuator import MoveHandle, TicActuator, TicMoveError, TicReadTimeout
+
+
+@pytest.fixture
+def actuator():
+    tic = TicActuator(step_mode=2)
+    tic.set_max_accel_mmss(5, True)
+    tic.set_max_speed_mms(1)
+    tic.startup()
+    yield tic
+    tic.halt_and_hold()
+    tic.stop_io()
+
+
+def simulated_position(tic: TicActuator) -> tuple[float, float]:
+    simulator = tic.tic_simulator
+    with simulator.lock:
+        now = time()
+        simulator.advance()
+        return now, simulator.position
+
+
+def test_prediction_tracks_move_with_heartbeats(actuator):
+    handle = actuator.start_move(3000)
+    worst = 0
+    while not handle.done():
+        actuator.heartbeat()
+        sleep(0.005)
+        now, position = simulated_position(actuator)
+        worst = max(worst, abs(actuator.predict_pos(now) - position))
+    assert handle.wait(5)
+    assert worst < 5
+    assert abs(actuator.prediction_metrics()["worst_error_mm"]) < 0.02
+
+
+def test_stale_snapshot_doesnt_undo_command(actuator):
+    stale = actuator.snapshot(0)
+    actuator.set_target_position(3000)
+    actuator.motion_model.sync(stale)
+    assert actuator.motion_model.target_position == 3000
+    assert actuator.snapshot(0).target_position == 3000
+
+
+def test_move_arrives(actuator):
+    handle = actuator.start_move(400)
+    assert handle.wait(5)
+    assert handle.outcome == MoveHandle.ARRIVED
+    assert actuator.get_pos() == 400
+    assert abs(handle.prediction_error()) < 0.1
+
+
+def test_move_taken_over_is_superseded(actuator):
+    handle = actuator.start_move(3000)
+    sleep(0.05)
+    actuator.set_target_position(-100)
+    assert not handle.wait(5)
+    assert handle.outcome == MoveHandle.SUPERSEDED
+    assert handle.prediction_error() is None
+
+
+def test_move_fails_on_tic_error(actuator):
+    actuator.deenergize()
+    with pytest.raises(TicMoveError):
+        actuator.move_to_pos(500)
+
+
+def test_move_fails_when_tic_cant_be_read(actuator):
+    handle = actuator.start_move(3000)
+    actuator.retry_attempts = 2
+    actuator.read_variable_block = lambda: None
+    with pytest.raises(TicReadTimeout):
+        handle.wait(5)
+    assert handle.outcome == MoveHandle.FAILED
+
+
+class FaultyVariables:
+    """Simulated Tic variables whose next few reads fail, either by raising or by coming
+    back empty the way pytic's do"""
+
+    def __init__(self, variables, failures: int, error: Exception = None):
+        self.variables = variables
+        self.failures = failures
+        self.error = error
+
+    def __getattr__(self, name):
+        if self.failures > 0:
+            self.failures -= 1
+            if self.error is not None:
+                raise self.error
+            return None
+        return getattr(self.variables, name)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Records the retry backoff instead of waiting it out"""
+    waits = []
+    monkeypatch.setattr(ticactuator, "sleep", waits.append)
+    return waits
+
+
+@pytest.mark.parametrize("error", [None, OSError("USB read failed")])
+def test_retry_recovers_with_backoff(actuator, sleeps, error):
+    position = actuator.get_pos()
+    actuator.variables = FaultyVariables(actuator.variables, 3, error)
+    assert actuator.get_pos() == position
+    assert sleeps == [0.001, 0.002, 0.004]
+    assert actuator.variable_errors == {"current_position": 3}
+
+
+def test_retry_gives_up_after_attempts(actuator, sleeps):
+    actuator.retry_attempts = 6
+    actuator.retry_backoff_max = 0.004
+    actuator.variables = FaultyVariables(actuator.variables, 100, OSError("unplugged"))
+    with pytest.raises(TicReadTimeout) as raised:
+        actuator.get_vel()
+    assert isinstance(raised.value.__cause__, OSError)
+    assert sleeps == [0.001, 0.002, 0.004, 0.004, 0.004]
+    assert actuator.variable_errors == {"current_velocity": 6}
+    assert actuator.variables.failures == 100 - 6